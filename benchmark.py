@@ -0,0 +1,235 @@
+"""
+Headless rendering benchmark: builds a game state and times draw_game.
+
+    $ python benchmark.py --frames 600 --zombies 200 --items 100 --lights 8
+    $ python benchmark.py --map-size 400x400 --modals inventory,status,mobile --zoom 2.5 --output bench.json
+    $ python benchmark.py --fast-forward 36000 --map-size 300x300 --zombies 2000 --spread 100
+
+Runs with SDL_VIDEODRIVER=dummy, so it needs no display. Prints p50/p95/p99
+frame times and the per-phase breakdown from FrameProfiler as JSON.
+With --fast-forward it times simulation steps instead (Game.fast_forward, no
+drawing): a soak test that runs the game as fast as it can.
+"""
+import os
+import sys
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import contextlib
+import json
+import time
+import random
+import uuid
+
+# The game logs to stdout (also while importing); those logs go to stderr so stdout is only the JSON report
+with contextlib.redirect_stdout(sys.stderr):
+    import pygame
+    from data.config import *
+    from data.player_xml_parser import parse_player_data
+    from core.game import Game
+    from core.draw import draw_game
+    from core.profiler import FrameProfiler
+    from core.entities.item.item import Item
+    from core.entities.zombie.zombie import Zombie
+    from core.events.keyboard import toggle_inventory_modal, toggle_status_modal, toggle_nearby_modal, toggle_messages_modal
+    from core.map.map_loader import parse_layered_map_layout
+    from core.render.chunk_renderer import ChunkRenderer
+    from core.map.visibility import VisibilityField
+    from core.map.collision_grid import CollisionGrid
+    from core.sim_clock import SIM_STEP_MS
+
+MODAL_TYPES = ('inventory', 'status', 'nearby', 'messages', 'mobile')
+
+def build_map(game, width, height):
+    """Replaces the loaded map by a width x height one, tiled from the loaded layers."""
+    base = game.map_data
+    ground = game.all_ground_layers.get(game.current_layer_index) or base
+    source_h, source_w = len(base), len(base[0])
+    def tile(layer):
+        return [[layer[y % source_h][x % source_w] if x % source_w < len(layer[y % source_h]) else ' '
+                 for x in range(width)] for y in range(height)]
+    mega_base = tile(base)
+    mega_ground = tile(ground)
+    mega_spawn = [[' ' for _ in range(width)] for _ in range(height)]
+
+    (game.obstacles,
+     game.tile_grid,
+     _,
+     game.zombie_spawns,
+     game.item_spawns,
+     game.containers) = parse_layered_map_layout(mega_base, mega_ground, mega_spawn, game.tile_manager)
+    game.chunk_renderer = ChunkRenderer(game.tile_grid)
+    game.visibility = VisibilityField(game.tile_grid)
+    game.collision_grid = CollisionGrid.from_game(game)
+    game.map_data = mega_base
+    game.ground_data = mega_ground
+    game.spawn_data = mega_spawn
+    game.all_map_layers[game.current_layer_index] = mega_base
+    game.map_width_pixels = width * TILE_SIZE
+    game.map_height_pixels = height * TILE_SIZE
+
+def open_modals(game, modal_types):
+    toggles = {
+        'inventory': toggle_inventory_modal,
+        'status': toggle_status_modal,
+        'nearby': toggle_nearby_modal,
+        'messages': toggle_messages_modal
+    }
+    game.modals = []
+    for modal_type in modal_types:
+        if modal_type == 'mobile':
+            position = game.last_modal_positions['mobile']
+            game.modals.append({
+                'id': uuid.uuid4(), 'type': 'mobile', 'item': None,
+                'position': position, 'is_dragging': False, 'drag_offset': (0, 0),
+                'rect': pygame.Rect(position[0], position[1], MOBILE_MODAL_WIDTH, MOBILE_MODAL_HEIGHT),
+                'minimized': False, 'active_tab': 'Map'
+            })
+        else:
+            toggles[modal_type](game)
+
+def build_game(args):
+    random.seed(args.seed)
+    game = Game()
+    player_data, _ = parse_player_data()
+    game.start_new_game(player_data)
+    game.game_state = 'PLAYING'
+
+    if args.map_size:
+        width, height = args.map_size
+        build_map(game, width, height)
+        game.player.rect.center = (width * TILE_SIZE // 2, height * TILE_SIZE // 2)
+        game.player.x, game.player.y = game.player.rect.topleft
+
+    px, py = game.player.rect.center
+    spread = args.spread * TILE_SIZE
+    game.zombies = [Zombie.create_random(px + random.randint(-spread, spread), py + random.randint(-spread, spread))
+                    for _ in range(args.zombies)]
+
+    game.items_on_ground = []
+    for i in range(args.items + args.lights):
+        item = Item.create_from_name('Lantern on') if i < args.lights else Item.generate_random()
+        if item is None:
+            continue
+        item.rect.center = (px + random.randint(-spread, spread), py + random.randint(-spread, spread))
+        game.items_on_ground.append(item)
+
+    open_modals(game, args.modals)
+    game.zoom_level = args.zoom
+    if game.visibility:
+        game.visibility.update(px, py)
+    return game
+
+def fast_forward(args):
+    """Times simulation steps, run back to back without drawing."""
+    game = build_game(args)
+    game.profiler = FrameProfiler(history=args.fast_forward)
+    game.profiler.enabled = True
+    start = time.perf_counter()
+    steps = 0
+    while steps < args.fast_forward:
+        game.profiler.begin_frame()
+        if not game.fast_forward(1):
+            break # Game over
+        game.profiler.end_frame()
+        steps += 1
+    elapsed = time.perf_counter() - start
+
+    simulated = steps * SIM_STEP_MS / 1000
+    return {
+        'config': {
+            'fast_forward': args.fast_forward,
+            'map_size': list(args.map_size) if args.map_size else [len(game.map_data[0]), len(game.map_data)],
+            'zombies': args.zombies,
+            'items': args.items,
+            'zombie_ai_backend': ZOMBIE_AI_BACKEND
+        },
+        'steps': steps,
+        'game_state': game.game_state,
+        'zombies_left': len(game.zombies),
+        'simulated_seconds': simulated,
+        'realtime_factor': simulated / elapsed if elapsed else 0.0,
+        'step': game.profiler.summary()
+    }
+
+def run(args):
+    game = build_game(args)
+    game.profiler = FrameProfiler(history=args.frames)
+    start_x = game.player.rect.x
+
+    for frame in range(args.warmup + args.frames):
+        game.profiler.enabled = frame >= args.warmup
+        if args.pan:
+            # Walk back and forth so the terrain scrolls and visibility updates
+            step = args.pan if (frame // 60) % 2 == 0 else -args.pan
+            game.player.rect.x += step
+            game.player.x = game.player.rect.x
+            if game.visibility:
+                game.visibility.update(game.player.rect.centerx, game.player.rect.centery)
+        pygame.event.pump()
+        game.profiler.begin_frame()
+        draw_game(game)
+        game.profiler.end_frame()
+    game.player.rect.x = start_x
+
+    return {
+        'config': {
+            'frames': args.frames,
+            'warmup': args.warmup,
+            'map_size': list(args.map_size) if args.map_size else [len(game.map_data[0]), len(game.map_data)],
+            'zombies': len(game.zombies),
+            'items': args.items,
+            'lights': args.lights,
+            'modals': list(args.modals),
+            'zoom': args.zoom,
+            'pan': args.pan,
+            'lighting_backend': LIGHTING_BACKEND,
+            'lighting_resolution': LIGHTING_RESOLUTION
+        },
+        'draw_game': game.profiler.summary()
+    }
+
+def parse_size(value):
+    try:
+        width, height = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT in tiles, got '{value}'")
+    return width, height
+
+def parse_modals(value):
+    modal_types = [name.strip() for name in value.split(',') if name.strip()]
+    for name in modal_types:
+        if name not in MODAL_TYPES:
+            raise argparse.ArgumentTypeError(f"unknown modal '{name}', expected some of {', '.join(MODAL_TYPES)}")
+    return modal_types
+
+def main():
+    parser = argparse.ArgumentParser(description="Times draw_game on a synthetic game state, without a display.")
+    parser.add_argument('--frames', type=int, default=300, help="measured frames")
+    parser.add_argument('--warmup', type=int, default=30, help="frames drawn before measuring (fills the caches)")
+    parser.add_argument('--map-size', type=parse_size, default=None, help="WIDTHxHEIGHT in tiles, tiled from the start map (default: the start map)")
+    parser.add_argument('--zombies', type=int, default=50)
+    parser.add_argument('--items', type=int, default=50, help="random items on the ground")
+    parser.add_argument('--lights', type=int, default=4, help="lit lanterns on the ground")
+    parser.add_argument('--spread', type=int, default=12, help="entities are placed within this many tiles of the player")
+    parser.add_argument('--modals', type=parse_modals, default=['inventory', 'nearby'], help="comma separated: " + ','.join(MODAL_TYPES))
+    parser.add_argument('--zoom', type=float, default=START_ZOOM)
+    parser.add_argument('--pan', type=int, default=2, help="pixels the player moves per frame (0 keeps the camera still)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--fast-forward', type=int, default=0, metavar='STEPS',
+                        help="time this many simulation steps without drawing instead (soak test)")
+    parser.add_argument('--output', default=None, help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(sys.stderr):
+        report = json.dumps(fast_forward(args) if args.fast_forward else run(args), indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report + '\n')
+    else:
+        sys.stdout.write(report + '\n')
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 import pygame
 import math
 from data.config import *
+from core.ui.text_cache import render_text
 from core.ui.helpers import draw_menu, draw_game_over
 from core.entities.item.item import Item
 from core.ui.inventory import draw_inventory_modal, get_inventory_slot_rect, get_belt_slot_rect_in_modal, get_backpack_slot_rect, get_invcontainer_slot_rect
@@ -13,27 +14,50 @@ from core.ui.tooltip import draw_tooltip
 from core.ui.messages_modal import draw_messages_modal, draw_messages_button
 from core.ui.text_modal import draw_text_modal
 from core.ui.mobile_modal import draw_mobile_modal
+from core.ui.modal_cache import player_state_key, modal_state_key, modal_area
+from core.render.sprite_cache import FADE_CACHE
+from core.render.camera import Camera
+from core.render.render_queue import OBJECT_LAYER, ENTITY_LAYER
+
+def _set_cursor(game, cursor_name):
+    """Switches the mouse cursor, only talking to SDL when it actually changes."""
+    if game.cursor_name == cursor_name:
+        return
+    game.cursor_name = cursor_name
+    try:
+        pygame.mouse.set_cursor(game.assets.get(cursor_name) or pygame.cursors.arrow)
+    except pygame.error as e:
+        print(f"Could not set cursor: {e}") # E.g. headless (SDL_VIDEODRIVER=dummy)
 
 def draw_game(game):
+    # Phase timings for the profiler overlay and benchmark.py (no-ops unless enabled)
+    profiler = game.profiler
+
     # Clear the main screen that holds the game and UI panels
     game.virtual_screen.fill(PANEL_COLOR)
 
     # --- World Rendering with Pixelated Zoom ---
-    # 1. Create a temporary surface for the world view.
-    zoom = game.zoom_level
-    view_w = int(GAME_WIDTH / zoom)
-    view_h = int(GAME_HEIGHT / zoom)
-
-    #view_w = int(VIRTUAL_SCREEN_WIDTH / zoom)
-    #view_h = int(VIRTUAL_GAME_HEIGHT / zoom)
-    world_view_surface = pygame.Surface((view_w, view_h))
-    world_view_surface.fill(GAME_BG_COLOR) # Set the world background color
-
-    # 2. Calculate a single camera offset to center the player.
-    offset_x = view_w / 2 - game.player.rect.centerx
-    offset_y = view_h / 2 - game.player.rect.centery
-
-    light_mask = pygame.Surface((view_w, view_h))
+    # 1. The world is drawn straight onto the game area at output resolution.
+    # Tiles and sprites come pre-scaled for the current zoom level (see Camera),
+    # so there is no full-frame rescale.
+    world_view_surface = game.world_view_surface # Subsurface of virtual_screen
+    if not game.chunk_renderer:
+        world_view_surface.fill(GAME_BG_COLOR) # Otherwise the terrain covers the whole view
+    view_w, view_h = GAME_WIDTH, GAME_HEIGHT
+
+    # 2. A single camera centered on the player.
+    camera = Camera(game.player.rect.centerx, game.player.rect.centery, game.zoom_level, view_w, view_h)
+    zoom = camera.zoom
+
+    # The light mask is built at the zoomed-out size (one mask pixel per
+    # zoom * LIGHTING_RESOLUTION output pixels) and upscaled once before
+    # compositing; light falloff is soft anyway. Light radii are in output
+    # pixels (lights keep their size on screen at any zoom).
+    light_div = LIGHTING_RESOLUTION
+    light_zoom = zoom * light_div
+    mask_w = max(1, math.ceil(view_w / light_zoom))
+    mask_h = max(1, math.ceil(view_h / light_zoom))
+    light_mask = game.frame_buffers.get('light_mask', (mask_w, mask_h))
     
     # Fill the mask with pitch black.
     light_mask.fill((10, 10, 10)) # <-- This was the fix from last time
@@ -44,27 +68,12 @@ def draw_game(game):
     is_aiming = (keys[pygame.K_LCTRL] or keys[pygame.K_RCTRL])
 
     light_texture = game.assets.get('light_texture')
+    light_cache = game.light_cache
+    light_cache.sync(game.world_time)
     
     light_sources = []
 
-    # 1. Add the player's base vision as a light source (Fog of War)
-    if light_texture:
-        try:
-            radius_world_pixels = game.player_view_radius
-            radius_view_pixels = int(radius_world_pixels / zoom) # or Zoom
-            
-            if radius_view_pixels > 0:
-                player_vision_tex = pygame.transform.smoothscale(light_texture, (radius_view_pixels * PLAYER_FOW_RADIUS, radius_view_pixels * PLAYER_FOW_RADIUS))
-                ambient_color = (ambient, ambient, ambient)
-                player_vision_tex.fill(ambient_color, special_flags=pygame.BLEND_RGBA_MULT) 
-                light_rect = player_vision_tex.get_rect()
-                light_rect.center = (view_w / 2, view_h / 2)
-                light_mask.blit(player_vision_tex, light_rect, special_flags=pygame.BLEND_RGBA_ADD)
-        except Exception as e:
-            print(f"Error drawing player vision: {e}")
-
-    # 2. Get all dynamic light sources (lanterns)
-    # (This section is correct)
+    # 1. Get all dynamic light sources (lanterns)
     all_player_inventories = [game.player.belt, game.player.inventory]
     if game.player.backpack:
         all_player_inventories.append(game.player.backpack.inventory)
@@ -80,92 +89,116 @@ def draw_game(game):
          if getattr(item, 'state', 'off') == 'on':
             light_sources.append({'item': item, 'owner': 'ground'})
 
-    if light_texture:
-        # 3. Draw all dynamic lights (lanterns)
-        # (This section is correct)
-        for light_info in light_sources:
-            light = light_info['item']
-            radius_world_pixels = light.current_light_radius
-            radius_view_pixels = int(radius_world_pixels / zoom)
+    # 2. Place them on the mask: (center_x, center_y, radius in world pixels)
+    lights = []
+    for light_info in light_sources:
+        light = light_info['item']
+        if light_info['owner'] == 'player':
+            px_view = mask_w / 2
+            py_view = mask_h / 2
+            offset_lx = (game.player.facing_direction[0] * TILE_SIZE / light_zoom) * 0.75
+            offset_ly = (game.player.facing_direction[1] * TILE_SIZE / light_zoom) * 0.75
+            lights.append((px_view + offset_lx, py_view + offset_ly, light.current_light_radius))
+        else:
+            pos_x_view, pos_y_view = camera.to_screen(light.rect.centerx, light.rect.centery)
+            lights.append((pos_x_view / light_zoom, pos_y_view / light_zoom, light.current_light_radius))
+
+    visibility = game.visibility if game.visibility and game.visibility.origin else None
+    if light_texture and game.light_compositor:
+        # 3a. NumPy backend: the whole field is computed and written in one go
+        vision_radius = int(game.player_view_radius / light_zoom) * PLAYER_FOW_RADIUS / 2
+        vision = (mask_w / 2, mask_h / 2, vision_radius, ambient / 255)
+        mask_lights = [(x, y, radius / light_zoom) for x, y, radius in lights]
+        # Tiles hidden behind walls are darkened in the same pass
+        game.light_compositor.compose(light_mask, vision, mask_lights, visibility, camera, light_zoom)
+
+    elif light_texture:
+        # 3b. Blit backend: the player's base vision (Fog of War) and every light are added on
+        try:
+            # Scaled and tinted once per (radius, zoom, ambient level), see LightCache
+            player_vision_tex = light_cache.get_vision(game.player_view_radius, light_zoom, ambient)
+            
+            if player_vision_tex:
+                light_rect = player_vision_tex.get_rect()
+                light_rect.center = (mask_w / 2, mask_h / 2)
+                light_mask.blit(player_vision_tex, light_rect, special_flags=pygame.BLEND_RGBA_ADD)
+        except Exception as e:
+            print(f"Error drawing player vision: {e}")
+
+        for center_x, center_y, radius in lights:
+            scaled_light_tex = light_cache.get_light(radius, light_zoom)
             
-            if radius_view_pixels <= 0:
+            if scaled_light_tex is None:
                 continue
 
             try:
-                scaled_light_tex = pygame.transform.scale(light_texture, (radius_view_pixels * 2, radius_view_pixels * 2))
                 light_rect = scaled_light_tex.get_rect()
-                
-                if light_info['owner'] == 'player':
-                    px_view = view_w / 2
-                    py_view = view_h / 2
-                    offset_lx = (game.player.facing_direction[0] * TILE_SIZE / zoom) * 0.75
-                    offset_ly = (game.player.facing_direction[1] * TILE_SIZE / zoom) * 0.75
-                    light_rect.center = (px_view + offset_lx, py_view + offset_ly)
-                else:
-                    pos_x_view = light.rect.centerx + offset_x
-                    pos_y_view = light.rect.centery + offset_y
-                    light_rect.center = (pos_x_view, pos_y_view)
-                
+                light_rect.center = (center_x, center_y)
                 light_mask.blit(scaled_light_tex, light_rect, special_flags=pygame.BLEND_RGBA_ADD)
             except Exception as e:
                 print(f"Error drawing light: {e}")
 
+    # Tiles hidden behind walls are darkened, and entities on them are not drawn
+    if visibility and not (light_texture and game.light_compositor):
+        visibility.draw_occlusion(light_mask, camera, light_zoom)
+    profiler.mark('draw.lighting')
 
 
-    # 3. Draw all world objects onto the temporary surface at 1:1 scale.
+    # 3. Draw all world objects. Sprites are queued per layer and each layer
+    # goes to SDL in a single batched call (see RenderQueue).
+    render_queue = game.render_queue
+    render_queue.begin(view_w, view_h)
     
     # Draw Map Tiles (These are NOT distance-checked, they are lit by the mask)
-    for image, rect in game.renderable_tiles:
-
-        world_view_surface.blit(image, rect.move(offset_x, offset_y))
+    # The terrain comes from a scroll buffer; only newly exposed strips are redrawn
+    if game.chunk_renderer:
+        game.chunk_renderer.draw(world_view_surface, camera)
+    profiler.mark('draw.tiles')
     
     for container in game.containers:
         dist = math.hypot(container.rect.centerx - game.player.rect.centerx, container.rect.centery - game.player.rect.centery)
         
         if dist > game.player_view_radius:
             continue
+        if visibility and not visibility.is_visible_point(container.rect.centerx, container.rect.centery):
+            continue
             
-        draw_pos = container.rect.move(offset_x, offset_y)
+        draw_pos = camera.rect(container.rect)
         opacity = max(0, 255 * (1 - dist / game.player_view_radius))
         
         if getattr(container, 'image', None):
             try:
-                temp_image = container.image.copy()
-                temp_image.fill((255, 255, 255, opacity), special_flags=pygame.BLEND_RGBA_MULT)
-                world_view_surface.blit(temp_image, draw_pos)
+                render_queue.submit(OBJECT_LAYER, FADE_CACHE.get(camera.sprite(container.image), opacity), draw_pos)
             except Exception as e:
                 print(f"Error drawing container image: {e}")
         else:
             # Fallback drawing
             color = getattr(container, 'color', WHITE)
-            temp_surface = pygame.Surface(container.rect.size, pygame.SRCALPHA)
-            temp_surface.fill((color[0], color[1], color[2], opacity))
-            world_view_surface.blit(temp_surface, draw_pos)
+            game.frame_buffers.blit_alpha_rect(world_view_surface, draw_pos, (color[0], color[1], color[2], opacity))
 
     for item in game.items_on_ground:
         dist = math.hypot(item.rect.centerx - game.player.rect.centerx, item.rect.centery - game.player.rect.centery)
         
         if dist > game.player_view_radius:
             continue
+        if visibility and not visibility.is_visible_point(item.rect.centerx, item.rect.centery):
+            continue
             
-        draw_pos = item.rect.move(offset_x, offset_y)
+        draw_pos = camera.rect(item.rect)
         opacity = max(0, 255 * (1 - dist / game.player_view_radius))
         
         if getattr(item, 'image', None):
-            temp_image = item.image.copy()
-            temp_image.fill((255, 255, 255, opacity), special_flags=pygame.BLEND_RGBA_MULT)
-            world_view_surface.blit(temp_image, draw_pos)
+            render_queue.submit(OBJECT_LAYER, FADE_CACHE.get(camera.sprite(item.image), opacity), draw_pos)
         else:
             color = getattr(item, 'color', WHITE)
-            temp_surface = pygame.Surface(item.rect.size, pygame.SRCALPHA)
-            temp_surface.fill((color[0], color[1], color[2], opacity))
-            world_view_surface.blit(temp_surface, draw_pos)
+            game.frame_buffers.blit_alpha_rect(world_view_surface, draw_pos, (color[0], color[1], color[2], opacity))
 
+    render_queue.flush(world_view_surface, OBJECT_LAYER)
 
-    for p in game.projectiles:
-        p.draw(world_view_surface, offset_x, offset_y)
+    game.projectiles.draw(world_view_surface, camera, game.render_alpha)
 
 
+    queued_zombies = []
     for zombie in game.zombies:
         # Check distance from player
         dist = math.hypot(zombie.rect.centerx - game.player.rect.centerx, zombie.rect.centery - game.player.rect.centery)
@@ -173,32 +206,45 @@ def draw_game(game):
         # Don't draw zombie if it's outside the player's view radius
         if dist > game.player_view_radius:
             continue
+        if visibility and not visibility.is_visible_point(zombie.rect.centerx, zombie.rect.centery):
+            continue
 
         opacity = max(0, 255 * (1 - dist / game.player_view_radius))
 
-        zombie.draw(world_view_surface, offset_x, offset_y, opacity)
+        if zombie.image:
+            zombie.submit(render_queue, camera, opacity)
+            queued_zombies.append(zombie)
+        else:
+            zombie.draw(world_view_surface, camera, opacity, game.frame_buffers)
 
+    render_queue.flush(world_view_surface, ENTITY_LAYER)
+    for zombie in queued_zombies:
+        zombie.draw_overlays(world_view_surface, camera)
 
 
-    game.player.draw(world_view_surface, offset_x, offset_y, is_aiming)
+    game.player.draw(world_view_surface, camera, is_aiming)
 
+    outline_width = max(1, int(camera.length(2)))
     if game.hovered_container:
-        hover_rect = game.hovered_container.rect.move(offset_x, offset_y)
-        pygame.draw.rect(world_view_surface, YELLOW, hover_rect, 2)
+        hover_rect = camera.rect(game.hovered_container.rect)
+        pygame.draw.rect(world_view_surface, YELLOW, hover_rect, outline_width)
 
     if game.hovered_interactable_tile_rect:
-        hover_rect = game.hovered_interactable_tile_rect.move(offset_x, offset_y)
-        pygame.draw.rect(world_view_surface, BLUE, hover_rect, 2)
+        hover_rect = camera.rect(game.hovered_interactable_tile_rect)
+        pygame.draw.rect(world_view_surface, BLUE, hover_rect, outline_width)
+    profiler.mark('draw.entities')
 
     # Apply the light mask
+    # Scaled by exactly light_zoom (the edge mask pixels hang over the view and are clipped).
+    # At full lighting resolution the mask is pixelated like the zoomed world
+    # used to be; reduced resolution masks are smoothed.
+    full_size = (round(mask_w * light_zoom), round(mask_h * light_zoom))
+    if full_size != (mask_w, mask_h):
+        full_mask = game.frame_buffers.get('light_mask_full', full_size, like=light_mask)
+        scale = pygame.transform.smoothscale if light_div > 1 else pygame.transform.scale
+        light_mask = scale(light_mask, full_size, full_mask)
     world_view_surface.blit(light_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
-    # 4. Scale the entire world view surface up to the final game size.
-    scaled_world = pygame.transform.scale(world_view_surface, (GAME_WIDTH, GAME_HEIGHT))
-
-    # 5. Blit the scaled world onto the main virtual screen.
-    game_rect = pygame.Rect(GAME_OFFSET_X, 0, GAME_WIDTH, GAME_HEIGHT)
-    game.virtual_screen.blit(scaled_world, game_rect)
+    profiler.mark('draw.composite')
 
     # --- UI & Effects Rendering (Unaffected by Zoom) ---
     # Gun flash effect
@@ -207,43 +253,47 @@ def draw_game(game):
         center_y = GAME_HEIGHT // 2
         flash_radius = (TILE_SIZE // 2) * zoom 
         pygame.draw.circle(game.virtual_screen, YELLOW, (center_x, center_y), flash_radius)
-        game.player.gun_flash_timer -= 1
 
     top_tooltip = None
     game.modal_buttons = []
     mouse_pos = game._get_scaled_mouse_pos()
     topmost_modal_id = game.modals[-1]['id'] if game.modals else None
 
+    # Each modal is kept on its own surface and only redrawn when its state key changes
+    modal_cache = game.modal_cache
+    modal_cache.prune(game.modals)
+    player_key = player_state_key(game)
+
     for modal in game.modals:
         modal['is_active'] = (modal['id'] == topmost_modal_id)
+        key = modal_state_key(game, modal, player_key, mouse_pos)
+        area = modal_area(modal)
         
         if modal['type'] == 'status':
-            buttons = draw_status_modal(game.virtual_screen, game.player, modal, game.assets, game.zombies_killed, mouse_pos)
+            buttons = modal_cache.draw(game.virtual_screen, modal['id'], area, key, lambda surface, modal=modal: draw_status_modal(surface, game.player, modal, game.assets, game.zombies_killed, mouse_pos))
             game.modal_buttons.extend(buttons)
         elif modal['type'] == 'inventory':
-            tooltip, *buttons = draw_inventory_modal(game.virtual_screen, game.player, modal, game.assets, game._get_scaled_mouse_pos())
+            tooltip, *buttons = modal_cache.draw(game.virtual_screen, modal['id'], area, key, lambda surface, modal=modal: draw_inventory_modal(surface, game.player, modal, game.assets, mouse_pos))
             top_tooltip = tooltip or top_tooltip
             game.modal_buttons.extend(buttons)
         elif modal['type'] == 'container':
-            #buttons = draw_container_view(game.virtual_screen, game, modal['item'], modal, game.assets)
-            buttons = draw_container_view(game.virtual_screen, game, modal['item'], modal, game.assets, mouse_pos)
+            buttons = modal_cache.draw(game.virtual_screen, modal['id'], area, key, lambda surface, modal=modal: draw_container_view(surface, game, modal['item'], modal, game.assets, mouse_pos))
             game.modal_buttons.extend(buttons)
         elif modal['type'] == 'nearby':
-            #buttons = draw_nearby_modal(game.virtual_screen, game, modal, game.assets)
-            buttons = draw_nearby_modal(game.virtual_screen, game, modal, game.assets, mouse_pos)
+            buttons = modal_cache.draw(game.virtual_screen, modal['id'], area, key, lambda surface, modal=modal: draw_nearby_modal(surface, game, modal, game.assets, mouse_pos))
             game.modal_buttons.extend(buttons)
         elif modal['type'] == 'messages':
-            _, close_button, minimize_button = draw_messages_modal(game.virtual_screen, game, modal, game.assets)
+            _, close_button, minimize_button = modal_cache.draw(game.virtual_screen, modal['id'], area, key, lambda surface, modal=modal: draw_messages_modal(surface, game, modal, game.assets))
             if close_button: game.modal_buttons.append(close_button)
             if minimize_button: game.modal_buttons.append(minimize_button)
         elif modal['type'] == 'text':
-            _, close_button, minimize_button = draw_text_modal(game.virtual_screen, game, modal, game.assets)
+            _, close_button, minimize_button = modal_cache.draw(game.virtual_screen, modal['id'], area, key, lambda surface, modal=modal: draw_text_modal(surface, game, modal, game.assets))
             if close_button: game.modal_buttons.append(close_button)
             if minimize_button: game.modal_buttons.append(minimize_button)
         
         elif modal['type'] == 'mobile':
             # draw_mobile_modal now returns a list of buttons
-            buttons = draw_mobile_modal(game.virtual_screen, game, modal, game.assets)
+            buttons = modal_cache.draw(game.virtual_screen, modal['id'], area, key, lambda surface, modal=modal: draw_mobile_modal(surface, game, modal, game.assets))
             game.modal_buttons.extend(buttons)
 
     game.status_button_rect = draw_status_button(game.virtual_screen)
@@ -323,10 +373,8 @@ def draw_game(game):
                 pass
 
         if highlighted_rect:
-            overlay = pygame.Surface((highlighted_rect.width, highlighted_rect.height), pygame.SRCALPHA)
             color = (50, 220, 50, 80) if highlighted_allowed else (220, 50, 50, 80)
-            overlay.fill(color)
-            game.virtual_screen.blit(overlay, highlighted_rect.topleft)
+            game.frame_buffers.blit_alpha_rect(game.virtual_screen, highlighted_rect, color)
             pygame.draw.rect(game.virtual_screen, YELLOW if highlighted_allowed else RED, highlighted_rect, 2)
 
         if preview_item and getattr(preview_item, 'image', None):
@@ -337,9 +385,7 @@ def draw_game(game):
         elif preview_item:
             rect_w, rect_h = (int(highlighted_rect.width * 0.8), int(highlighted_rect.height * 0.8)) if highlighted_rect else (40, 40)
             preview_rect = pygame.Rect(game._get_scaled_mouse_pos()[0] - rect_w//2, game._get_scaled_mouse_pos()[1] - rect_h//2, rect_w, rect_h)
-            s = pygame.Surface((rect_w, rect_h), pygame.SRCALPHA)
-            s.fill((*preview_item.color, 180))
-            game.virtual_screen.blit(s, preview_rect.topleft)
+            game.frame_buffers.blit_alpha_rect(game.virtual_screen, preview_rect, (*preview_item.color, 180))
 
     if top_tooltip:
         tip_rect = top_tooltip['rect']
@@ -347,13 +393,11 @@ def draw_game(game):
         frac = top_tooltip['frac']
         bar_color = top_tooltip['bar']
 
-        tip_s = pygame.Surface((tip_rect.width, tip_rect.height), pygame.SRCALPHA)
-        tip_s.fill((10, 10, 10, 220))
-        game.virtual_screen.blit(tip_s, tip_rect.topleft)
+        game.frame_buffers.blit_alpha_rect(game.virtual_screen, tip_rect, (10, 10, 10, 220))
         pygame.draw.rect(game.virtual_screen, WHITE, tip_rect, 1)
 
-        name_surf = game.assets['font'].render(f"{item.name}", True, WHITE)
-        type_surf = game.assets['font'].render(f"Type: {item.item_type}", True, GRAY)
+        name_surf = render_text(game.assets['font'], f"{item.name}", True, WHITE)
+        type_surf = render_text(game.assets['font'], f"Type: {item.item_type}", True, GRAY)
         game.virtual_screen.blit(name_surf, (tip_rect.x + 8, tip_rect.y + 6))
         game.virtual_screen.blit(type_surf, (tip_rect.x + 8, tip_rect.y + 26))
 
@@ -372,14 +416,7 @@ def draw_game(game):
     if game.context_menu['active']:
         draw_context_menu(game.virtual_screen, game.context_menu, game._get_scaled_mouse_pos())
 
-    if is_aiming:
-        pygame.mouse.set_cursor(game.assets.get('aim_cursor') or pygame.cursors.arrow)
-    else:
-        pygame.mouse.set_cursor(game.assets.get('custom_cursor') or pygame.cursors.arrow)
-
     # Set cursor
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_LCTRL] or keys[pygame.K_RCTRL]:
-        pygame.mouse.set_cursor(game.assets.get('aim_cursor') or pygame.cursors.arrow)
-    else:
-        pygame.mouse.set_cursor(game.assets.get('custom_cursor') or pygame.cursors.arrow)
\ No newline at end of file
+    _set_cursor(game, 'aim_cursor' if is_aiming else 'custom_cursor')
+
+    profiler.mark('draw.ui')
@@ -430,41 +430,3 @@ class Container(Item):
     def __init__(self, name, items=None, capacity=0):
         super().__init__(name, item_type='container', capacity=capacity)
         self.inventory = items if items is not None else []
-
-class Projectile:
-    """Represents a bullet fired by the player."""
-    def __init__(self, start_x, start_y, target_x, target_y, speed=8, color=YELLOW):
-        self.x = start_x
-        self.y = start_y
-        self.rect = pygame.Rect(start_x, start_y, 5, 5)
-        self.color = color
-        self.speed = speed
-        dx = target_x - start_x
-        dy = target_y - start_y
-        dist = (dx*dx + dy*dy) ** 0.5
-        if dist > 0:
-            self.vx = (dx / dist) * self.speed
-            self.vy = (dy / dist) * self.speed
-        else:
-            self.vx = self.vy = 0
-
-    def update(self, world_min_x=0, world_min_y=0, world_max_x=None, world_max_y=None):
-    # def update(self, game_width=None, game_height=None, game_offset_x=0):
-
-        if world_max_x is None or world_max_y is None:
-        #if game_width is None or game_height is None:
-            print("Error: Projectile.update() called without game_width/game_height. Projectile will be removed.")
-            return True # Remove projectile if bounds are unknown
-
-        self.x += self.vx
-        self.y += self.vy
-        self.rect.topleft = (int(self.x), int(self.y))
-
-        if self.x < world_min_x or self.x > world_max_x or self.y < world_min_y or self.y > world_max_y:
-        # if self.x < 0 or self.x > game_width or self.y < 0 or self.y > game_height:
-            return True
-        return False
-
-    def draw(self, surface, offset_x=0, offset_y=0):
-        draw_center = (int(self.x) + offset_x, int(self.y) + offset_y)
-        pygame.draw.circle(surface, self.color, draw_center, 5)
@@ -0,0 +1,112 @@
+import math
+from array import array
+import pygame
+from data.config import *
+
+PROJECTILE_SPEED = 8 # Pixels per step
+PROJECTILE_RADIUS = 5 # Drawn size
+PROJECTILE_HIT_MARGIN = 2 # Shots are swept by their center; this grows the zombies back to the old 5x5 shot rect
+
+class ProjectilePool:
+    """
+    Every flying projectile, as parallel arrays instead of one object per
+    pellet: position, position before the last step (for interpolated
+    drawing), velocity and color. Each step moves every shot along a swept
+    segment instead of jumping to its new position:
+    - walls: CollisionGrid.sweep walks every tile the segment crosses, so a
+      fast shot can't pass through a wall tile between two steps.
+    - zombies: one ZombieIndex.query_rect around the segment, then the
+      zombie the segment enters first. A wall hit earlier on the segment
+      stops the shot before it.
+    Spent shots are dropped together in one compaction pass per step.
+    """
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.x = array('d')
+        self.y = array('d')
+        self.prev_x = array('d')
+        self.prev_y = array('d')
+        self.vx = array('d')
+        self.vy = array('d')
+        self.color = []
+
+    def __len__(self):
+        return len(self.x)
+
+    def spawn(self, start_x, start_y, target_x, target_y, speed=PROJECTILE_SPEED, color=YELLOW):
+        dx = target_x - start_x
+        dy = target_y - start_y
+        dist = math.hypot(dx, dy)
+        if dist == 0:
+            return # No direction, it would never leave
+        self.x.append(start_x)
+        self.y.append(start_y)
+        self.prev_x.append(start_x)
+        self.prev_y.append(start_y)
+        self.vx.append(dx / dist * speed)
+        self.vy.append(dy / dist * speed)
+        self.color.append(color)
+
+    def update(self, game, on_hit):
+        """
+        Moves every shot one step. on_hit(zombie) is called for each zombie
+        hit, in shot order; it should take killed zombies out of
+        game.zombie_index so later shots fly past them.
+        """
+        if not self.x:
+            return
+        min_x, min_y = game.world_min_x, game.world_min_y
+        max_x = min_x + game.map_width_pixels
+        max_y = min_y + game.map_height_pixels
+        collision_grid = game.collision_grid
+        zombie_index = game.zombie_index
+        margin = PROJECTILE_HIT_MARGIN
+        xs, ys, vxs, vys = self.x, self.y, self.vx, self.vy
+        keep = []
+
+        for i in range(len(xs)):
+            x0, y0 = xs[i], ys[i]
+            x1, y1 = x0 + vxs[i], y0 + vys[i]
+            self.prev_x[i], self.prev_y[i] = x0, y0
+            xs[i], ys[i] = x1, y1
+
+            # The shot's center, (x, y) being its rect's topleft
+            start = (x0 + margin, y0 + margin)
+            end = (x1 + margin, y1 + margin)
+            wall_t = collision_grid.sweep(start[0], start[1], end[0], end[1])
+
+            hit_zombie, hit_t = None, None
+            bounds = pygame.Rect(min(start[0], end[0]) - margin, min(start[1], end[1]) - margin,
+                                 abs(end[0] - start[0]) + 2 * margin + 1, abs(end[1] - start[1]) + 2 * margin + 1)
+            length = math.hypot(end[0] - start[0], end[1] - start[1])
+            for zombie in zombie_index.query_rect(bounds):
+                clip = zombie.rect.inflate(2 * margin, 2 * margin).clipline(start, end)
+                if not clip:
+                    continue
+                t = math.hypot(clip[0][0] - start[0], clip[0][1] - start[1]) / length
+                if hit_t is None or t < hit_t:
+                    hit_zombie, hit_t = zombie, t
+
+            if hit_zombie and (wall_t is None or hit_t <= wall_t):
+                on_hit(hit_zombie)
+            elif wall_t is None and min_x <= x1 <= max_x and min_y <= y1 <= max_y:
+                keep.append(i)
+
+        if len(keep) < len(xs):
+            self._compact(keep)
+
+    def _compact(self, keep):
+        """Keeps only the shots at the `keep` indices."""
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy'):
+            values = getattr(self, name)
+            setattr(self, name, array('d', [values[i] for i in keep]))
+        self.color = [self.color[i] for i in keep]
+
+    def draw(self, surface, camera, alpha=1.0):
+        """Draws each shot `alpha` of the way from its position before the last step to the current one."""
+        radius = camera.length(PROJECTILE_RADIUS)
+        for prev_x, prev_y, x, y, color in zip(self.prev_x, self.prev_y, self.x, self.y, self.color):
+            pygame.draw.circle(surface, color,
+                               camera.to_screen(prev_x + (x - prev_x) * alpha, prev_y + (y - prev_y) * alpha), radius)
@@ -1,4 +1,3 @@
-import time
 import pygame
 import os
 import random
@@ -11,6 +10,7 @@ from core.entities.player.player_progression import PlayerProgression
 from core.ui.inventory import get_inventory_slot_rect, get_belt_slot_rect_in_modal, get_backpack_slot_rect, get_invcontainer_slot_rect
 from core.messages import display_message
 from core.placement import find_free_tile
+from core.sim_clock import SIM_CLOCK
 
 class Player:
     def __init__(self, player_data=None):
@@ -47,7 +47,7 @@ class Player:
         self.invcontainer = None
         self.active_weapon = None
         self.belt = [None] * 5
-        self.last_decay_time = time.time()
+        self.last_decay_time = SIM_CLOCK.time()
         self.base_inventory_slots = 5
 
         self.clothes_slots =  ['head','legs', 'feet',  'torso' ,'body', 'hands']
@@ -133,13 +133,13 @@ class Player:
     def process_kill(self, weapon, zombie):
         self.progression.process_kill(self, weapon, zombie)
 
-    def update_position(self, obstacles, zombies):
+    def update_position(self, collision_grid, zombies):
         # Move on X axis first
         self.x += self.vx
         self.rect.x = round(self.x)
 
-        # Check for X-axis collisions with obstacles
-        for obstacle in obstacles:
+        # Check for X-axis collisions with the obstacles around the player
+        for obstacle in collision_grid.query_rect(self.rect):
             if self.rect.colliderect(obstacle):
                 if self.vx > 0:  # Moving right
                     self.rect.right = obstacle.left
@@ -151,8 +151,8 @@ class Player:
         self.y += self.vy
         self.rect.y = round(self.y)
 
-        # Check for Y-axis collisions with obstacles
-        for obstacle in obstacles:
+        # Check for Y-axis collisions with the obstacles around the player
+        for obstacle in collision_grid.query_rect(self.rect):
             if self.rect.colliderect(obstacle):
                 if self.vy > 0:  # Moving down
                     self.rect.bottom = obstacle.top
@@ -160,24 +160,25 @@ class Player:
                     self.rect.top = obstacle.bottom
                 self.y = self.rect.y
 
-    def draw(self, surface, offset_x, offset_y, is_aiming=False):
-        draw_rect = self.rect.move(offset_x, offset_y)
+    def draw(self, surface, camera, is_aiming=False):
+        # Drawn straight at output resolution, see core/render/camera.py
+        draw_rect = camera.rect(self.rect)
         
         if self.image:
-            surface.blit(self.image, draw_rect)
+            surface.blit(camera.sprite(self.image), draw_rect)
         else:
             pygame.draw.rect(surface, self.color, draw_rect)
 
         for slot in self.clothes_slots: # Draw in order
             item = self.clothes.get(slot)
             if item and item.image:
-                surface.blit(item.image, draw_rect)
+                surface.blit(camera.sprite(item.image), draw_rect)
 
 
         if is_aiming and self.active_weapon and self.active_weapon.image and \
            self.active_weapon.item_type == 'weapon_ranged':
-            # 1. Get the original weapon image
-            original_image = self.active_weapon.image
+            # 1. Get the weapon image, pre-scaled for the zoom level
+            original_image = camera.sprite(self.active_weapon.image)
             
             # 2. Rotate the image
             angle_degrees = math.degrees(self.aim_angle)
@@ -188,7 +189,7 @@ class Player:
             
             # 4. Offset the rect so it looks "held"
             # We use the angle to push it outwards from the center
-            offset_radius = TILE_SIZE * 0.8 # How far from the center
+            offset_radius = camera.length(TILE_SIZE * 0.8) # How far from the center
             offset_x_weapon = math.cos(self.aim_angle) * offset_radius
             offset_y_weapon = -math.sin(self.aim_angle) * offset_radius # -sin because pygame Y is inverted
             
@@ -205,8 +206,8 @@ class Player:
                self.active_weapon.item_type in ['weapon_melee', 'tool']:
             # [END MODIFICATION]
                 
-                # 1. Get the original weapon image
-                original_image = self.active_weapon.image
+                # 1. Get the weapon image, pre-scaled for the zoom level
+                original_image = camera.sprite(self.active_weapon.image)
                 
                 # 2. Rotate the image (use melee_swing_angle, negate for pygame)
                 angle_degrees = math.degrees(self.melee_swing_angle)
@@ -216,7 +217,7 @@ class Player:
                 rotated_rect = rotated_image.get_rect(center=draw_rect.center)
                 
                 # 4. Offset the rect
-                offset_radius = TILE_SIZE * 0.8 
+                offset_radius = camera.length(TILE_SIZE * 0.8)
                 offset_x_weapon = math.cos(self.melee_swing_angle) * offset_radius
                 offset_y_weapon = -math.sin(self.melee_swing_angle) * offset_radius
                 
@@ -226,32 +227,32 @@ class Player:
                 # 5. Blit it
                 surface.blit(rotated_image, rotated_rect)
 
-            swing_radius = TILE_SIZE * 0.7
+            swing_radius = camera.length(TILE_SIZE * 0.7)
             center_x, center_y = draw_rect.center
             start_angle = self.melee_swing_angle - (3.1415 / 4)
             end_angle = self.melee_swing_angle + (3.1415 / 4)
             arc_bounds = pygame.Rect(center_x - swing_radius, center_y - swing_radius, swing_radius * 2, swing_radius * 2)
-            pygame.draw.arc(surface, YELLOW, arc_bounds, start_angle, end_angle, 1)
-            self.melee_swing_timer -= 1
+            pygame.draw.arc(surface, YELLOW, arc_bounds, start_angle, end_angle, max(1, int(camera.zoom)))
 
         # Reloading bar
         if self.is_reloading:
             progress = 1.0 - (self.reload_timer / self.reload_duration)
-            bar_total_width = TILE_SIZE * 2
+            bar_total_width = camera.length(TILE_SIZE * 2)
+            bar_height = camera.length(5)
             bar_x = draw_rect.centerx - (bar_total_width / 2)
-            bar_y = draw_rect.top - 10
+            bar_y = draw_rect.top - camera.length(10)
             
-            bg_bar_rect = pygame.Rect(bar_x, bar_y, bar_total_width, 5)
+            bg_bar_rect = pygame.Rect(bar_x, bar_y, bar_total_width, bar_height)
             pygame.draw.rect(surface, DARK_GRAY, bg_bar_rect)
             
             bar_progress_width = int(bar_total_width * progress)
-            bar_rect = pygame.Rect(bar_x, bar_y, bar_progress_width, 5)
+            bar_rect = pygame.Rect(bar_x, bar_y, bar_progress_width, bar_height)
             pygame.draw.rect(surface, YELLOW, bar_rect)
 
     def update_stats(self, game):
         
 
-        current_time = time.time()
+        current_time = SIM_CLOCK.time()
         keys = pygame.key.get_pressed()
         is_moving = keys[pygame.K_w] or keys[pygame.K_s] or keys[pygame.K_a] or keys[pygame.K_d]
 
@@ -318,6 +319,12 @@ class Player:
         if self.layer_switch_cooldown > 0:
             self.layer_switch_cooldown -= 1
 
+        # Effect timers count simulation steps too, not rendered frames
+        if self.melee_swing_timer > 0:
+            self.melee_swing_timer -= 1
+        if self.gun_flash_timer > 0:
+            self.gun_flash_timer -= 1
+
         return False
 
     def get_total_inventory_slots(self):
@@ -141,13 +141,9 @@ class PlayerProgression:
             player.health = min(player.max_health, player.health + regen_rate)
 
     def update_anxiety(self, player, game):
-        nearby_zombies = 0
         # Count zombies within detection radius
-        for zombie in game.zombies:
-            dist = math.hypot(player.rect.centerx - zombie.rect.centerx, player.rect.centery - zombie.rect.centery)
-            # Using ZOMBIE_DETECTION_RADIUS as the "seeing" range
-            if dist < ZOMBIE_DETECTION_RADIUS:
-                nearby_zombies += 1
+        # Using ZOMBIE_DETECTION_RADIUS as the "seeing" range
+        nearby_zombies = len(game.zombie_index.query_radius(player.rect.centerx, player.rect.centery, ZOMBIE_DETECTION_RADIUS))
         
         anxiety_gain = 0.0
         if nearby_zombies > 5:
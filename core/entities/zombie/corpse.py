@@ -2,6 +2,7 @@ import pygame
 import os
 from data.config import TILE_SIZE, DARK_GRAY
 from core.entities.item.item import Item
+from core.sim_clock import SIM_CLOCK
 
 class Corpse(Item):
     """Lootable corpse container with automatic decay."""
@@ -9,14 +10,14 @@ class Corpse(Item):
     def __init__(self, name="Dead corpse", capacity=15, image_path=None, pos=(0, 0), decay_ms=160000):
         super().__init__(name, 'container', capacity=capacity, sprite_file=image_path)
         self.rect.center = pos
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = SIM_CLOCK.get_ticks()
         self.decay_ms = decay_ms
         self.color = DARK_GRAY
 
     def is_expired(self, now_ms=None):
         """Return True if corpse lifetime exceeded decay_ms."""
         if now_ms is None:
-            now_ms = pygame.time.get_ticks()
+            now_ms = SIM_CLOCK.get_ticks()
         return (now_ms - self.spawn_time) > self.decay_ms
 
     def spill_contents_to_ground(self, items_on_ground, drop_pos=None):
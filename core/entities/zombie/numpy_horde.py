@@ -0,0 +1,221 @@
+from data.config import *
+from core.sim_clock import SIM_CLOCK
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+WANDER_RADIUS = 5 * TILE_SIZE # Same as Zombie.update_wander_target
+ATTACK_COOLDOWN_MS = 500 # Same as the per-zombie path in update.py
+HALF_TILE = TILE_SIZE // 2 # rect.center offset from rect.topleft
+
+class NumpyZombieHorde:
+    """
+    Zombie AI backend that runs the whole horde as NumPy passes instead of
+    calling update_ai per zombie. Speeds, states, wander targets and timers
+    live in arrays (structure of arrays). The Zombie objects stay the source
+    of truth that rendering, loot, hits, sounds and saves read. Each step
+    reads their positions (so knockback or teleports are never overwritten)
+    and writes back whatever changed: positions, states, wander targets
+    and timers.
+    - Target selection, steering, tile collision (X then Y, like
+      move_towards) and attack-range checks are vectorized. Sight checks,
+      flow-field steps, sounds and attacks stay per zombie, but only run for
+      the few zombies they concern.
+    - Zombies block each other one per tile: a zombie can't step into a
+      tile another zombie's center is in. move_towards tests rect overlaps
+      instead, which can't be vectorized without all pairs.
+    - The arrays are reloaded from the Zombie objects when the zombie index
+      version changes (spawns, kills, layer switches, see ZombieIndex).
+    """
+    def __init__(self):
+        self.zombies = []
+        self.index_version = None # ZombieIndex.version the arrays were loaded for
+        self.rng = numpy.random.default_rng()
+
+    def _load(self, zombies):
+        self.zombies = list(zombies)
+        def column(values, dtype):
+            return numpy.fromiter(values, dtype=dtype, count=len(self.zombies))
+        zs = self.zombies
+        self.speed = column((z.speed for z in zs), numpy.float64)
+        self.attack_range = column((z.attack_range for z in zs), numpy.float64)
+        self.chasing = column((z.state == 'chasing' for z in zs), bool)
+        self.has_target = column((z.wander_target is not None for z in zs), bool)
+        self.target_x = column((z.wander_target[0] if z.wander_target else 0 for z in zs), numpy.float64)
+        self.target_y = column((z.wander_target[1] if z.wander_target else 0 for z in zs), numpy.float64)
+        self.last_wander_change = column((z.last_wander_change for z in zs), numpy.int64)
+        self.last_attack = column((z.last_attack_time for z in zs), numpy.int64)
+        self.has_sound = column((bool(z.sound_wander) for z in zs), bool)
+        self.last_sound = column((z.last_wander_sound_time for z in zs), numpy.int64)
+        self.sound_cooldown = column((z.wander_sound_cooldown for z in zs), numpy.int64)
+
+    def update(self, game):
+        index = game.zombie_index
+        if index.version != self.index_version or len(game.zombies) != len(self.zombies):
+            self._load(game.zombies)
+            self.index_version = index.version
+        if not self.zombies:
+            game.ai_horde_counts = (0, 0, 0)
+            return
+        zombies = self.zombies
+        count = len(zombies)
+        # Positions come from the objects, whatever moved them since the last step
+        self.x = numpy.fromiter((z.x for z in zombies), dtype=numpy.float64, count=count)
+        self.y = numpy.fromiter((z.y for z in zombies), dtype=numpy.float64, count=count)
+        now = SIM_CLOCK.get_ticks()
+        player_rect = game.player.rect
+        player_x, player_y = player_rect.center
+        collision_grid = game.collision_grid
+
+        center_x = numpy.trunc(self.x) + HALF_TILE # rect.centerx, rect.x being int(x)
+        center_y = numpy.trunc(self.y) + HALF_TILE
+        dist_to_player = numpy.hypot(player_x - center_x, player_y - center_y)
+
+        # --- Target selection
+        goal_x = numpy.zeros(len(zombies))
+        goal_y = numpy.zeros(len(zombies))
+        stop_distance = numpy.full(len(zombies), TILE_SIZE / 2) # Wandering default, see move_towards
+        was_chasing = self.chasing.copy()
+        self.chasing[:] = False
+        for i in numpy.flatnonzero(dist_to_player < ZOMBIE_DETECTION_RADIUS).tolist():
+            zombie = zombies[i]
+            if not zombie.can_see_player(player_rect, collision_grid, game):
+                continue
+            self.chasing[i] = True
+            goal_x[i], goal_y[i] = player_x, player_y
+            stop_distance[i] = self.attack_range[i] * 0.9
+            if game.flow_field and dist_to_player[i] > self.attack_range[i] * 0.9:
+                step = game.flow_field.next_step(center_x[i], center_y[i])
+                if step:
+                    goal_x[i], goal_y[i] = step
+                    stop_distance[i] = 0
+        wandering = ~self.chasing
+
+        if ZOMBIE_WANDER_ENABLED:
+            reached = self.has_target & (numpy.hypot(self.target_x - center_x, self.target_y - center_y) < TILE_SIZE)
+            renew = wandering & (~self.has_target | reached | (now - self.last_wander_change > ZOMBIE_WANDER_CHANGE_INTERVAL))
+            renew_count = int(renew.sum())
+            if renew_count:
+                self.target_x[renew] = center_x[renew] + self.rng.integers(-WANDER_RADIUS, WANDER_RADIUS + 1, renew_count)
+                self.target_y[renew] = center_y[renew] + self.rng.integers(-WANDER_RADIUS, WANDER_RADIUS + 1, renew_count)
+                self.has_target[renew] = True
+                self.last_wander_change[renew] = now
+                for i in numpy.flatnonzero(renew).tolist():
+                    zombie = zombies[i]
+                    zombie.wander_target = (int(self.target_x[i]), int(self.target_y[i]))
+                    zombie.last_wander_change = now
+            goal_x[wandering] = self.target_x[wandering]
+            goal_y[wandering] = self.target_y[wandering]
+
+            # Groans, only from zombies close enough to be heard
+            groan = wandering & self.has_sound & (now - self.last_sound > self.sound_cooldown) & \
+                    (dist_to_player < ZOMBIE_LOD_FAR_RADIUS)
+            for i in numpy.flatnonzero(groan).tolist():
+                zombies[i].play_wander_sound(game, now)
+                self.last_sound[i] = now
+                self.sound_cooldown[i] = zombies[i].wander_sound_cooldown
+            has_goal = numpy.ones(len(zombies), dtype=bool)
+        else:
+            has_goal = self.chasing.copy() # Wandering disabled, stand still
+
+        # --- Steering
+        dx = goal_x - center_x
+        dy = goal_y - center_y
+        dist = numpy.hypot(dx, dy)
+        moving = has_goal & (dist > stop_distance)
+        scale = numpy.divide(self.speed, dist, out=numpy.zeros_like(dist), where=moving)
+        move_x = dx * scale
+        move_y = dy * scale
+
+        # --- Collision, X then Y
+        old_x, old_y = self.x.copy(), self.y.copy()
+        blocked = numpy.frombuffer(collision_grid.blocked, dtype=numpy.uint8).reshape(collision_grid.height, collision_grid.width) \
+            if collision_grid.width and collision_grid.height else None
+        movers = numpy.flatnonzero(moving)
+        self._step_axis(movers, self.x + move_x, self.y, blocked, collision_grid, axis_x=True)
+        self._step_axis(movers, self.x, self.y + move_y, blocked, collision_grid, axis_x=False)
+        del blocked # Releases the view on the grid's bytearray
+
+        # --- Write states and positions back to the Zombie objects
+        for i in numpy.flatnonzero(self.chasing != was_chasing).tolist():
+            zombies[i].state = 'chasing' if self.chasing[i] else 'wandering'
+        moved = numpy.flatnonzero((self.x != old_x) | (self.y != old_y))
+        for i, x, y in zip(moved.tolist(), self.x[moved].tolist(), self.y[moved].tolist()):
+            zombie = zombies[i]
+            zombie.x, zombie.y = x, y
+            zombie.rect.topleft = (int(x), int(y))
+        # Only zombies that crossed into another index cell need re-filing
+        cell_size = game.zombie_index.cell_size
+        crossed = ((numpy.trunc(old_x) + HALF_TILE) // cell_size != (numpy.trunc(self.x) + HALF_TILE) // cell_size) | \
+                  ((numpy.trunc(old_y) + HALF_TILE) // cell_size != (numpy.trunc(self.y) + HALF_TILE) // cell_size)
+        for i in numpy.flatnonzero(crossed).tolist():
+            game.zombie_index.move(zombies[i])
+
+        # --- Attacks
+        center_x = numpy.trunc(self.x) + HALF_TILE
+        center_y = numpy.trunc(self.y) + HALF_TILE
+        in_range = (numpy.hypot(player_x - center_x, player_y - center_y) < self.attack_range) & \
+                   (now - self.last_attack > ATTACK_COOLDOWN_MS)
+        for i in numpy.flatnonzero(in_range).tolist():
+            zombies[i].attack(game.player, game)
+            zombies[i].last_attack_time = now
+            self.last_attack[i] = now
+
+        # Chasing / wandering / standing still, for the profiler overlay
+        chasing = int(self.chasing.sum())
+        wandering = int((moving & ~self.chasing).sum())
+        game.ai_horde_counts = (chasing, wandering, count - chasing - wandering)
+
+    def _step_axis(self, movers, new_x, new_y, blocked, collision_grid, axis_x):
+        """Moves `movers` to (new_x, new_y) along one axis unless they hit a wall or another zombie's tile."""
+        if not len(movers):
+            return
+        left = numpy.trunc(new_x[movers]).astype(numpy.int64)
+        top = numpy.trunc(new_y[movers]).astype(numpy.int64)
+        hit = numpy.zeros(len(movers), dtype=bool)
+
+        if blocked is not None:
+            # A tile-sized rect overlaps at most 2x2 cells
+            height, width = blocked.shape
+            for cell_x in (left // TILE_SIZE, (left + TILE_SIZE - 1) // TILE_SIZE):
+                for cell_y in (top // TILE_SIZE, (top + TILE_SIZE - 1) // TILE_SIZE):
+                    inside = (cell_x >= 0) & (cell_x < width) & (cell_y >= 0) & (cell_y < height)
+                    hit[inside] |= blocked[cell_y[inside], cell_x[inside]] == 1
+        for rect in collision_grid.extra_rects:
+            hit |= (left < rect.right) & (left + TILE_SIZE > rect.left) & (top < rect.bottom) & (top + TILE_SIZE > rect.top)
+
+        # One zombie per tile: entering a tile another zombie's center is in counts as a hit
+        tile_key = self._tile_keys(numpy.trunc(self.x), numpy.trunc(self.y))
+        new_key = self._tile_keys(left, top)
+        entering = ~hit & (new_key != tile_key[movers])
+        if entering.any():
+            occupied = numpy.isin(new_key, tile_key)
+            # Of several zombies entering the same free tile, the first one wins
+            _, first = numpy.unique(new_key[entering], return_index=True)
+            winners = numpy.zeros(len(movers), dtype=bool)
+            winners[numpy.flatnonzero(entering)[first]] = True
+            hit |= entering & (occupied | ~winners)
+
+        go = movers[~hit]
+        if axis_x:
+            self.x[go] = new_x[go]
+        else:
+            self.y[go] = new_y[go]
+
+    @staticmethod
+    def _tile_keys(left, top):
+        """One int per tile from rect.topleft, via the center's tile."""
+        cell_x = (left.astype(numpy.int64) + HALF_TILE) // TILE_SIZE
+        cell_y = (top.astype(numpy.int64) + HALF_TILE) // TILE_SIZE
+        return cell_y * (1 << 32) + cell_x
+
+def create_zombie_simulation():
+    """Returns the configured zombie AI backend, or None for the per-zombie update_ai."""
+    if ZOMBIE_AI_BACKEND != 'numpy':
+        return None
+    if numpy is None:
+        print("Warning: zombie ai_backend 'numpy' needs NumPy, which is not installed. Using 'python'.")
+        return None
+    return NumpyZombieHorde()
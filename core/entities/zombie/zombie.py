@@ -1,18 +1,40 @@
 import os
+import itertools
 import random
 import math
 import pygame
 import xml.etree.ElementTree as ET
 import uuid
+from collections import OrderedDict
 from faker import Faker
 from data.config import *
 from core.messages import display_message
+from core.render.sprite_cache import FADE_CACHE
+from core.render.render_queue import ENTITY_LAYER
+from core.sim_clock import SIM_CLOCK
 
 fake = Faker()
 ZOMBIE_TEMPLATES = []
 ZOMBIE_CLOTHES_POOL = {}
 ALL_ITEM_TEMPLATES = []
 
+SPRITE_FILES = {} # path -> scaled Surface (or None if it failed), each file is read from disk once
+ZOMBIE_ATTACK_RANGE = TILE_SIZE * 1.5
+AI_SLOTS = itertools.count() # Spreads zombies over the AI level-of-detail buckets
+OUTFIT_SPRITES = OrderedDict() # (body sprite, clothe sprites...) -> body + clothes composited
+MAX_OUTFIT_SPRITES = 256 # Outfit combinations kept before the least recently used is dropped
+
+def load_scaled_sprite(path):
+    """Loads a sprite scaled to TILE_SIZE, reading each file from disk only once."""
+    if path not in SPRITE_FILES:
+        try:
+            img = pygame.image.load(path).convert_alpha()
+            SPRITE_FILES[path] = pygame.transform.scale(img, (TILE_SIZE, TILE_SIZE))
+        except Exception as e:
+            print(f"Error loading sprite {path}: {e}")
+            SPRITE_FILES[path] = None
+    return SPRITE_FILES[path]
+
 class Zombie:
     def __init__(self, x, y, template):
         self.x = x
@@ -62,14 +84,14 @@ class Zombie:
         self.clothes = template.get('clothes', {})
         self.color = RED
         self.rect = pygame.Rect(self.x, self.y, TILE_SIZE, TILE_SIZE)
-        self.show_health_bar_timer = 0
+        self.show_health_bar_until = 0 # Simulation step the health bar hides at
         self.last_attack_time = 0
-        self.attack_range = TILE_SIZE * 1.5
+        self.attack_range = ZOMBIE_ATTACK_RANGE
         self.min_attack = template.get('min_attack')
         self.max_attack = template.get('max_attack')
         self.min_infection = template.get('min_infection')
         self.max_infection = template.get('max_infection')
-        self.melee_swing_timer = 0
+        self.melee_swing_until = 0 # Simulation step the swing arc hides at
         self.melee_swing_angle = 0
 
         self.last_hit_sound_time = 0
@@ -89,24 +111,19 @@ class Zombie:
         self.state = 'wandering'  # Can be 'wandering' or 'chasing'
         self.wander_target = None # (x, y) coordinate
         self.last_wander_change = 0 # Timestamp for changing wander direction
+        self.ai_slot = next(AI_SLOTS) # Which frames this zombie thinks on when it's far away, see update.py
 
 
     def load_sprite(self, sprite_file):
         if not sprite_file: return None
-        try:
-            path = SPRITE_PATH + "zombie/" + sprite_file
-            img = pygame.image.load(path).convert_alpha()
-            return pygame.transform.scale(img, (TILE_SIZE, TILE_SIZE))
-        except Exception as e:
-            print(f"Error loading zombie sprite {sprite_file}: {e}")
-            return None
+        return load_scaled_sprite(SPRITE_PATH + "zombie/" + sprite_file)
 
     def take_damage(self, amount, game):
         self.health -= amount
         self.health = max(0, self.health)
-        self.show_health_bar_timer = 120 # Show health bar for 2 seconds (60fps)
+        self.show_health_bar_until = SIM_CLOCK.steps + 120 # Show health bar for 2 seconds (60 steps a second)
 
-        current_time = pygame.time.get_ticks()
+        current_time = SIM_CLOCK.get_ticks()
         if current_time - self.last_hit_sound_time > self.hit_sound_cooldown:
             if self.sound_hit: # Check if a sound is defined
                 game.sound_manager.play_sound(self.sound_hit, subdir='zombie', game=game, source_pos=self.rect.center)
@@ -114,88 +131,137 @@ class Zombie:
 
         return self.health <= 0 # Return True if dead
 
-    def draw(self, surface, offset_x, offset_y, opacity=255):
-        # This draw method is for the pixelated zoom approach
-        draw_rect = self.rect.move(offset_x, offset_y)
+    def draw(self, surface, camera, opacity=255, frame_buffers=None):
+        # Drawn straight at output resolution, see core/render/camera.py
+        draw_rect = camera.rect(self.rect)
 
         if self.image:
-            temp_image = self.image.copy()
-            temp_image.fill((255, 255, 255, opacity), special_flags=pygame.BLEND_RGBA_MULT)
-            surface.blit(temp_image, draw_rect)
-
-            # Draw clothes
-            for slot, clothe in self.clothes.items():
-                if clothe:
-                    clothe_sprite = self.load_clothe_sprite(clothe.get('sprite'))
-                    if clothe_sprite:
-                        clothe_sprite.fill((255, 255, 255, opacity), special_flags=pygame.BLEND_RGBA_MULT)
-                        surface.blit(clothe_sprite, draw_rect)
-        else:
+            # self.image already has the clothes composited on (see build_outfit_sprite)
+            surface.blit(FADE_CACHE.get(camera.sprite(self.image), opacity), draw_rect)
+        elif frame_buffers:
             # Fallback for zombies without an image
-            temp_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            frame_buffers.blit_alpha_rect(surface, draw_rect, (self.color[0], self.color[1], self.color[2], opacity))
+        else:
+            temp_surface = pygame.Surface(draw_rect.size, pygame.SRCALPHA)
             temp_surface.fill((self.color[0], self.color[1], self.color[2], opacity))
             surface.blit(temp_surface, draw_rect)
 
-        if self.show_health_bar_timer > 0:
-            bar_y = draw_rect.top - 7
-            bg_bar_rect = pygame.Rect(draw_rect.left, bar_y, TILE_SIZE, 5)
+        self.draw_overlays(surface, camera)
+
+    def submit(self, render_queue, camera, opacity=255):
+        """Queues the sprite for a batched blit (see RenderQueue). Call draw_overlays after the flush."""
+        render_queue.submit(ENTITY_LAYER, FADE_CACHE.get(camera.sprite(self.image), opacity), camera.rect(self.rect))
+
+    def draw_overlays(self, surface, camera):
+        """Health bar and melee swing arc, drawn on top of the sprites."""
+        draw_rect = camera.rect(self.rect)
+
+        if SIM_CLOCK.steps < self.show_health_bar_until:
+            bar_height = camera.length(5)
+            bar_y = draw_rect.top - camera.length(7)
+            bg_bar_rect = pygame.Rect(draw_rect.left, bar_y, camera.length(TILE_SIZE), bar_height)
             pygame.draw.rect(surface, DARK_GRAY, bg_bar_rect)
 
             health_percentage = max(0, self.health / self.max_health)
-            health_bar_width = int(health_percentage * TILE_SIZE)
-            health_bar_rect = pygame.Rect(draw_rect.left, bar_y, health_bar_width, 5)
+            health_bar_width = int(health_percentage * camera.length(TILE_SIZE))
+            health_bar_rect = pygame.Rect(draw_rect.left, bar_y, health_bar_width, bar_height)
             pygame.draw.rect(surface, GREEN, health_bar_rect)
 
-            self.show_health_bar_timer -= 1
-
-        if self.melee_swing_timer > 0:
-            swing_radius = TILE_SIZE * 0.9
+        if SIM_CLOCK.steps < self.melee_swing_until:
+            swing_radius = camera.length(TILE_SIZE * 0.9)
             center_x, center_y = draw_rect.center
             start_angle = self.melee_swing_angle - (3.1415 / 4)
             end_angle = self.melee_swing_angle + (3.1415 / 4)
             arc_bounds = pygame.Rect(center_x - swing_radius, center_y - swing_radius, swing_radius * 2, swing_radius * 2)
-            pygame.draw.arc(surface, RED, arc_bounds, start_angle, end_angle, 1)
-            self.melee_swing_timer -= 1
+            pygame.draw.arc(surface, RED, arc_bounds, start_angle, end_angle, max(1, int(camera.zoom)))
 
-    def load_clothe_sprite(self, sprite_file):
+    @staticmethod
+    def load_clothe_sprite(sprite_file):
         if not sprite_file: return None
-        try:
-            path = SPRITE_PATH + "clothes/" + sprite_file
-            img = pygame.image.load(path).convert_alpha()
-            return pygame.transform.scale(img, (TILE_SIZE, TILE_SIZE))
-        except Exception as e:
-            print(f"Error loading clothe sprite {sprite_file}: {e}")
-            return None
+        return load_scaled_sprite(SPRITE_PATH + "clothes/" + sprite_file)
 
-    def has_line_of_sight(self, target_rect, obstacles):
+    @staticmethod
+    def build_outfit_sprite(sprite_file, clothes):
+        """
+        Returns the body sprite with every clothe drawn on top, in slot order.
+        Zombies wearing the same outfit share one surface.
+        """
+        clothe_files = tuple(clothe.get('sprite') for clothe in clothes.values() if clothe)
+        key = (sprite_file,) + clothe_files
+        outfit = OUTFIT_SPRITES.get(key)
+        if outfit is not None:
+            OUTFIT_SPRITES.move_to_end(key)
+            return outfit
+
+        body = load_scaled_sprite(SPRITE_PATH + "zombie/" + sprite_file) if sprite_file else None
+        if not body:
+            return None # No body to dress, draw() falls back to a colored rect
+
+        outfit = body.copy()
+        for clothe_file in clothe_files:
+            clothe_sprite = Zombie.load_clothe_sprite(clothe_file)
+            if clothe_sprite:
+                outfit.blit(clothe_sprite, (0, 0))
+
+        OUTFIT_SPRITES[key] = outfit
+        if len(OUTFIT_SPRITES) > MAX_OUTFIT_SPRITES:
+            OUTFIT_SPRITES.popitem(last=False)
+        return outfit
+
+    def has_line_of_sight(self, target_rect, collision_grid):
         """Checks if there is an uninterrupted line between zombie and target."""
         if not ZOMBIE_LINE_OF_SIGHT_CHECK:
             return True # Skip check if disabled in config
 
-        start_pos = self.rect.center
-        end_pos = target_rect.center
-
-        # Simple line segment-rectangle intersection check using pygame's clipline
-        # clipline returns the clipped points if it intersects, or empty tuple if not
-        for obs in obstacles:
-            if obs.clipline(start_pos, end_pos):
-                return False # Line of sight is blocked
-
-        return True # Line of sight is clear
-
-    def update_ai(self, player_rect, obstacles, other_zombies, game):
-        """Main AI logic: decide state (wander/chase) and target."""
-        current_time = pygame.time.get_ticks()
+        # Grid raycast, cached per (our tile, target tile), see CollisionGrid.
+        # Only reached without a visibility field, see can_see_player
+        return collision_grid.has_line_of_sight(self.rect.center, target_rect.center)
+
+    def can_see_player(self, player_rect, collision_grid, game):
+        if game.visibility and ZOMBIE_LINE_OF_SIGHT_CHECK:
+            # Sight is symmetric: if the player's tile sees ours, we see the player
+            return game.visibility.is_visible_point(self.rect.centerx, self.rect.centery)
+        return self.has_line_of_sight(player_rect, collision_grid)
+
+    def play_wander_sound(self, game, current_time):
+        """Plays the wander groan and picks the delay until the next one."""
+        # Play the sound as a one-shot (loops=0 is default)
+        game.sound_manager.play_sound(
+            self.sound_wander, 
+            subdir='zombie', 
+            game=game, 
+            source_pos=self.rect.center, 
+            base_volume=0.3
+        )
+        # Reset the timer
+        self.last_wander_sound_time = current_time
+        # Pick a new random delay
+        self.wander_sound_cooldown = random.randint(4000, 12000)
+
+    def update_ai(self, player_rect, collision_grid, other_zombies, game, step_scale=1):
+        """
+        Main AI logic: decide state (wander/chase) and target. step_scale > 1
+        moves that many frames' worth, for zombies that only think every
+        few frames.
+        """
+        current_time = SIM_CLOCK.get_ticks()
         dist_to_player = math.hypot(player_rect.centerx - self.rect.centerx,
                                     player_rect.centery - self.rect.centery)
 
-        can_see_player = self.has_line_of_sight(player_rect, obstacles)
+        can_see_player = self.can_see_player(player_rect, collision_grid, game)
         target_pos = None # Reset target each frame
+        stop_distance = None # Default stop distance for the state, see move_towards
 
         # Decide state: Chasing or Wandering
         if dist_to_player < ZOMBIE_DETECTION_RADIUS and can_see_player:
             self.state = 'chasing'
             target_pos = player_rect.center # Chase the player directly
+            if game.flow_field and dist_to_player > self.attack_range * 0.9:
+                # Follow the shared flow field around walls, one tile at a time
+                step = game.flow_field.next_step(self.rect.centerx, self.rect.centery)
+                if step:
+                    target_pos = step
+                    stop_distance = 0
             #if self.wandering_channel:
             #    self.wandering_channel.stop()
                 #self.wandering_channel = None
@@ -206,34 +272,11 @@ class Zombie:
             if ZOMBIE_WANDER_ENABLED and self.sound_wander:
                 # Check if the sound cooldown has passed
                 if current_time - self.last_wander_sound_time > self.wander_sound_cooldown:
-                    # Play the sound as a one-shot (loops=0 is default)
-                    game.sound_manager.play_sound(
-                        self.sound_wander, 
-                        subdir='zombie', 
-                        game=game, 
-                        source_pos=self.rect.center, 
-                        base_volume=0.3
-                    )
-                    # Reset the timer
-                    self.last_wander_sound_time = current_time
-                    # Pick a new random delay
-                    self.wander_sound_cooldown = random.randint(4000, 12000)
+                    self.play_wander_sound(game, current_time)
 
             # Update wander target if needed
             if ZOMBIE_WANDER_ENABLED:
-                # If interval passed, no target exists, or target was reached
-                target_reached = self.wander_target and math.hypot(self.wander_target[0] - self.rect.centerx, self.wander_target[1] - self.rect.centery) < TILE_SIZE
-                if (current_time - self.last_wander_change > ZOMBIE_WANDER_CHANGE_INTERVAL) or \
-                   (self.wander_target is None) or target_reached:
-
-                    # Pick a new random point within ~5 tiles
-                    wander_radius = 5 * TILE_SIZE
-                    new_target_x = self.rect.centerx + random.randint(-wander_radius, wander_radius)
-                    new_target_y = self.rect.centery + random.randint(-wander_radius, wander_radius)
-
-                    self.wander_target = (new_target_x, new_target_y)
-                    self.last_wander_change = current_time
-
+                self.update_wander_target(current_time)
                 target_pos = self.wander_target # Wander towards the target point
 
             else:
@@ -241,26 +284,80 @@ class Zombie:
 
         # If we have a valid target (player or wander point), move towards it
         if target_pos:
-            self.move_towards(target_pos, obstacles, other_zombies)
+            self.move_towards(target_pos, collision_grid, other_zombies, stop_distance, step_scale)
         else:
             # No target, do nothing (or add idle animation later)
             pass
 
-    def move_towards(self, target_pos, obstacles, other_zombies):
+    def update_wander_target(self, current_time):
+        """Picks a new wander point when the interval passed, there is none, or it was reached."""
+        target_reached = self.wander_target and math.hypot(self.wander_target[0] - self.rect.centerx, self.wander_target[1] - self.rect.centery) < TILE_SIZE
+        if (current_time - self.last_wander_change > ZOMBIE_WANDER_CHANGE_INTERVAL) or \
+           (self.wander_target is None) or target_reached:
+
+            # Pick a new random point within ~5 tiles
+            wander_radius = 5 * TILE_SIZE
+            new_target_x = self.rect.centerx + random.randint(-wander_radius, wander_radius)
+            new_target_y = self.rect.centery + random.randint(-wander_radius, wander_radius)
+
+            self.wander_target = (new_target_x, new_target_y)
+            self.last_wander_change = current_time
+
+    def update_far(self, collision_grid, step_scale):
+        """
+        Stand-in for update_ai far from the player: wander only, no sight
+        check, sounds or zombie-zombie collisions. The step (up to
+        ZOMBIE_LOD_FAR_BUCKETS frames' worth) is split into moves under half
+        a tile, each resolved X then Y like move_towards, so it can't hop
+        over a wall or cut a corner. A zombie stuck on both axes picks
+        another wander point.
+        """
+        self.state = 'wandering'
+        if not ZOMBIE_WANDER_ENABLED:
+            return
+        self.update_wander_target(SIM_CLOCK.get_ticks())
+
+        dx = self.wander_target[0] - self.rect.centerx
+        dy = self.wander_target[1] - self.rect.centery
+        dist = math.hypot(dx, dy)
+        if dist <= TILE_SIZE / 2:
+            return
+        step = min(dist, self.speed * step_scale)
+        substeps = max(1, math.ceil(step / (TILE_SIZE / 2)))
+        move_x = dx / dist * step / substeps
+        move_y = dy / dist * step / substeps
+        for _ in range(substeps):
+            old_x, old_y = self.x, self.y
+            self.x += move_x
+            self.rect.x = int(self.x)
+            if collision_grid.collides(self.rect):
+                self.x = old_x
+                self.rect.x = int(self.x)
+            self.y += move_y
+            self.rect.y = int(self.y)
+            if collision_grid.collides(self.rect):
+                self.y = old_y
+                self.rect.y = int(self.y)
+            if self.x == old_x and self.y == old_y:
+                self.wander_target = None
+                break
+
+    def move_towards(self, target_pos, collision_grid, other_zombies, stop_distance=None, step_scale=1):
         """Calculates movement vector towards a target_pos and handles collisions."""
         dx = target_pos[0] - self.rect.centerx
         dy = target_pos[1] - self.rect.centery
         dist = math.hypot(dx, dy)
 
-        stop_distance = TILE_SIZE / 2 # Default stop distance for wandering
-        if self.state == 'chasing':
-            # If chasing, stop when within attack range
-            stop_distance = self.attack_range * 0.9 # Use 90% of range to avoid jitter
+        if stop_distance is None:
+            stop_distance = TILE_SIZE / 2 # Default stop distance for wandering
+            if self.state == 'chasing':
+                # If chasing, stop when within attack range
+                stop_distance = self.attack_range * 0.9 # Use 90% of range to avoid jitter
 
         if dist > stop_distance: # Don't move if already very close
             # Normalize and scale by speed
-            move_x = (dx / dist) * self.speed
-            move_y = (dy / dist) * self.speed
+            move_x = (dx / dist) * self.speed * step_scale
+            move_y = (dy / dist) * self.speed * step_scale
         else:
             move_x, move_y = 0, 0
 
@@ -270,9 +367,7 @@ class Zombie:
         # Move X
         self.x += move_x
         self.rect.x = int(self.x)
-        collided_x = False
-        for obs in obstacles:
-            if self.rect.colliderect(obs): collided_x = True; break
+        collided_x = collision_grid.collides(self.rect)
         if not collided_x:
             for z in other_zombies:
                 if z is not self and self.rect.colliderect(z.rect): collided_x = True; break
@@ -284,9 +379,7 @@ class Zombie:
         # Move Y
         self.y += move_y
         self.rect.y = int(self.y)
-        collided_y = False
-        for obs in obstacles:
-            if self.rect.colliderect(obs): collided_y = True; break
+        collided_y = collision_grid.collides(self.rect)
         if not collided_y:
             for z in other_zombies:
                  if z is not self and self.rect.colliderect(z.rect): collided_y = True; break
@@ -299,7 +392,7 @@ class Zombie:
         self.rect.topleft = (int(self.x), int(self.y))
 
     def attack(self, player, game):
-        self.melee_swing_timer = 10
+        self.melee_swing_until = SIM_CLOCK.steps + 10
         dx = player.rect.centerx - self.rect.centerx
         dy = player.rect.centery - self.rect.centery
         self.melee_swing_angle = math.atan2(-dy, dx)
@@ -564,7 +657,10 @@ class Zombie:
                     
                     # Add its defense value
                     total_defense += chosen_clothe.get('defence', 0)
-            
+
+        # Composite the outfit once here instead of loading clothes every frame
+        zombie.image = Zombie.build_outfit_sprite(template.get('sprite'), zombie.clothes)
+
         for slot_name, clothe_dict in zombie.clothes.items():
             if clothe_dict:
                 item_name = clothe_dict.get('name')
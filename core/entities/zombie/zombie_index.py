@@ -0,0 +1,147 @@
+import heapq
+import math
+from data.config import *
+
+ZOMBIE_INDEX_CELL_SIZE = 128 # Pixels per cell, a bit over the AI's neighbour and detection ranges
+ZOMBIE_EXTENT = TILE_SIZE # Zombies are filed by center; their rect reaches this far from any cell they sit in
+
+class ZombieIndex:
+    """
+    Spatial hash of the current layer's zombies, kept in sync as they move
+    instead of being rebuilt every frame. Zombies are filed under the cell
+    of their center, and move() re-files one only when it crossed into
+    another cell.
+    - add / remove: when a zombie is spawned or killed.
+    - rebuild: when game.zombies is replaced (layer switch, load).
+    - sync: once per frame, rebuilds if the counts disagree (a safety net
+      for code that edits game.zombies directly).
+    version is bumped whenever the set of zombies changes (not on moves).
+    """
+    def __init__(self, cell_size=ZOMBIE_INDEX_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {} # (cell_x, cell_y) -> [zombie, ...]
+        self.cell_of = {} # zombie -> (cell_x, cell_y)
+        self.version = 0
+
+    def __len__(self):
+        return len(self.cell_of)
+
+    def _cell(self, zombie):
+        return (int(zombie.rect.centerx // self.cell_size), int(zombie.rect.centery // self.cell_size))
+
+    def rebuild(self, zombies):
+        self.cells = {}
+        self.cell_of = {}
+        self.version += 1
+        for zombie in zombies:
+            self.add(zombie)
+
+    def sync(self, zombies):
+        if len(zombies) != len(self.cell_of):
+            self.rebuild(zombies)
+
+    def add(self, zombie):
+        if zombie in self.cell_of:
+            return
+        cell = self._cell(zombie)
+        self.cell_of[zombie] = cell
+        self.cells.setdefault(cell, []).append(zombie)
+        self.version += 1
+
+    def remove(self, zombie):
+        cell = self.cell_of.pop(zombie, None)
+        if cell is None:
+            return
+        bucket = self.cells[cell]
+        bucket.remove(zombie)
+        if not bucket:
+            del self.cells[cell]
+        self.version += 1
+
+    def move(self, zombie):
+        """Call after a zombie moved; cheap when it stayed in its cell."""
+        old_cell = self.cell_of.get(zombie)
+        if old_cell is None:
+            return
+        cell = self._cell(zombie)
+        if cell == old_cell:
+            return
+        bucket = self.cells[old_cell]
+        bucket.remove(zombie)
+        if not bucket:
+            del self.cells[old_cell]
+        self.cell_of[zombie] = cell
+        self.cells.setdefault(cell, []).append(zombie)
+
+    def _cells_in(self, left, top, right, bottom):
+        """Zombies filed in the cells covering the pixel area, unfiltered."""
+        size = self.cell_size
+        cells = self.cells
+        found = []
+        for cell_y in range(int(top // size), int(bottom // size) + 1):
+            for cell_x in range(int(left // size), int(right // size) + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def neighbours(self, zombie):
+        """Zombies in the 3x3 cells around this zombie's cell (itself included)."""
+        cell_x, cell_y = self.cell_of.get(zombie) or self._cell(zombie)
+        cells = self.cells
+        found = []
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                bucket = cells.get((cell_x + dx, cell_y + dy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def query_radius(self, x, y, radius):
+        """Zombies whose center is closer than `radius` to (x, y)."""
+        radius_sq = radius * radius
+        return [zombie for zombie in self._cells_in(x - radius, y - radius, x + radius, y + radius)
+                if (zombie.rect.centerx - x) ** 2 + (zombie.rect.centery - y) ** 2 < radius_sq]
+
+    def query_rect(self, rect):
+        """Zombies whose rect overlaps `rect`."""
+        candidates = self._cells_in(rect.left - ZOMBIE_EXTENT, rect.top - ZOMBIE_EXTENT,
+                                    rect.right + ZOMBIE_EXTENT, rect.bottom + ZOMBIE_EXTENT)
+        return [zombie for zombie in candidates if rect.colliderect(zombie.rect)]
+
+    def nearest(self, x, y, k=1, max_radius=None):
+        """
+        Up to k zombies closest to (x, y), nearest first. Searches rings of
+        cells outwards and stops once the next ring can't hold anything closer.
+        """
+        if not self.cell_of or k <= 0:
+            return []
+        size = self.cell_size
+        cells = self.cells
+        center_x, center_y = int(x // size), int(y // size)
+        if max_radius is None:
+            # Far enough to reach every occupied cell
+            max_ring = max(max(abs(cx - center_x), abs(cy - center_y)) for cx, cy in cells)
+        else:
+            max_ring = int(max_radius // size) + 1
+
+        best = [] # Max-heap of (-distance, counter, zombie) holding the k closest so far
+        counter = 0
+        for ring in range(max_ring + 1):
+            # Cells in later rings are at least (ring - 1) * size away
+            if len(best) == k and -best[0][0] < (ring - 1) * size:
+                break
+            for cell_y in range(center_y - ring, center_y + ring + 1):
+                edge_row = cell_y in (center_y - ring, center_y + ring)
+                step = 1 if edge_row else 2 * ring # Only the ring's border cells
+                for cell_x in range(center_x - ring, center_x + ring + 1, step):
+                    for zombie in cells.get((cell_x, cell_y), ()):
+                        dist = math.hypot(zombie.rect.centerx - x, zombie.rect.centery - y)
+                        if max_radius is not None and dist > max_radius:
+                            continue
+                        counter += 1
+                        if len(best) < k:
+                            heapq.heappush(best, (-dist, counter, zombie))
+                        elif dist < -best[0][0]:
+                            heapq.heapreplace(best, (-dist, counter, zombie))
+        return [zombie for _, _, zombie in sorted(best, key=lambda entry: (-entry[0], entry[1]))]
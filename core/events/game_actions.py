@@ -2,6 +2,7 @@ import math
 import pygame
 from data.config import *
 from core.entities.zombie.corpse import Corpse
+from core.sim_clock import SIM_CLOCK
 
 def try_grab_item(game):
     closest_item = None
@@ -26,7 +27,7 @@ def try_grab_item(game):
             print(f"Grabbed {closest_item.name}.")
             current_map_filename = game.map_manager.current_map_filename
             if current_map_filename not in game.map_states:
-                game.map_states[current_map_filename] = {'items': [], 'zombies': [], 'killed_zombies': [], 'picked_up_items': [], 'last_respawn_time': pygame.time.get_ticks()}
+                game.map_states[current_map_filename] = {'items': [], 'zombies': [], 'killed_zombies': [], 'picked_up_items': [], 'last_respawn_time': SIM_CLOCK.get_ticks()}
             game.map_states[current_map_filename]['picked_up_items'].append(closest_item.id)
         elif len(game.player.inventory) < game.player.get_total_inventory_slots():
             game.player.inventory.append(closest_item)
@@ -34,7 +35,7 @@ def try_grab_item(game):
             print(f"Grabbed {closest_item.name} into inventory.")
             current_map_filename = game.map_manager.current_map_filename
             if current_map_filename not in game.map_states:
-                game.map_states[current_map_filename] = {'items': [], 'zombies': [], 'killed_zombies': [], 'picked_up_items': [], 'last_respawn_time': pygame.time.get_ticks()}
+                game.map_states[current_map_filename] = {'items': [], 'zombies': [], 'killed_zombies': [], 'picked_up_items': [], 'last_respawn_time': SIM_CLOCK.get_ticks()}
             game.map_states[current_map_filename]['picked_up_items'].append(closest_item.id)
         else:
             print("No space to grab the item.")
@@ -87,11 +87,19 @@ def toggle_pause(game):
     elif game.game_state == 'PAUSED':
         game.game_state = 'PLAYING'
 
+def toggle_profiler(game):
+    game.profiler.enabled = not game.profiler.enabled
+    game.profiler.reset()
+    game.profiler_overlay.reset()
+
 def handle_keyboard_events(game, event):
     if event.type == pygame.KEYDOWN:
         if event.key == pygame.K_F2:
             toggle_pause(game)
 
+        if event.key == pygame.K_F3:
+            toggle_profiler(game)
+
         if event.key == pygame.K_i:
             toggle_inventory_modal(game)
 
@@ -4,7 +4,7 @@ import random
 import math
 
 from data.config import *
-from core.entities.item.item import Item, Projectile
+from core.entities.item.item import Item
 from core.entities.zombie.corpse import Corpse
 from core.update import player_hit_zombie, handle_zombie_death
 # Import the new gear slot rect getter
@@ -1277,7 +1277,7 @@ def handle_attack(game, mouse_pos):
                     target_x = game.player.rect.centerx + math.cos(angle) * 1000
                     target_y = game.player.rect.centery + math.sin(angle) * 1000
 
-                    game.projectiles.append(Projectile(game.player.rect.centerx, game.player.rect.centery, target_x, target_y))
+                    game.projectiles.spawn(game.player.rect.centerx, game.player.rect.centery, target_x, target_y)
 
                 weapon.load -= 1
                 weapon.durability = max(0, weapon.durability - 0.5)
@@ -1312,13 +1312,14 @@ def handle_attack(game, mouse_pos):
                 dy_swing = mouse_pos[1] - player_screen_y
                 game.player.melee_swing_angle = math.atan2(-dy_swing, dx_swing)
                 hit_a_zombie = False
-                for zombie in game.zombies:
-                    if game.player.rect.colliderect(zombie.rect.inflate(20, 20)):
-                        if player_hit_zombie(game.player, zombie, game):
-                            handle_zombie_death(game, zombie, game.items_on_ground, game.obstacles, weapon)
-                            game.zombies.remove(zombie)
-                            game.zombies_killed += 1
-                        hit_a_zombie = True
-                        break
+                # Growing the player's rect by 20 reaches the same zombies as growing each zombie's
+                for zombie in game.zombie_index.query_rect(game.player.rect.inflate(20, 20)):
+                    if player_hit_zombie(game.player, zombie, game):
+                        handle_zombie_death(game, zombie, game.items_on_ground, game.obstacles, weapon)
+                        game.zombies.remove(zombie)
+                        game.zombie_index.remove(zombie)
+                        game.zombies_killed += 1
+                    hit_a_zombie = True
+                    break
 
                 if not hit_a_zombie: print("Swung and missed!")
\ No newline at end of file
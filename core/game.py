@@ -7,9 +7,11 @@ import os
 import asyncio
 
 from data.config import *
+from core.ui.text_cache import render_text
 from core.entities.player.player import Player
 from core.entities.zombie.zombie import Zombie
-from core.entities.item.item import Item, Projectile
+from core.entities.item.item import Item
+from core.entities.item.projectile_pool import ProjectilePool
 from core.entities.zombie.corpse import Corpse
 from core.ui.helpers import draw_menu, draw_game_over, run_player_setup
 from core.ui.inventory import draw_inventory_modal, get_inventory_slot_rect, get_belt_slot_rect_in_modal, get_backpack_slot_rect, get_invcontainer_slot_rect
@@ -27,8 +29,21 @@ from core.map.map_loader import load_map_from_file, parse_layered_map_layout
 from core.map.spawn_manager import spawn_initial_items, spawn_initial_zombies
 from core.map.world_layers import load_all_map_layers, set_active_layer, load_giant_map
 from core.map.world_time import WorldTime
+from core.map.collision_grid import CollisionGrid
+from core.map.flow_field import FlowField
+from core.entities.zombie.zombie_index import ZombieIndex
+from core.entities.zombie.numpy_horde import create_zombie_simulation
 from core.ui.mobile_modal import draw_mobile_modal
 from core.sound_manager import SoundManager
+from core.render.light_cache import LightCache
+from core.render.numpy_lighting import create_light_compositor
+from core.render.camera import snap_zoom
+from core.render.frame_buffers import FrameBuffers
+from core.render.render_queue import RenderQueue
+from core.ui.modal_cache import ModalSurfaceCache
+from core.profiler import FrameProfiler
+from core.ui.profiler_overlay import ProfilerOverlay
+from core.sim_clock import SIM_CLOCK
 
 class Game:
     def __init__(self):
@@ -37,11 +52,25 @@ class Game:
         pygame.init()
         self.screen = pygame.display.set_mode((VIRTUAL_SCREEN_WIDTH, VIRTUAL_GAME_HEIGHT), pygame.RESIZABLE)
         self.virtual_screen = pygame.Surface((VIRTUAL_SCREEN_WIDTH, VIRTUAL_GAME_HEIGHT))
+        # The world is drawn straight into the game area of the virtual screen
+        self.world_view_surface = self.virtual_screen.subsurface(pygame.Rect(GAME_OFFSET_X, 0, GAME_WIDTH, GAME_HEIGHT))
+        self.frame_buffers = FrameBuffers() # Per-frame surfaces reused across frames
+        self.render_queue = RenderQueue() # Batched world blits, see draw_game
+        self.modal_cache = ModalSurfaceCache() # Retained modal surfaces, see draw_game
+        self.profiler = FrameProfiler() # Per-phase frame timings, off unless something enables it (F3)
+        self.render_positions = [] # (rect, topleft before the last simulation step), see draw_interpolated
+        self.render_alpha = 1.0 # How far drawing is between the last two steps, for the projectile pool
+        self.profiler_overlay = ProfilerOverlay()
+        self.cursor_name = None # Cursor asset currently set, see draw_game
+        self.ui_version = 0 # Bumped by every input event, part of each modal's cache key
         pygame.display.set_caption("Bit Rot")
         icon_image = pygame.image.load('./game/icons/favicon.png')
         pygame.display.set_icon(icon_image)
         self.clock = pygame.time.Clock()
         self.assets = load_assets()
+        self.pause_font = pygame.font.Font(None, 50)
+        self.light_cache = LightCache(self.assets.get('light_texture'))
+        self.light_compositor = create_light_compositor(self.assets.get('light_texture')) # None = blit backend
         self.game_state = 'MENU'
         self.running = True
 
@@ -51,10 +80,20 @@ class Game:
 
         self.player = None
         self.zombies = []
+        self.zombie_index = ZombieIndex() # Spatial hash over self.zombies, every zombie lookup goes through it
+        self.zombie_simulation = create_zombie_simulation() # None = update_ai per zombie
+        self.ai_frame = 0 # Frame counter for the zombie AI level-of-detail buckets
+        self.ai_lod_counts = (0, 0, 0) # Zombies near / mid / far on the last update, for the profiler overlay
+        self.ai_horde_counts = (0, 0, 0) # Zombies chasing / wandering / still, when the NumPy backend runs them
         self.items_on_ground = []
-        self.projectiles = []
+        self.projectiles = ProjectilePool()
         self.obstacles = []
-        self.renderable_tiles = []
+        self.tile_grid = None
+        self.chunk_renderer = None
+        self.visibility = None # Player's line of sight over the tile grid (VisibilityField)
+        self.collision_grid = CollisionGrid(0, 0, []) # Obstacles as a tile bitmap, rebuilt with the map
+        self.flow_field = FlowField() # Path distances to the player for chasing zombies
+        self.minimap = None # Mobile map tab's pre-rendered layer (Minimap), built on first use
         self.containers = []
         self.corpses = []
         
@@ -171,7 +210,8 @@ class Game:
         
 
     def start_new_game(self, player_data):
-        
+        SIM_CLOCK.reset() # Before anything takes a timestamp; nothing carries over from a previous game
+
         # The player_data dict is now fully constructed by the setup screen.
         self.player_name = player_data.get('name', "Player") # Ensure game obj has name
         
@@ -280,7 +320,7 @@ class Game:
             self.player.rect.topleft = (10 * TILE_SIZE, 10 * TILE_SIZE)
 
         self.world_time = WorldTime(self)
-        self.game_start_time = pygame.time.get_ticks()
+        self.game_start_time = SIM_CLOCK.get_ticks()
 
         inventory_modal = {
             'id': uuid.uuid4(),
@@ -366,19 +406,72 @@ class Game:
         self._update_screen()
 
     def run_playing(self):
-        self.world_time.update()
+        profiler = self.profiler
+        profiler.begin_frame()
+        SIM_CLOCK.begin_frame()
 
         handle_input(self)
-        update_game_state(self)
-  
-        draw_game(self)
+        profiler.mark('input')
+
+        # Fixed steps for the real time banked since the last frame (0 to MAX_STEPS_PER_FRAME)
+        while SIM_CLOCK.step_due() and self.game_state == 'PLAYING':
+            self.step_simulation()
+
+        self.draw_interpolated(SIM_CLOCK.alpha())
+        if profiler.enabled:
+            self.profiler_overlay.draw(self.virtual_screen, self)
+            profiler.mark('overlay')
         self._update_screen()
+        profiler.end_frame()
+
+    def step_simulation(self):
+        """One fixed simulation step (SIM_STEP_MS of game time)."""
+        # Where things were before the step, for draw_interpolated (projectiles keep their own, see ProjectilePool)
+        self.render_positions = [(self.player.rect, self.player.rect.topleft)] + \
+                                [(zombie.rect, zombie.rect.topleft) for zombie in self.zombies]
+        self.world_time.update()
+        self.profiler.mark('time')
+        update_game_state(self)
+        SIM_CLOCK.advance()
+
+    def draw_interpolated(self, alpha):
+        """
+        Draws the game with the player (and so the camera), zombies and
+        projectiles moved `alpha` of the way from their position before the
+        last step to the current one.
+        """
+        self.render_alpha = alpha # The projectile pool interpolates itself
+        current = []
+        for rect, (prev_x, prev_y) in self.render_positions:
+            x, y = rect.topleft
+            current.append((rect, (x, y)))
+            rect.topleft = (round(prev_x + (x - prev_x) * alpha), round(prev_y + (y - prev_y) * alpha))
+        try:
+            draw_game(self)
+        finally:
+            for rect, position in current:
+                rect.topleft = position
+            self.render_alpha = 1.0
+
+    def fast_forward(self, steps):
+        """
+        Runs simulation steps back to back without drawing or waiting
+        (headless soak tests). Returns how many ran; it stops early when the
+        game leaves the PLAYING state.
+        """
+        done = 0
+        while done < steps and self.game_state == 'PLAYING':
+            pygame.event.pump()
+            self.step_simulation()
+            done += 1
+        SIM_CLOCK.hold()
+        return done
 
     def run_paused(self):
+        SIM_CLOCK.hold() # No game time passes while paused
         handle_input(self)
         draw_game(self)
-        font = pygame.font.Font(None, 50)
-        text = font.render("PAUSED", True, WHITE)
+        text = render_text(self.pause_font, "PAUSED", True, WHITE)
         text_rect = text.get_rect(center=(VIRTUAL_SCREEN_WIDTH / 2, VIRTUAL_GAME_HEIGHT / 2))
         self.virtual_screen.blit(text, text_rect)
         self._update_screen()
@@ -440,8 +533,10 @@ class Game:
         relative_screen_y = screen_y - (GAME_HEIGHT / 2)
         
         # Scale this relative position down by the zoom level to get world offset
-        relative_world_x = relative_screen_x / self.zoom_level
-        relative_world_y = relative_screen_y / self.zoom_level
+        # (the world is drawn at the snapped zoom level, see Camera)
+        zoom = snap_zoom(self.zoom_level)
+        relative_world_x = relative_screen_x / zoom
+        relative_world_y = relative_screen_y / zoom
         
         # Add to the player's world position to get the final world coordinate
         world_x = self.player.rect.centerx + relative_world_x
@@ -452,15 +547,23 @@ class Game:
 
     def _update_screen(self):
         current_w, current_h = self.screen.get_size()
-        scale = min(current_w / VIRTUAL_SCREEN_WIDTH, current_h / VIRTUAL_GAME_HEIGHT)
-        scaled_w, scaled_h = int(VIRTUAL_SCREEN_WIDTH * scale), int(VIRTUAL_GAME_HEIGHT * scale)
-        scaled_surf = pygame.transform.smoothscale(self.virtual_screen, (scaled_w, scaled_h))
-        blit_x = (current_w - scaled_w) // 2
-        blit_y = (current_h - scaled_h) // 2
-        self.screen.fill(BLACK)
-        self.screen.blit(scaled_surf, (blit_x, blit_y))
+        if (current_w, current_h) == (VIRTUAL_SCREEN_WIDTH, VIRTUAL_GAME_HEIGHT):
+            # Window matches the virtual screen, no resampling needed
+            self.screen.blit(self.virtual_screen, (0, 0))
+        else:
+            scale = min(current_w / VIRTUAL_SCREEN_WIDTH, current_h / VIRTUAL_GAME_HEIGHT)
+            scaled_w, scaled_h = int(VIRTUAL_SCREEN_WIDTH * scale), int(VIRTUAL_GAME_HEIGHT * scale)
+            # The scaled buffer is only re-created when the window size changes
+            scaled_surf = self.frame_buffers.get('scaled_screen', (scaled_w, scaled_h), like=self.virtual_screen)
+            pygame.transform.smoothscale(self.virtual_screen, (scaled_w, scaled_h), scaled_surf)
+            blit_x = (current_w - scaled_w) // 2
+            blit_y = (current_h - scaled_h) // 2
+            self.screen.fill(BLACK)
+            self.screen.blit(scaled_surf, (blit_x, blit_y))
         pygame.display.flip()
+        self.profiler.mark('present')
         self.clock.tick(60)
+        self.profiler.mark('idle')
 
     def update_messages(self):
         self.active_messages = [msg for msg in self.active_messages if msg.duration > 0]
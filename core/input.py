@@ -59,6 +59,9 @@ def handle_input(game):
             pygame.quit()
             sys.exit()
 
+        if event.type != pygame.MOUSEMOTION:
+            game.ui_version += 1 # Clicks and keys can change anything a modal shows
+
         if event.type == pygame.MOUSEWHEEL:
             # Check zoom first (global behavior)
             if not any(modal.get('rect') and modal['rect'].collidepoint(mouse_pos) for modal in game.modals):
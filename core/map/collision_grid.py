@@ -0,0 +1,207 @@
+import math
+import pygame
+from data.config import *
+
+SIGHT_CACHE_SIZE = 20000 # Tile pairs kept before the line of sight cache starts over
+
+class CollisionGrid:
+    """
+    The obstacle list as a bitmap over the tile grid, so a movement or hit
+    test only looks at the few cells a rect overlaps instead of every
+    obstacle on the map.
+    - Tile-sized, tile-aligned obstacles (walls, closed doors) become blocked
+      cells.
+    - Anything else (e.g. the giant map's world boundary walls) is kept as a
+      plain rect and always tested; there are only a handful of those.
+    Door toggles update it with set_blocked, alongside game.obstacles.
+    has_line_of_sight is a grid raycast cached by (source tile, target tile)
+    until the grid changes. Zombies only use it when there is no
+    VisibilityField; normally they read the player's field of view instead
+    (Zombie.can_see_player).
+    Projectiles use sweep() to find where their step first enters an obstacle.
+    """
+    def __init__(self, width, height, obstacles):
+        self.width = width
+        self.height = height
+        self.blocked = bytearray(width * height) # 1 = obstacle tile
+        self.extra_rects = [] # Obstacles that are not a single grid cell
+        for rect in obstacles:
+            grid_x, grid_y = rect.x // TILE_SIZE, rect.y // TILE_SIZE
+            if rect.width == TILE_SIZE and rect.height == TILE_SIZE and \
+               rect.x % TILE_SIZE == 0 and rect.y % TILE_SIZE == 0 and self.in_bounds(grid_x, grid_y):
+                self.blocked[grid_y * width + grid_x] = 1
+            else:
+                self.extra_rects.append(rect)
+
+        self.version = 0 # Bumped on every set_blocked, so derived data (the flow field) knows to rebuild
+        self.sight_cache = {} # ((from_x, from_y), (to_x, to_y)) -> bool, cleared when the grid changes
+        self.sight_hits = 0
+        self.sight_misses = 0
+
+    @classmethod
+    def from_game(cls, game):
+        """Builds the grid for the game's current tile grid and obstacle list."""
+        tile_grid = game.tile_grid
+        width = tile_grid.width if tile_grid else 0
+        height = tile_grid.height if tile_grid else 0
+        return cls(width, height, game.obstacles)
+
+    def in_bounds(self, grid_x, grid_y):
+        return 0 <= grid_x < self.width and 0 <= grid_y < self.height
+
+    def set_blocked(self, grid_x, grid_y, is_blocked):
+        if self.in_bounds(grid_x, grid_y):
+            self.blocked[grid_y * self.width + grid_x] = 1 if is_blocked else 0
+            self.version += 1
+            self.sight_cache.clear()
+
+    def is_blocked_cell(self, grid_x, grid_y):
+        """Cells outside the grid are open, like they were in the obstacle list."""
+        if self.in_bounds(grid_x, grid_y):
+            return self.blocked[grid_y * self.width + grid_x] == 1
+        return False
+
+    def _cell_range(self, rect):
+        """Grid cells overlapped by a rect, clamped to the grid: (first_x, first_y, last_x, last_y)."""
+        first_x = max(0, rect.left // TILE_SIZE)
+        first_y = max(0, rect.top // TILE_SIZE)
+        last_x = min(self.width - 1, (rect.right - 1) // TILE_SIZE)
+        last_y = min(self.height - 1, (rect.bottom - 1) // TILE_SIZE)
+        return first_x, first_y, last_x, last_y
+
+    def collides(self, rect):
+        """Does the rect overlap any obstacle?"""
+        first_x, first_y, last_x, last_y = self._cell_range(rect)
+        blocked, width = self.blocked, self.width
+        for grid_y in range(first_y, last_y + 1):
+            row = grid_y * width
+            for grid_x in range(first_x, last_x + 1):
+                if blocked[row + grid_x]:
+                    return True
+        for obstacle in self.extra_rects:
+            if rect.colliderect(obstacle):
+                return True
+        return False
+
+    def query_rect(self, rect):
+        """The obstacle rects a rect overlaps (cells in row order, then the extra rects)."""
+        hits = []
+        first_x, first_y, last_x, last_y = self._cell_range(rect)
+        blocked, width = self.blocked, self.width
+        for grid_y in range(first_y, last_y + 1):
+            row = grid_y * width
+            for grid_x in range(first_x, last_x + 1):
+                if blocked[row + grid_x]:
+                    hits.append(pygame.Rect(grid_x * TILE_SIZE, grid_y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+        for obstacle in self.extra_rects:
+            if rect.colliderect(obstacle):
+                hits.append(obstacle)
+        return hits
+
+    def has_line_of_sight(self, start, end):
+        """
+        Is the segment between two world points free of obstacles? The ray is
+        cast between the centers of the two points' tiles, so the answer is
+        shared by everything standing on the same pair of tiles.
+        """
+        from_cell = (int(start[0] // TILE_SIZE), int(start[1] // TILE_SIZE))
+        to_cell = (int(end[0] // TILE_SIZE), int(end[1] // TILE_SIZE))
+        key = (from_cell, to_cell)
+        visible = self.sight_cache.get(key)
+        if visible is not None:
+            self.sight_hits += 1
+            return visible
+
+        self.sight_misses += 1
+        if len(self.sight_cache) >= SIGHT_CACHE_SIZE:
+            self.sight_cache.clear()
+        visible = self._cast_ray(from_cell, to_cell)
+        if visible and self.extra_rects:
+            half = TILE_SIZE // 2
+            from_px = (from_cell[0] * TILE_SIZE + half, from_cell[1] * TILE_SIZE + half)
+            to_px = (to_cell[0] * TILE_SIZE + half, to_cell[1] * TILE_SIZE + half)
+            visible = not any(obstacle.clipline(from_px, to_px) for obstacle in self.extra_rects)
+        self.sight_cache[key] = visible
+        return visible
+
+    def _cast_ray(self, from_cell, to_cell):
+        """
+        Grid DDA from one tile center to another, stopping at the first
+        blocked cell. A ray passing exactly through a corner is blocked if
+        either cell beside the corner is, so diagonal wall gaps stay shut.
+        """
+        x, y = from_cell
+        end_x, end_y = to_cell
+        dx, dy = end_x - x, end_y - y
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Ray parameter (0 at the start, 1 at the end) at the next vertical/horizontal cell edge
+        t_delta_x = 1.0 / abs(dx) if dx else float('inf')
+        t_delta_y = 1.0 / abs(dy) if dy else float('inf')
+        t_max_x = 0.5 * t_delta_x
+        t_max_y = 0.5 * t_delta_y
+
+        is_blocked = self.is_blocked_cell
+        for _ in range(abs(dx) + abs(dy) + 1):
+            if is_blocked(x, y):
+                return False
+            if x == end_x and y == end_y:
+                return True
+            if t_max_x < t_max_y:
+                x += step_x
+                t_max_x += t_delta_x
+            elif t_max_y < t_max_x:
+                y += step_y
+                t_max_y += t_delta_y
+            else:
+                if is_blocked(x + step_x, y) or is_blocked(x, y + step_y):
+                    return False
+                x += step_x
+                y += step_y
+                t_max_x += t_delta_x
+                t_max_y += t_delta_y
+        return not is_blocked(end_x, end_y)
+
+    def sweep(self, x0, y0, x1, y1):
+        """
+        Where the segment from (x0, y0) to (x1, y1) first enters an obstacle,
+        as a fraction of its length (0-1), or None if it is clear. Walks every
+        cell the segment crosses, so a long step can't jump over a wall tile.
+        """
+        dx, dy = x1 - x0, y1 - y0
+        x, y = int(x0 // TILE_SIZE), int(y0 // TILE_SIZE)
+        end_x, end_y = int(x1 // TILE_SIZE), int(y1 // TILE_SIZE)
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Segment fraction at the next vertical/horizontal cell edge
+        t_delta_x = TILE_SIZE / abs(dx) if dx else float('inf')
+        t_delta_y = TILE_SIZE / abs(dy) if dy else float('inf')
+        t_max_x = ((x + (dx > 0)) * TILE_SIZE - x0) / dx if dx else float('inf')
+        t_max_y = ((y + (dy > 0)) * TILE_SIZE - y0) / dy if dy else float('inf')
+
+        hit = None
+        is_blocked = self.is_blocked_cell
+        if is_blocked(x, y):
+            hit = 0.0
+        else:
+            for _ in range(abs(end_x - x) + abs(end_y - y)):
+                if t_max_x < t_max_y:
+                    x += step_x
+                    t = t_max_x
+                    t_max_x += t_delta_x
+                else:
+                    y += step_y
+                    t = t_max_y
+                    t_max_y += t_delta_y
+                if is_blocked(x, y):
+                    hit = t
+                    break
+
+        for obstacle in self.extra_rects:
+            clip = obstacle.clipline(x0, y0, x1, y1)
+            if clip:
+                length = math.hypot(dx, dy)
+                t = math.hypot(clip[0][0] - x0, clip[0][1] - y0) / length if length else 0.0
+                if hit is None or t < hit:
+                    hit = t
+        return hit
@@ -0,0 +1,96 @@
+import heapq
+import math
+from data.config import *
+
+FLOW_FIELD_DETOUR = 2 # Paths may be up to this many times the detection radius long
+STRAIGHT_COST = 10
+DIAGONAL_COST = 14 # ~10 * sqrt(2), keeps the costs integer
+
+# (dx, dy, cost), orthogonal steps first so ties prefer them
+NEIGHBOURS = (
+    (1, 0, STRAIGHT_COST), (-1, 0, STRAIGHT_COST), (0, 1, STRAIGHT_COST), (0, -1, STRAIGHT_COST),
+    (1, 1, DIAGONAL_COST), (1, -1, DIAGONAL_COST), (-1, 1, DIAGONAL_COST), (-1, -1, DIAGONAL_COST)
+)
+
+class FlowField:
+    """
+    Path distances from the player's tile over the collision grid (Dijkstra,
+    8 directions, no cutting across wall corners), limited to what a chasing
+    zombie can reach. One field is shared by every zombie: each one steps
+    to the neighbouring tile with the lowest distance instead of walking
+    straight into the wall between it and the player.
+    It is only rebuilt when the player enters another tile or the grid
+    changes (door toggles bump CollisionGrid.version).
+    """
+    def __init__(self, radius=ZOMBIE_DETECTION_RADIUS):
+        self.max_cost = int(math.ceil(radius / TILE_SIZE)) * FLOW_FIELD_DETOUR * STRAIGHT_COST
+        self.distances = {} # (grid_x, grid_y) -> path cost to the target tile
+        self.target_cell = None
+        self.grid = None
+        self.grid_version = -1
+        self.rebuilds = 0
+
+    def update(self, collision_grid, target_x, target_y):
+        """Rebuilds the field if the target tile or the grid changed. Returns True if it did."""
+        target_cell = (int(target_x // TILE_SIZE), int(target_y // TILE_SIZE))
+        if target_cell == self.target_cell and collision_grid is self.grid and \
+           collision_grid.version == self.grid_version:
+            return False
+
+        self.target_cell = target_cell
+        self.grid = collision_grid
+        self.grid_version = collision_grid.version
+        self.distances = self._build(collision_grid, target_cell)
+        self.rebuilds += 1
+        return True
+
+    def _build(self, collision_grid, target_cell):
+        blocked, width, height = collision_grid.blocked, collision_grid.width, collision_grid.height
+        def is_open(x, y): # Same as not is_blocked_cell, without the method call
+            return not (0 <= x < width and 0 <= y < height) or not blocked[y * width + x]
+
+        max_cost = self.max_cost
+        distances = {target_cell: 0}
+        queue = [(0, target_cell)]
+        while queue:
+            cost, cell = heapq.heappop(queue)
+            if cost > distances[cell]:
+                continue # Stale entry, a cheaper path was found already
+            x, y = cell
+            for dx, dy, step in NEIGHBOURS:
+                new_cost = cost + step
+                if new_cost > max_cost:
+                    continue
+                nx, ny = x + dx, y + dy
+                if not is_open(nx, ny):
+                    continue
+                if dx and dy and not (is_open(nx, y) and is_open(x, ny)):
+                    continue # Would squeeze past a wall corner
+                if new_cost < distances.get((nx, ny), max_cost + 1):
+                    distances[(nx, ny)] = new_cost
+                    heapq.heappush(queue, (new_cost, (nx, ny)))
+        return distances
+
+    def next_step(self, x, y):
+        """
+        Center of the neighbouring tile one step closer to the target, or None
+        if (x, y) is on the target tile or outside the field.
+        """
+        distances = self.distances
+        cell_x, cell_y = int(x // TILE_SIZE), int(y // TILE_SIZE)
+        best = distances.get((cell_x, cell_y))
+        if not best: # None (unreachable) or 0 (already there)
+            return None
+
+        is_blocked = self.grid.is_blocked_cell
+        best_cell = None
+        for dx, dy, _ in NEIGHBOURS:
+            cost = distances.get((cell_x + dx, cell_y + dy))
+            if cost is None or cost >= best:
+                continue
+            if dx and dy and (is_blocked(cell_x + dx, cell_y) or is_blocked(cell_x, cell_y + dy)):
+                continue # Same corner rule as the build
+            best, best_cell = cost, (cell_x + dx, cell_y + dy)
+        if best_cell is None:
+            return None
+        return (best_cell[0] * TILE_SIZE + TILE_SIZE // 2, best_cell[1] * TILE_SIZE + TILE_SIZE // 2)
@@ -6,6 +6,7 @@ from data.config import *
 from core.entities.item.item import Item, Container
 from core.entities.zombie.zombie import Zombie
 from core.placement import find_free_tile
+from core.map.tile_grid import TileGrid
 
 def load_map_from_file(filepath):
     """Loads a map layout from a CSV file."""
@@ -24,13 +25,14 @@ def load_map_from_file(filepath):
 
 def parse_layered_map_layout(base_layout, ground_layout, spawn_layout, tile_manager):
     """
-    Creates lists of tiles, obstacles, and spawn points from layered map layouts.
+    Creates a tile grid, obstacles, and spawn points from layered map layouts.
     - ground_layout defines floor tiles (never obstacles).
     - base_layout defines walls and structural obstacles.
     - spawn_layout defines player, zombie, and item start positions.
+    The layouts themselves become the TileGrid layers; only obstacles and
+    containers get a Rect.
     """
     obstacles = []
-    renderable_tiles = [] # List to store (image, rect) tuples for drawing
     player_spawn = None
     zombie_spawns = []
     item_spawns = []
@@ -42,7 +44,9 @@ def parse_layered_map_layout(base_layout, ground_layout, spawn_layout, tile_mana
 
     if not map_height or not map_width:
         print("Error: Base map layout is empty.")
-        return [], [], None, [], [], []
+        return [], None, None, [], [], []
+
+    tile_grid = TileGrid(ground_layout, base_layout, spawn_layout, tile_manager)
 
     # 1. Process Ground Layer (Floor Tiles)
     if len(ground_layout) != map_height or (map_height > 0 and len(ground_layout[0]) != map_width):
@@ -52,14 +56,8 @@ def parse_layered_map_layout(base_layout, ground_layout, spawn_layout, tile_mana
          for x, char in enumerate(row):
             if x >= map_width: break
             if char and char != ' ': # Ignore empty cells in ground layer
-                if char in tile_manager.definitions:
-                    tile_def = tile_manager.definitions[char]
-                    #if tile_def['is_obstacle']:
-                        #print(f"Warning: Ground layer tile '{char}' at ({x},{y}) is marked as obstacle. Ground tiles should not be obstacles.")
-                    pos_x, pos_y = x * TILE_SIZE, y * TILE_SIZE
-                    rect = pygame.Rect(pos_x, pos_y, TILE_SIZE, TILE_SIZE)
-                    renderable_tiles.append((tile_def['image'], rect))
-                else:
+                # Ground tiles are drawn straight from the grid, only validate them here
+                if char not in tile_manager.definitions:
                     print(f"Warning: Undefined ground tile character '{char}' at ({x},{y}).")
 
     # 2. Process Base Layer (Walls, Obstacles)
@@ -72,12 +70,11 @@ def parse_layered_map_layout(base_layout, ground_layout, spawn_layout, tile_mana
         for x, char in enumerate(row):
             if x >= map_width: break
             if char and char != ' ': # Ignore empty cells in base layer
-                pos_x, pos_y = x * TILE_SIZE, y * TILE_SIZE
-                rect = pygame.Rect(pos_x, pos_y, TILE_SIZE, TILE_SIZE)
-
                 if char in tile_manager.definitions:
                     tile_def = tile_manager.definitions[char]
-                    renderable_tiles.append((tile_def['image'], rect)) # Add visuals
+                    if not tile_def['is_obstacle'] and tile_def['type'] != 'maptile_container':
+                        continue # Purely visual, the tile grid draws it
+                    rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
                     if tile_def['is_obstacle']:
                         obstacles.append(rect) # Add collision rect
                     if tile_def['type'] == 'maptile_container':
@@ -135,14 +132,13 @@ def parse_layered_map_layout(base_layout, ground_layout, spawn_layout, tile_mana
                     # If not a standard spawn marker, it might be a player spawn point
                     possible_player_spawns.append((x * TILE_SIZE, y * TILE_SIZE))
 
-                # NOW, also check if the character is a renderable tile
+                # NOW, also check if the character is a map tile (drawn from the grid)
                 if char in tile_manager.definitions:
-                    pos_x, pos_y = x * TILE_SIZE, y * TILE_SIZE
-                    rect = pygame.Rect(pos_x, pos_y, TILE_SIZE, TILE_SIZE)
                     tile_def = tile_manager.definitions[char]
-                    
-                    renderable_tiles.append((tile_def['image'], rect)) # Add visuals
-                    
+                    if not tile_def['is_obstacle'] and tile_def['type'] != 'maptile_container':
+                        continue # Purely visual, the tile grid draws it
+                    rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
                     if tile_def['is_obstacle']:
                         obstacles.append(rect) # Add collision rect
                         
@@ -167,4 +163,4 @@ def parse_layered_map_layout(base_layout, ground_layout, spawn_layout, tile_mana
         # player_spawn = (map_width * TILE_SIZE // 2, map_height * TILE_SIZE // 2)
 
 
-    return obstacles, renderable_tiles, player_spawn, zombie_spawns, item_spawns, containers
\ No newline at end of file
+    return obstacles, tile_grid, player_spawn, zombie_spawns, item_spawns, containers
\ No newline at end of file
@@ -105,16 +105,17 @@ class MapManager:
 
     def get_tile_at(self, grid_x, grid_y):
         """Gets the tile definition at a specific grid coordinate."""
-        if 0 <= grid_y < len(self.game.map_data) and 0 <= grid_x < len(self.game.map_data[0]):
-            char = self.game.map_data[grid_y][grid_x]
-            if char in self.game.tile_manager.definitions:
-                # Return the definition dictionary
-                return self.game.tile_manager.definitions[char]
-        return None
+        if not self.game.tile_grid:
+            return None
+        # Return the definition dictionary
+        return self.game.tile_grid.get_tile(grid_x, grid_y)
 
     def toggle_door_state(self, grid_x, grid_y):
         """Toggles a 'statable' tile (like a door) between its states."""
-        current_char = self.game.map_data[grid_y][grid_x]
+        tile_grid = self.game.tile_grid
+        if not tile_grid:
+            return
+        current_char = tile_grid.get_tile_id(grid_x, grid_y)
         current_def = self.game.tile_manager.definitions.get(current_char)
 
         if not current_def or not current_def.get('is_statable'):
@@ -139,27 +140,29 @@ class MapManager:
         if new_char in self.game.tile_manager.definitions:
             new_def = self.game.tile_manager.definitions[new_char]
             
-            # 1. Update the map data (this is persistent for this layer)
-            self.game.map_data[grid_y][grid_x] = new_char
+            # 1. Update the tile grid (its base layer is game.map_data, persistent for this layer)
+            tile_grid.set_tile(grid_x, grid_y, new_char)
             
             # 2. Update obstacles list
-            tile_rect = pygame.Rect(grid_x * TILE_SIZE, grid_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            
             # Remove any matching rect first (handles both cases)
             self.game.obstacles = [rect for rect in self.game.obstacles if rect != tile_rect]
             
             # Add back if the new state is an obstacle
             if new_def['is_obstacle']:
                 self.game.obstacles.append(tile_rect)
-                
-            # 3. Update renderable_tiles list
-            original_image = current_def['image'] 
-            
-            for i, (img, rect) in enumerate(self.game.renderable_tiles):
-                # Check for both rect AND the original image
-                if rect == tile_rect and img == original_image: 
-                    # Found the exact tile (e.g., the closed door, not the floor beneath it)
-                    self.game.renderable_tiles[i] = (new_def['image'], rect)
-                    break
+            self.game.collision_grid.set_blocked(grid_x, grid_y, new_def['is_obstacle'])
+
+            # 3. Rebake only the chunk holding this tile
+            if self.game.chunk_renderer:
+                self.game.chunk_renderer.invalidate_tile(grid_x, grid_y)
+
+            # 4. Doors change what the player can see
+            if self.game.visibility:
+                self.game.visibility.set_opaque(grid_x, grid_y, new_def['is_obstacle'])
+
+            # 5. Patch the door's pixel on the minimap
+            if self.game.minimap:
+                self.game.minimap.update_tile(grid_x, grid_y)
+            self.game.ui_version += 1 # The mobile map tab shows doors
         else:
             print(f"Warning: Could not find matching door state '{new_char}'")
\ No newline at end of file
@@ -0,0 +1,60 @@
+from data.config import *
+
+class TileGrid:
+    """
+    The parsed world as 2D grids of tile ids (chars), one per layer, in draw
+    order: ground, base, spawn. The grids are the layout lists themselves, so
+    no per-tile Rects or image references are kept.
+    """
+    GROUND = 0
+    BASE = 1
+    SPAWN = 2
+
+    def __init__(self, ground_layout, base_layout, spawn_layout, tile_manager):
+        self.layers = [ground_layout, base_layout, spawn_layout]
+        self.definitions = tile_manager.definitions
+        self.height = len(base_layout)
+        self.width = len(base_layout[0]) if self.height > 0 else 0
+
+    def in_bounds(self, grid_x, grid_y):
+        return 0 <= grid_x < self.width and 0 <= grid_y < self.height
+
+    def get_tile_id(self, grid_x, grid_y, layer=BASE):
+        """Returns the raw tile id at a cell, or None if out of bounds."""
+        if not self.in_bounds(grid_x, grid_y):
+            return None
+        rows = self.layers[layer]
+        if grid_y >= len(rows) or grid_x >= len(rows[grid_y]):
+            return None # Sparse/mismatched layer
+        return rows[grid_y][grid_x]
+
+    def get_tile(self, grid_x, grid_y, layer=BASE):
+        """Returns the tile definition at a cell, or None if empty/undefined."""
+        return self.definitions.get(self.get_tile_id(grid_x, grid_y, layer))
+
+    def set_tile(self, grid_x, grid_y, tile_id, layer=BASE):
+        self.layers[layer][grid_y][grid_x] = tile_id
+
+    def cell_range(self, world_rect):
+        """Clamps a world-pixel rect to (first_x, first_y, last_x, last_y) grid cells, inclusive."""
+        first_x = max(0, world_rect.left // TILE_SIZE)
+        first_y = max(0, world_rect.top // TILE_SIZE)
+        last_x = min(self.width - 1, (world_rect.right - 1) // TILE_SIZE)
+        last_y = min(self.height - 1, (world_rect.bottom - 1) // TILE_SIZE)
+        return first_x, first_y, last_x, last_y
+
+    def query_rect(self, world_rect):
+        """
+        Yields (grid_x, grid_y, tile_def) for every defined tile inside a world
+        rectangle. Within a cell, layers come in draw order (ground first).
+        """
+        first_x, first_y, last_x, last_y = self.cell_range(world_rect)
+        definitions = self.definitions
+        for grid_y in range(first_y, last_y + 1):
+            rows = [layer[grid_y] for layer in self.layers if grid_y < len(layer)]
+            for grid_x in range(first_x, last_x + 1):
+                for row in rows:
+                    if grid_x < len(row):
+                        tile_def = definitions.get(row[grid_x])
+                        if tile_def:
+                            yield grid_x, grid_y, tile_def
@@ -0,0 +1,155 @@
+import math
+import pygame
+from data.config import *
+
+# (xx, xy, yx, yy) transforms mapping the first octant onto all eight
+OCTANTS = (
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1)
+)
+
+class VisibilityField:
+    """
+    What the player can see, as a bitmap over the TileGrid. Built with
+    recursive shadowcasting from the player's tile; obstacle tiles block sight
+    (they are visible themselves, what is behind them is not).
+    It is only recomputed when the player enters another tile or a tile's
+    opacity changes (doors), so per-frame lookups are O(1).
+    """
+    def __init__(self, tile_grid, radius_tiles=VISIBILITY_RADIUS_TILES):
+        self.width = tile_grid.width
+        self.height = tile_grid.height
+        # Never smaller than what zombies need to spot the player
+        self.radius = max(radius_tiles, int(math.ceil(ZOMBIE_DETECTION_RADIUS / TILE_SIZE)) + 1)
+
+        self.opaque = bytearray(self.width * self.height) # 1 = blocks sight
+        for grid_y in range(self.height):
+            for grid_x in range(self.width):
+                tile_def = tile_grid.get_tile(grid_x, grid_y)
+                if tile_def and tile_def['is_obstacle']:
+                    self.opaque[grid_y * self.width + grid_x] = 1
+
+        self.visible = bytearray(self.width * self.height) # 1 = seen by the player
+        self.origin = None # Player tile the field was computed from
+        self.dirty = True
+        self.version = 0 # Bumped on every recompute
+        self.occluded_runs = [] # (grid_x, grid_y, length): hidden cells inside the radius, per row
+
+    def set_opaque(self, grid_x, grid_y, is_opaque):
+        """Updates a cell's opacity (e.g. a door opening); the field is recomputed on the next update."""
+        if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
+            self.opaque[grid_y * self.width + grid_x] = 1 if is_opaque else 0
+            self.dirty = True
+
+    def update(self, player_x, player_y):
+        """Recomputes the field if the player changed tile or the map changed."""
+        origin = (int(player_x // TILE_SIZE), int(player_y // TILE_SIZE))
+        if origin == self.origin and not self.dirty:
+            return False
+        self.origin = origin
+        self.dirty = False
+        self._compute()
+        self.version += 1
+        return True
+
+    def is_visible_cell(self, grid_x, grid_y):
+        if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
+            return self.visible[grid_y * self.width + grid_x] == 1
+        return False
+
+    def is_visible_point(self, x, y):
+        """Is the tile under a world point visible to the player?"""
+        return self.is_visible_cell(int(x // TILE_SIZE), int(y // TILE_SIZE))
+
+    def _compute(self):
+        self.visible = bytearray(self.width * self.height)
+        origin_x, origin_y = self.origin
+        if 0 <= origin_x < self.width and 0 <= origin_y < self.height:
+            self.visible[origin_y * self.width + origin_x] = 1
+        for xx, xy, yx, yy in OCTANTS:
+            self._cast_light(origin_x, origin_y, 1, 1.0, 0.0, xx, xy, yx, yy)
+        self._build_occluded_runs()
+
+    def _cast_light(self, origin_x, origin_y, row, start, end, xx, xy, yx, yy):
+        """Scans one octant row by row, recursing around every obstacle (roguebasin's shadowcasting)."""
+        if start < end:
+            return
+        radius = self.radius
+        radius_sq = radius * radius
+        width, height = self.width, self.height
+        opaque, visible = self.opaque, self.visible
+        new_start = start
+
+        for distance in range(row, radius + 1):
+            dx = -distance - 1
+            dy = -distance
+            blocked = False
+            while dx <= 0:
+                dx += 1
+                grid_x = origin_x + dx * xx + dy * xy
+                grid_y = origin_y + dx * yx + dy * yy
+                left_slope = (dx - 0.5) / (dy + 0.5)
+                right_slope = (dx + 0.5) / (dy - 0.5)
+                if start < right_slope:
+                    continue
+                if end > left_slope:
+                    break
+
+                in_bounds = 0 <= grid_x < width and 0 <= grid_y < height
+                index = grid_y * width + grid_x
+                if in_bounds and dx * dx + dy * dy < radius_sq:
+                    visible[index] = 1
+                cell_opaque = not in_bounds or opaque[index]
+
+                if blocked:
+                    if cell_opaque:
+                        new_start = right_slope
+                        continue
+                    blocked = False
+                    start = new_start
+                elif cell_opaque and distance < radius:
+                    blocked = True
+                    self._cast_light(origin_x, origin_y, distance + 1, start, left_slope, xx, xy, yx, yy)
+                    new_start = right_slope
+            if blocked:
+                break
+
+    def _build_occluded_runs(self):
+        """Collects the hidden cells inside the radius as horizontal runs, for the renderer."""
+        runs = []
+        origin_x, origin_y = self.origin
+        radius = self.radius
+        radius_sq = radius * radius
+        for dy in range(-radius, radius + 1):
+            grid_y = origin_y + dy
+            if not 0 <= grid_y < self.height:
+                continue
+            half = int(math.sqrt(max(0, radius_sq - 1 - dy * dy)))
+            first_x = max(0, origin_x - half)
+            last_x = min(self.width - 1, origin_x + half)
+            row = grid_y * self.width
+            run_start = None
+            for grid_x in range(first_x, last_x + 1):
+                if not self.visible[row + grid_x]:
+                    if run_start is None:
+                        run_start = grid_x
+                elif run_start is not None:
+                    runs.append((run_start, grid_y, grid_x - run_start))
+                    run_start = None
+            if run_start is not None:
+                runs.append((run_start, grid_y, last_x + 1 - run_start))
+        self.occluded_runs = runs
+
+    def draw_occlusion(self, light_mask, camera, mask_div=1):
+        """Darkens the hidden cells on the light mask (mask pixels = output pixels / mask_div)."""
+        shade = (OCCLUDED_SHADE, OCCLUDED_SHADE, OCCLUDED_SHADE)
+        mask_rect = light_mask.get_rect()
+        for grid_x, grid_y, length in self.occluded_runs:
+            left, top = camera.to_screen(grid_x * TILE_SIZE, grid_y * TILE_SIZE)
+            right, bottom = camera.to_screen((grid_x + length) * TILE_SIZE, (grid_y + 1) * TILE_SIZE)
+            left, top = round(left / mask_div), round(top / mask_div) # mask_div can be fractional (zoom)
+            rect = pygame.Rect(left, top, round(right / mask_div) - left, round(bottom / mask_div) - top)
+            # Clipped first: a blended fill hanging over the left edge is shifted onto the surface, not cut
+            rect = rect.clip(mask_rect)
+            if rect:
+                light_mask.fill(shade, rect, special_flags=pygame.BLEND_RGB_MULT)
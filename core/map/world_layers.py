@@ -9,6 +9,9 @@ from core.entities.zombie.corpse import Corpse
 from core.map.map_loader import load_map_from_file, parse_layered_map_layout
 from core.map.tile_manager import TileManager
 from core.map.spawn_manager import spawn_initial_items, spawn_initial_zombies
+from core.render.chunk_renderer import ChunkRenderer
+from core.map.visibility import VisibilityField
+from core.map.collision_grid import CollisionGrid
 
 def resize_map_layer(layer_data, target_width, target_height, fill_value=''):
     """
@@ -176,7 +179,7 @@ def load_giant_map(game):
     # 5. Parse the single Mega-Layout
     print("Parsing mega-layouts...")
     (game.obstacles, 
-     game.renderable_tiles, 
+     game.tile_grid, 
      game.player_spawn, 
      game.zombie_spawns, 
      game.item_spawns, 
@@ -184,6 +187,10 @@ def load_giant_map(game):
          mega_base, mega_ground, mega_spawn, game.tile_manager
      )
     
+    # Bake the static tiles lazily, chunk by chunk
+    game.chunk_renderer = ChunkRenderer(game.tile_grid) if game.tile_grid else None
+    game.visibility = VisibilityField(game.tile_grid) if game.tile_grid else None
+
     # Store the final map data for lookups (e.g., toggling doors)
     game.map_data = mega_base
     game.current_zombie_spawns = game.zombie_spawns # Keep compatible with existing code
@@ -205,6 +212,7 @@ def load_giant_map(game):
     game.obstacles.append(pygame.Rect(game.world_width_pixels, -100, 100, game.world_height_pixels + 200)) # Right wall
     game.obstacles.append(pygame.Rect(-100, -100, game.world_width_pixels + 200, 100)) # Top wall
     game.obstacles.append(pygame.Rect(-100, game.world_height_pixels, game.world_width_pixels + 200, 100)) # Bottom wall
+    game.collision_grid = CollisionGrid.from_game(game) # Movement and hit tests go through this
 
     print(f"Giant map load complete. Player spawn: {game.player_spawn}")
 
@@ -347,12 +355,15 @@ def _rebuild_world_from_data(game):
     game.containers.clear()
 
     # Call parse_layered_map_layout to get the new world data
-    obstacles, renderable_tiles, player_spawn, zombie_spawns, item_spawns, containers = \
+    obstacles, tile_grid, player_spawn, zombie_spawns, item_spawns, containers = \
         parse_layered_map_layout(game.map_data, game.ground_data, game.spawn_data, game.tile_manager)
 
     # Assign the new data to the game object
     game.obstacles = obstacles
-    game.renderable_tiles = renderable_tiles
+    game.tile_grid = tile_grid
+    game.chunk_renderer = ChunkRenderer(tile_grid) if tile_grid else None
+    game.visibility = VisibilityField(tile_grid) if tile_grid else None
+    game.collision_grid = CollisionGrid.from_game(game)
     game.containers = containers
 
     # Return spawn points for set_active_layer to handle
@@ -451,6 +462,7 @@ def set_active_layer(game, layer_index):
     else:
         game.zombies = [] # Start empty
         game.layer_zombies[layer_index] = []
+    game.zombie_index.rebuild(game.zombies)
     
     return True
 
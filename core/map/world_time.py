@@ -2,6 +2,7 @@ import pygame
 import math
 from data.config import *
 from core.messages import display_message
+from core.sim_clock import SIM_CLOCK
 
 class WorldTime:
     def __init__(self, game):
@@ -13,7 +14,7 @@ class WorldTime:
         self.night_duration = DAY_NIGHT_CYCLE_MS
         self.transition_duration = TRANSITION_DURATION_MS
         
-        self.last_state_change_time = pygame.time.get_ticks()
+        self.last_state_change_time = SIM_CLOCK.get_ticks()
         
         # Define the min/max values for radius and darkness
         self.day_radius = BASE_PLAYER_VIEW_RADIUS * 1.5
@@ -26,16 +27,24 @@ class WorldTime:
         self.total_cycle_duration = self.day_duration + self.transition_duration + self.night_duration + self.transition_duration
         self.game_time_ms = 180000 # Represents current time within the 24h cycle (Start at 6 AM)
         self.current_hour = START_HOUR # Start at 6 AM
-        self.last_update_time = pygame.time.get_ticks()
+        self.last_update_time = SIM_CLOCK.get_ticks()
 
         # Set initial values on the game object
         self.game.player_view_radius = self.day_radius
-        self.current_ambient_light = self.day_ambient # New variable
+        self.ambient_level = None # Integer level actually used for drawing
+        self.set_ambient_light(self.day_ambient)
+
+    def set_ambient_light(self, value):
+        """Sets the ambient light. ambient_level only changes when the integer level does."""
+        self.current_ambient_light = value
+        level = int(value)
+        if level != self.ambient_level:
+            self.ambient_level = level
 
 
     def update(self):
         """Runs the day/night state machine."""
-        current_time = pygame.time.get_ticks()
+        current_time = SIM_CLOCK.get_ticks()
 
         delta_time = current_time - self.last_update_time
         self.last_update_time = current_time
@@ -62,7 +71,7 @@ class WorldTime:
                 self.last_state_change_time = current_time
                 self.game.player_view_radius = self.night_radius
                 #self.current_darkness_overlay = self.max_darkness
-                self.current_ambient_light = self.night_ambient
+                self.set_ambient_light(self.night_ambient)
                 display_message(self.game, "It is now Night.")
             else:
                 # In progress, calculate fades
@@ -72,7 +81,7 @@ class WorldTime:
                 # Lerp (linear interpolation)
                 self.game.player_view_radius = self.lerp(self.day_radius, self.night_radius, eased_progress)
                 #self.current_darkness_overlay = self.lerp(self.min_darkness, self.max_darkness, eased_progress)
-                self.current_ambient_light = self.lerp(self.day_ambient, self.night_ambient, eased_progress)
+                self.set_ambient_light(self.lerp(self.day_ambient, self.night_ambient, eased_progress))
 
         # --- State: NIGHT ---
         elif self.state == "NIGHT":
@@ -89,7 +98,7 @@ class WorldTime:
                 self.last_state_change_time = current_time
                 self.game.player_view_radius = self.day_radius
                 # self.current_darkness_overlay = self.min_darkness
-                self.current_ambient_light = self.day_ambient
+                self.set_ambient_light(self.day_ambient)
                 display_message(self.game, "It is now Day.")
             else:
                 # In progress, calculate fades
@@ -99,7 +108,7 @@ class WorldTime:
                 # Lerp (linear interpolation)
                 self.game.player_view_radius = self.lerp(self.night_radius, self.day_radius, eased_progress)
                 #self.current_darkness_overlay = self.lerp(self.max_darkness, self.min_darkness, eased_progress)
-                self.current_ambient_light = self.lerp(self.night_ambient, self.day_ambient, eased_progress)
+                self.set_ambient_light(self.lerp(self.night_ambient, self.day_ambient, eased_progress))
 
     def lerp(self, a, b, t):
         """Linearly interpolates between a and b by t."""
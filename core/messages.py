@@ -2,4 +2,5 @@ import pygame
 from data.config import *
 
 def display_message(game, text):
-    game.message_log.append(text)
\ No newline at end of file
+    game.message_log.append(text)
+    game.ui_version += 1 # The messages modal shows the log
\ No newline at end of file
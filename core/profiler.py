@@ -0,0 +1,103 @@
+import time
+from collections import deque
+
+PROFILER_HISTORY = 120 # Frames kept for the rolling averages (~2 seconds at 60 FPS)
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list (fraction in 0-1)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+class FrameProfiler:
+    """
+    Splits each frame into named phases. Code calls mark(phase) right after a
+    phase is done, and the time since the previous mark (or since
+    begin_frame) is added to that phase, so phases never overlap and add up to
+    the frame. Sub-phases are named 'group.phase' (e.g. 'draw.lighting').
+    While disabled, every call returns straight away.
+    """
+    def __init__(self, history=PROFILER_HISTORY):
+        self.enabled = False
+        self.frames = deque(maxlen=history) # Finished frames: {phase: ms, 'total': ms}
+        self.current = None # Frame being recorded, None when disabled
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+
+    def begin_frame(self):
+        if not self.enabled:
+            self.current = None
+            return
+        self.current = {}
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """Adds the time since the previous mark to `phase`."""
+        current = self.current
+        if current is None:
+            return
+        now = time.perf_counter()
+        current[phase] = current.get(phase, 0.0) + (now - self.last_mark) * 1000
+        self.last_mark = now
+
+    def end_frame(self):
+        current = self.current
+        if current is None:
+            return
+        current['total'] = (time.perf_counter() - self.frame_start) * 1000
+        self.frames.append(current)
+        self.current = None
+
+    def reset(self):
+        self.frames.clear()
+        self.current = None
+
+    def phase_names(self):
+        """Every phase seen in the history, in first-recorded order ('total' excluded)."""
+        names = {}
+        for frame in self.frames:
+            for name in frame:
+                if name != 'total':
+                    names[name] = True
+        return list(names)
+
+    def averages(self):
+        """Mean milliseconds per phase over the history (0 for frames that skipped it)."""
+        count = len(self.frames)
+        if not count:
+            return {}
+        averages = {}
+        for name in self.phase_names() + ['total']:
+            averages[name] = sum(frame.get(name, 0.0) for frame in self.frames) / count
+        return averages
+
+    def group_averages(self):
+        """Mean milliseconds per phase group ('draw.tiles' counts towards 'draw')."""
+        groups = {}
+        for name, value in self.averages().items():
+            if name != 'total':
+                group = name.split('.', 1)[0]
+                groups[group] = groups.get(group, 0.0) + value
+        return groups
+
+    def summary(self):
+        """Frame-time percentiles plus per-phase statistics, as plain dicts (JSON friendly)."""
+        totals = sorted(frame['total'] for frame in self.frames)
+        phases = {}
+        for name in self.phase_names():
+            values = sorted(frame.get(name, 0.0) for frame in self.frames)
+            phases[name] = {
+                'mean_ms': sum(values) / len(values),
+                'p50_ms': percentile(values, 0.50),
+                'p95_ms': percentile(values, 0.95)
+            }
+        return {
+            'frames': len(totals),
+            'mean_ms': sum(totals) / len(totals) if totals else 0.0,
+            'p50_ms': percentile(totals, 0.50),
+            'p95_ms': percentile(totals, 0.95),
+            'p99_ms': percentile(totals, 0.99),
+            'max_ms': totals[-1] if totals else 0.0,
+            'phases': phases
+        }
@@ -0,0 +1,42 @@
+import math
+import pygame
+from core.render.sprite_cache import SCALE_CACHE
+
+ZOOM_STEP = 0.1 # Zoom is snapped to this step so every level has its own pre-scaled sprites
+
+def snap_zoom(zoom):
+    """Rounds a zoom factor to the nearest discrete level."""
+    return round(round(zoom / ZOOM_STEP) * ZOOM_STEP, 2)
+
+class Camera:
+    """
+    Maps world pixels straight to output pixels for one frame. The world is
+    drawn at the final resolution with sprites and chunks pre-scaled for the
+    current zoom level, so no full-frame rescale is needed.
+    """
+    def __init__(self, center_x, center_y, zoom, view_w, view_h):
+        self.zoom = snap_zoom(zoom)
+        self.view_w = view_w
+        self.view_h = view_h
+        # Screen position of the world origin. Kept integral so scaled chunks
+        # and sprites always land on the same pixel grid.
+        self.offset_x = int(math.floor(view_w / 2 - center_x * self.zoom))
+        self.offset_y = int(math.floor(view_h / 2 - center_y * self.zoom))
+
+    def to_screen(self, x, y):
+        """World point -> output pixel."""
+        return (int(math.floor(x * self.zoom)) + self.offset_x, int(math.floor(y * self.zoom)) + self.offset_y)
+
+    def rect(self, world_rect):
+        """World Rect -> output Rect. Edges are snapped, so adjacent rects stay adjacent."""
+        left, top = self.to_screen(world_rect.left, world_rect.top)
+        right, bottom = self.to_screen(world_rect.right, world_rect.bottom)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def length(self, world_length):
+        """World distance -> output pixels."""
+        return world_length * self.zoom
+
+    def sprite(self, surface):
+        """Returns `surface` pre-scaled for the current zoom level."""
+        return SCALE_CACHE.get(surface, self.zoom)
@@ -0,0 +1,99 @@
+import math
+import pygame
+from collections import OrderedDict
+from data.config import *
+from core.render.scroll_buffer import TerrainScrollBuffer
+
+CHUNK_TILES = 16 # Tiles per chunk side (16x16 tiles per baked surface)
+MAX_CACHED_CHUNKS = 256 # Baked surfaces kept alive before the oldest is dropped
+MAX_SCALED_CHUNK_PIXELS = 16 * 1024 * 1024 # Pixel budget for zoom-scaled chunk copies (~64MB)
+
+class ChunkRenderer:
+    """
+    Bakes the static map tiles (the ground, base and spawn layers of a
+    TileGrid) into cached surfaces of CHUNK_TILES x CHUNK_TILES tiles. Only the
+    chunks overlapping the camera are used, so the per-frame cost does not
+    grow with the map. Each baked chunk is also kept pre-scaled for the zoom
+    levels in use, so it can be blitted straight at output resolution. The
+    terrain around the camera is kept in a TerrainScrollBuffer, so chunks are
+    only touched when new terrain scrolls into view.
+    """
+    def __init__(self, tile_grid, chunk_tiles=CHUNK_TILES, max_chunks=MAX_CACHED_CHUNKS):
+        self.tile_grid = tile_grid
+        self.chunk_tiles = chunk_tiles
+        self.chunk_px = chunk_tiles * TILE_SIZE
+        self.max_chunks = max_chunks
+
+        # Chunk grid dimensions, rounded up to cover partial chunks on the map edge
+        self.chunks_w = (tile_grid.width + chunk_tiles - 1) // chunk_tiles
+        self.chunks_h = (tile_grid.height + chunk_tiles - 1) // chunk_tiles
+
+        self.surfaces = OrderedDict() # (chunk_x, chunk_y) -> baked Surface (LRU order)
+        self.scaled_surfaces = OrderedDict() # ((chunk_x, chunk_y), zoom) -> scaled Surface (LRU order)
+        self.scaled_pixels = 0
+        self.scroll_buffer = TerrainScrollBuffer(self)
+
+    def _bake_chunk(self, chunk):
+        """Draws every tile of a chunk onto a single opaque surface."""
+        surface = pygame.Surface((self.chunk_px, self.chunk_px)).convert()
+        surface.fill(GAME_BG_COLOR)
+        origin_x = chunk[0] * self.chunk_px
+        origin_y = chunk[1] * self.chunk_px
+        chunk_rect = pygame.Rect(origin_x, origin_y, self.chunk_px, self.chunk_px)
+        for grid_x, grid_y, tile_def in self.tile_grid.query_rect(chunk_rect):
+            surface.blit(tile_def['image'], (grid_x * TILE_SIZE - origin_x, grid_y * TILE_SIZE - origin_y))
+        return surface
+
+    def get_chunk_surface(self, chunk):
+        """Returns the baked surface for a chunk, baking it on first use."""
+        surface = self.surfaces.get(chunk)
+        if surface is not None:
+            self.surfaces.move_to_end(chunk)
+            return surface
+
+        surface = self._bake_chunk(chunk)
+        self.surfaces[chunk] = surface
+        if len(self.surfaces) > self.max_chunks:
+            self.surfaces.popitem(last=False) # Drop the least recently drawn chunk
+        return surface
+
+    def get_scaled_chunk_surface(self, chunk, zoom):
+        """Returns a chunk scaled for a zoom level, scaling it on first use."""
+        if zoom == 1:
+            return self.get_chunk_surface(chunk)
+
+        key = (chunk, zoom)
+        surface = self.scaled_surfaces.get(key)
+        if surface is not None:
+            self.scaled_surfaces.move_to_end(key)
+            return surface
+
+        # Snap both edges like Camera.rect does, so neighbouring chunks never overlap or leave gaps
+        width = int(math.floor((chunk[0] + 1) * self.chunk_px * zoom)) - int(math.floor(chunk[0] * self.chunk_px * zoom))
+        height = int(math.floor((chunk[1] + 1) * self.chunk_px * zoom)) - int(math.floor(chunk[1] * self.chunk_px * zoom))
+        surface = pygame.transform.scale(self.get_chunk_surface(chunk), (width, height))
+        self.scaled_surfaces[key] = surface
+        self.scaled_pixels += width * height
+        while self.scaled_pixels > MAX_SCALED_CHUNK_PIXELS and len(self.scaled_surfaces) > 1:
+            _, dropped = self.scaled_surfaces.popitem(last=False)
+            self.scaled_pixels -= dropped.get_width() * dropped.get_height()
+        return surface
+
+    def invalidate_tile(self, grid_x, grid_y):
+        """Forgets the baked chunk containing a tile so it is rebaked next frame."""
+        chunk = (grid_x // self.chunk_tiles, grid_y // self.chunk_tiles)
+        self.surfaces.pop(chunk, None)
+        for key in [key for key in self.scaled_surfaces if key[0] == chunk]:
+            dropped = self.scaled_surfaces.pop(key)
+            self.scaled_pixels -= dropped.get_width() * dropped.get_height()
+        self.scroll_buffer.invalidate_world_rect(pygame.Rect(grid_x * TILE_SIZE, grid_y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+
+    def invalidate_all(self):
+        self.surfaces.clear()
+        self.scaled_surfaces.clear()
+        self.scaled_pixels = 0
+        self.scroll_buffer.invalidate_all()
+
+    def draw(self, surface, camera):
+        """Draws the terrain under the camera, at the camera's zoom level."""
+        self.scroll_buffer.draw(surface, camera)
@@ -0,0 +1,46 @@
+import pygame
+
+class FrameBuffers:
+    """
+    Surfaces that are needed every frame (light mask, overlays, scaled screen)
+    kept alive across frames. A buffer is only reallocated when the size it is
+    asked for changes, e.g. after a window resize.
+    """
+    def __init__(self):
+        self.buffers = {} # name -> Surface
+        self.scratch = None # SRCALPHA surface for translucent rects, only ever grows
+        self.allocations = 0
+
+    def get(self, name, size, flags=0, like=None):
+        """
+        Returns the buffer called `name` with the given size, allocating it if
+        needed. `like` is an optional surface whose pixel format is copied.
+        The contents are whatever the previous frame left there.
+        """
+        surface = self.buffers.get(name)
+        if surface is None or surface.get_size() != size:
+            if like is not None:
+                surface = pygame.Surface(size, flags, like)
+            else:
+                surface = pygame.Surface(size, flags)
+            self.buffers[name] = surface
+            self.allocations += 1
+        return surface
+
+    def blit_alpha_rect(self, target, rect, color):
+        """Blends a translucent (r, g, b, a) rectangle onto `target`."""
+        width, height = rect.size
+        if width <= 0 or height <= 0:
+            return
+        if self.scratch is None or self.scratch.get_width() < width or self.scratch.get_height() < height:
+            scratch_w = max(width, self.scratch.get_width() if self.scratch else 0)
+            scratch_h = max(height, self.scratch.get_height() if self.scratch else 0)
+            self.scratch = pygame.Surface((scratch_w, scratch_h), pygame.SRCALPHA)
+            self.allocations += 1
+        area = pygame.Rect(0, 0, width, height)
+        self.scratch.fill(color, area)
+        target.blit(self.scratch, rect.topleft, area)
+
+    def clear(self):
+        self.buffers.clear()
+        self.scratch = None
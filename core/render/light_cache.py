@@ -0,0 +1,65 @@
+import pygame
+from data.config import *
+
+LIGHT_RADIUS_STEP = 2 # World pixels; light radii are snapped to this step before scaling
+MAX_LIGHT_TEXTURES = 128 # Safety cap, the cache is flushed if it ever grows past this
+
+class LightCache:
+    """
+    Keeps pre-scaled copies of the light texture so the light mask pass does
+    not resample it every frame.
+    - Lantern/flashlight textures are keyed by (quantized radius, zoom).
+    - The player's vision texture is also tinted by the ambient light, so it
+      is keyed the same way but only valid for the current ambient level.
+    Only the vision textures are dropped when WorldTime reports a new
+    ambient level; the untinted light textures stay valid.
+    """
+    def __init__(self, light_texture):
+        self.light_texture = light_texture
+        self.light_textures = {} # (radius, zoom) -> scaled Surface
+        self.vision_textures = {} # (radius, zoom) -> scaled and tinted Surface
+        self.ambient_level = None
+
+    def sync(self, world_time):
+        """Invalidates the tinted vision textures if the ambient level changed."""
+        if world_time.ambient_level != self.ambient_level:
+            self.ambient_level = world_time.ambient_level
+            self.vision_textures.clear()
+
+    def _key(self, radius_world_pixels, zoom):
+        radius = int(round(radius_world_pixels / LIGHT_RADIUS_STEP)) * LIGHT_RADIUS_STEP
+        return radius, round(zoom, 2)
+
+    def _store(self, cache, key, texture):
+        if len(cache) >= MAX_LIGHT_TEXTURES:
+            cache.clear()
+        cache[key] = texture
+        return texture
+
+    def get_light(self, radius_world_pixels, zoom):
+        """Returns the light texture scaled to a light's diameter in view pixels, or None."""
+        key = self._key(radius_world_pixels, zoom)
+        texture = self.light_textures.get(key)
+        if texture is not None:
+            return texture
+
+        radius_view_pixels = int(key[0] / zoom)
+        if radius_view_pixels <= 0:
+            return None
+        texture = pygame.transform.scale(self.light_texture, (radius_view_pixels * 2, radius_view_pixels * 2))
+        return self._store(self.light_textures, key, texture)
+
+    def get_vision(self, radius_world_pixels, zoom, ambient):
+        """Returns the player's fog-of-war texture, scaled and tinted by the ambient light."""
+        key = self._key(radius_world_pixels, zoom)
+        texture = self.vision_textures.get(key)
+        if texture is not None:
+            return texture
+
+        radius_view_pixels = int(key[0] / zoom)
+        if radius_view_pixels <= 0:
+            return None
+        size = radius_view_pixels * PLAYER_FOW_RADIUS
+        texture = pygame.transform.smoothscale(self.light_texture, (size, size))
+        texture.fill((ambient, ambient, ambient), special_flags=pygame.BLEND_RGBA_MULT)
+        return self._store(self.vision_textures, key, texture)
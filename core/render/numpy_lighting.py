@@ -0,0 +1,212 @@
+import pygame
+from data.config import *
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MASK_BASE_LEVEL = 10 # Darkest value of the light mask, same as the blit backend's fill
+PROFILE_TOLERANCE = 8 # Brightness levels the light texture may stray from the fitted paraboloid
+
+class NumpyLightCompositor:
+    """
+    Lighting backend that builds the light mask as a NumPy array and writes
+    it to the mask surface in one surfarray call.
+    - light.png falls off as a paraboloid, c0 + c2 * (d / r)^2 inside the
+      radius (fitted once from the texture). On every mask column a light
+      covers, that is a quadratic in y. All lights are scattered at once as
+      coefficient deltas at each segment's ends and summed with one running
+      sum down the rows, so the cost hardly grows with the number of
+      lights and there is no Python loop over them.
+    - The player's vision is always centered, so base level + vision is only
+      recomputed when its radius or the ambient level changes.
+    - Wall occlusion (the VisibilityField's hidden cells) is one gather from
+      a per-cell factor grid, multiplied in before the write.
+    """
+    def __init__(self, light_texture):
+        texture = pygame.surfarray.array3d(light_texture)
+        half_w = texture.shape[0] // 2
+        # Brightness from the texture's center to its edge
+        profile = texture[half_w:, texture.shape[1] // 2, 0].astype(numpy.float64)
+        self.steps = len(profile)
+        u = (numpy.arange(self.steps) + 0.5) / self.steps # Texel centers
+        terms = numpy.stack([numpy.ones_like(u), u * u], axis=1)
+        (self.c0, self.c2), *_ = numpy.linalg.lstsq(terms, profile, rcond=None)
+        error = numpy.abs(terms @ numpy.array([self.c0, self.c2]) - profile).max()
+        if error > PROFILE_TOLERANCE:
+            print(f"Warning: light texture is not a paraboloid falloff (off by {error:.0f}), numpy lighting will differ from 'blit'.")
+        # The vision texture is smoothscaled and tinted, it keeps the sampled profile
+        squared_steps = numpy.sqrt(numpy.arange(self.steps * self.steps, dtype=numpy.float32)).astype(numpy.int32)
+        self.falloff = numpy.append(profile.astype(numpy.float32)[squared_steps], numpy.float32(0))
+
+        self.base = None # Base level + player vision, float32
+        self.base_key = None
+        self.field = None
+        self.scratch = None
+        self.pixels = None
+        self.deltas = None # Coefficient deltas of every light, see _add_lights
+        self.columns = None
+        self.rows = None
+        self.occlusion_grid = None # Per-cell factor (1 or OCCLUDED_SHADE / 255), padded with a row and column of 1
+        self.occlusion_version = None
+        self.occlusion = None # Per-mask-pixel factor for the last camera
+        self.occlusion_key = None
+
+    def _prepare(self, size):
+        """Allocates the arrays when the mask size changes. They are (height, width), the surface's transpose."""
+        width, height = size
+        if self.field is None or self.field.shape != (height, width):
+            self.field = numpy.empty((height, width), dtype=numpy.float32)
+            self.scratch = numpy.empty((height, width))
+            self.pixels = numpy.empty((height, width), dtype=numpy.uint32)
+            self.deltas = numpy.empty((height + 1, 3 * width))
+            self.columns = numpy.arange(width, dtype=numpy.float32)
+            self.rows = numpy.arange(height, dtype=numpy.float64)[:, None]
+            self.base = None
+            self.occlusion_key = None
+
+    def _falloff_box(self, center_x, center_y, radius, intensity):
+        """Returns (x0, y0, contribution) for the vision texture, or None if it is off the mask."""
+        if radius <= 0:
+            return None
+        height, width = self.field.shape
+        x0 = max(0, int(center_x - radius))
+        y0 = max(0, int(center_y - radius))
+        x1 = min(width, int(center_x + radius) + 1)
+        y1 = min(height, int(center_y + radius) + 1)
+        if x0 >= x1 or y0 >= y1:
+            return None
+
+        scale = (self.steps / radius) ** 2
+        dx = self.columns[x0:x1] - center_x
+        dy = self.rows[y0:y1, 0].astype(numpy.float32) - center_y
+        squared = (dy * dy * scale)[:, None] + (dx * dx * scale)[None, :]
+        indices = numpy.minimum(squared.astype(numpy.int32), self.steps * self.steps)
+        contribution = self.falloff[indices]
+        if intensity != 1.0:
+            contribution *= intensity
+        return x0, y0, contribution
+
+    def _build_base(self, vision):
+        self.base = numpy.full(self.field.shape, MASK_BASE_LEVEL, dtype=numpy.float32)
+        box = self._falloff_box(*vision) if vision else None
+        if box:
+            x0, y0, contribution = box
+            self.base[y0:y0 + contribution.shape[0], x0:x0 + contribution.shape[1]] += contribution
+
+    def _add_lights(self, lights):
+        """Adds every light's paraboloid to the field."""
+        height, width = self.field.shape
+        center_x, center_y, radius = (numpy.array(values, dtype=numpy.float64) for values in zip(*lights))
+        on_mask = (radius > 0) & (center_x + radius >= 0) & (center_x - radius < width) & \
+                  (center_y + radius >= 0) & (center_y - radius < height)
+        if not on_mask.any():
+            return
+        center_x, center_y, radius = center_x[on_mask], center_y[on_mask], radius[on_mask]
+
+        # One entry per (light, covered column)
+        first = numpy.clip(numpy.ceil(center_x - radius), 0, width - 1).astype(numpy.int64)
+        last = numpy.clip(numpy.floor(center_x + radius), 0, width - 1).astype(numpy.int64)
+        counts = numpy.maximum(last - first + 1, 0)
+        light = numpy.repeat(numpy.arange(len(radius)), counts)
+        x = first[light] + numpy.arange(len(light)) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        cx, cy, r_sq = center_x[light], center_y[light], radius[light] ** 2
+        dx_sq = (x - cx) ** 2
+        half = numpy.sqrt(numpy.maximum(r_sq - dx_sq, 0))
+        top = numpy.clip(numpy.ceil(cy - half), 0, height).astype(numpy.int64)
+        # A column the light misses vertically gets an empty segment (bottom = top - 1)
+        bottom = numpy.maximum(numpy.minimum(numpy.floor(cy + half), height - 1).astype(numpy.int64), top - 1)
+
+        # On column x the light adds a + b * y + c * y^2 for top <= y <= bottom
+        c = self.c2 / r_sq
+        b = -2 * c * cy
+        a = self.c0 + c * (dx_sq + cy * cy)
+        # Each coefficient is added on the segment's top row and taken off on
+        # the row past its bottom (hence the spare last row), then a running
+        # sum down the rows gives every pixel the coefficients of the lights
+        # covering it. Adding whole rows keeps the sum vectorised across x.
+        starts = top * (3 * width) + x
+        ends = starts + (bottom + 1 - top) * (3 * width)
+        deltas = self.deltas
+        deltas.fill(0)
+        flat = deltas.reshape(-1)
+        for plane, coefficient in enumerate((a, b, c)):
+            numpy.add.at(flat, starts + plane * width, coefficient)
+            numpy.subtract.at(flat, ends + plane * width, coefficient)
+        for y in range(top.min() + 1, min(bottom.max() + 2, height)): # Rows outside stay 0
+            numpy.add(deltas[y], deltas[y - 1], out=deltas[y])
+        a, b, c = deltas[:height].reshape(height, 3, width).transpose(1, 0, 2)
+
+        # field += a + y * (b + y * c), without allocating mask-sized temporaries
+        field, rows = self.field, self.rows
+        scratch = numpy.multiply(c, rows, out=self.scratch)
+        scratch += b
+        scratch *= rows
+        scratch += a
+        field += scratch
+
+    def _occlusion(self, visibility, camera, mask_div):
+        """Per-mask-pixel factor for the hidden cells (mask pixels = output pixels / mask_div)."""
+        if visibility.version != self.occlusion_version:
+            grid = numpy.ones((visibility.height + 1, visibility.width + 1), dtype=numpy.float32)
+            shade = OCCLUDED_SHADE / 255
+            for grid_x, grid_y, length in visibility.occluded_runs:
+                grid[grid_y, grid_x:grid_x + length] = shade
+            self.occlusion_grid = grid
+            self.occlusion_version = visibility.version
+            self.occlusion_key = None
+
+        key = (self.occlusion_version, camera.offset_x, camera.offset_y, camera.zoom, mask_div)
+        if key != self.occlusion_key:
+            # The cell under each mask pixel's center; cells off the grid index the padding
+            height, width = self.field.shape
+            cell = TILE_SIZE * camera.zoom
+            grid_x = numpy.floor(((numpy.arange(width) + 0.5) * mask_div - camera.offset_x) / cell).astype(numpy.int64)
+            grid_y = numpy.floor(((numpy.arange(height) + 0.5) * mask_div - camera.offset_y) / cell).astype(numpy.int64)
+            grid_x[(grid_x < 0) | (grid_x >= visibility.width)] = -1
+            grid_y[(grid_y < 0) | (grid_y >= visibility.height)] = -1
+            self.occlusion = self.occlusion_grid[grid_y][:, grid_x]
+            self.occlusion_key = key
+        return self.occlusion
+
+    def compose(self, light_mask, vision, lights, visibility=None, camera=None, mask_div=1):
+        """
+        Writes the light field into `light_mask`.
+        - vision: (center_x, center_y, radius, intensity) of the player's fog of war, or None
+        - lights: list of (center_x, center_y, radius) for the dynamic lights
+        - visibility, camera, mask_div: darken the cells the VisibilityField hides
+        Positions and radii are in mask pixels, intensity is 0-1.
+        """
+        self._prepare(light_mask.get_size())
+        base_key = tuple(round(value, 3) for value in vision) if vision else None
+        if self.base is None or base_key != self.base_key:
+            self._build_base(vision)
+            self.base_key = base_key
+
+        field = self.field
+        field[...] = self.base
+        if lights:
+            self._add_lights(lights)
+        numpy.minimum(field, 255, out=field) # Each additive blit saturates at 255
+        if visibility is not None:
+            field *= self._occlusion(visibility, camera, mask_div)
+
+        # Gray level -> mapped pixel (same value in R, G and B)
+        self.pixels[...] = field
+        if light_mask.get_bitsize() >= 24:
+            self.pixels *= sum(1 << shift for shift in light_mask.get_shifts()[:3])
+            pygame.surfarray.blit_array(light_mask, self.pixels.T)
+        else:
+            pixels = pygame.surfarray.pixels3d(light_mask)
+            pixels[...] = self.pixels.T[:, :, None]
+            del pixels # Unlocks the surface
+
+def create_light_compositor(light_texture):
+    """Returns the configured lighting backend, or None for the default blit backend."""
+    if LIGHTING_BACKEND != 'numpy' or light_texture is None:
+        return None
+    if numpy is None:
+        print("Warning: lighting_backend 'numpy' needs NumPy, which is not installed. Using 'blit'.")
+        return None
+    return NumpyLightCompositor(light_texture)
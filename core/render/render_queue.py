@@ -0,0 +1,57 @@
+import pygame
+
+# Layers, flushed in this order (terrain is drawn by the ChunkRenderer's scroll buffer)
+OBJECT_LAYER = 0 # Containers and items on the ground
+ENTITY_LAYER = 1 # Zombies
+LAYER_COUNT = 2
+
+class RenderQueue:
+    """
+    Collects the world blits of a frame per layer and submits each layer with
+    a single Surface.fblits (pygame-ce) or Surface.blits call, instead of one
+    Python -> SDL call per sprite. Commands that fall outside the view are
+    dropped (culled) on submit.
+    """
+    def __init__(self):
+        self.layers = [[] for _ in range(LAYER_COUNT)]
+        self.view_rect = pygame.Rect(0, 0, 0, 0)
+        self.submitted = 0
+        self.culled = 0
+        self.batches = 0
+        self.last_stats = {'submitted': 0, 'culled': 0, 'batches': 0}
+
+    def begin(self, view_w, view_h):
+        """Starts a new frame; the previous frame's counters move to last_stats."""
+        self.last_stats = {'submitted': self.submitted, 'culled': self.culled, 'batches': self.batches}
+        for layer in self.layers:
+            layer.clear()
+        self.view_rect.size = (view_w, view_h)
+        self.submitted = 0
+        self.culled = 0
+        self.batches = 0
+
+    def submit(self, layer, image, dest):
+        """Queues `image` at `dest` (a Rect or a topleft position) on a layer."""
+        if isinstance(dest, pygame.Rect):
+            x, y = dest.topleft
+        else:
+            x, y = dest
+        width, height = image.get_size()
+        view = self.view_rect
+        if x >= view.right or y >= view.bottom or x + width <= 0 or y + height <= 0:
+            self.culled += 1
+            return
+        self.layers[layer].append((image, (x, y)))
+        self.submitted += 1
+
+    def flush(self, target, layer):
+        """Blits every queued command of a layer onto `target` in one call."""
+        commands = self.layers[layer]
+        if not commands:
+            return
+        if hasattr(target, 'fblits'):
+            target.fblits(commands)
+        else:
+            target.blits(commands, doreturn=False)
+        self.batches += 1
+        commands.clear()
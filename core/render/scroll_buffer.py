@@ -0,0 +1,116 @@
+import math
+import pygame
+from data.config import *
+
+SCROLL_MARGIN_TILES = 4 # Extra terrain kept around the view on each side, in tiles
+
+class TerrainScrollBuffer:
+    """
+    An oversized surface holding the baked terrain around the camera, at the
+    current zoom. While the view stays inside it, drawing the terrain is a
+    single blit. When the view reaches the edge, the buffer is scrolled in
+    place and only the newly exposed strips are redrawn from the chunks.
+
+    Positions are in "zoomed pixels": floor(world * zoom), the same grid the
+    Camera maps onto the screen (screen = zoomed + camera offset).
+    """
+    def __init__(self, chunk_renderer, margin_tiles=SCROLL_MARGIN_TILES):
+        self.chunk_renderer = chunk_renderer
+        self.margin_tiles = margin_tiles
+        self.surface = None
+        self.zoom = None
+        self.origin_x = 0 # Zoomed pixel at the buffer's (0, 0)
+        self.origin_y = 0
+        self.dirty_rects = [] # Zoomed-pixel rects to redraw before the next blit
+        self.redrawn_pixels = 0 # Terrain pixels redrawn during the last draw
+
+    def invalidate_all(self):
+        self.zoom = None # Forces a full redraw on the next draw
+
+    def invalidate_world_rect(self, world_rect):
+        """Marks a world-pixel area (e.g. a changed tile) for redraw."""
+        if self.zoom is None:
+            return
+        left = int(math.floor(world_rect.left * self.zoom))
+        top = int(math.floor(world_rect.top * self.zoom))
+        right = int(math.floor(world_rect.right * self.zoom))
+        bottom = int(math.floor(world_rect.bottom * self.zoom))
+        self.dirty_rects.append(pygame.Rect(left, top, right - left, bottom - top))
+
+    def _render(self, zoomed_rect):
+        """Redraws a zoomed-pixel area of the buffer from the baked chunks."""
+        area = zoomed_rect.move(-self.origin_x, -self.origin_y).clip(self.surface.get_rect())
+        if area.width <= 0 or area.height <= 0:
+            return
+        self.redrawn_pixels += area.width * area.height
+
+        renderer = self.chunk_renderer
+        chunk_zoomed_px = renderer.chunk_px * self.zoom
+        left = area.left + self.origin_x
+        top = area.top + self.origin_y
+        first_cx = max(0, int(left // chunk_zoomed_px))
+        first_cy = max(0, int(top // chunk_zoomed_px))
+        last_cx = min(renderer.chunks_w - 1, int((left + area.width - 1) // chunk_zoomed_px))
+        last_cy = min(renderer.chunks_h - 1, int((top + area.height - 1) // chunk_zoomed_px))
+
+        self.surface.set_clip(area)
+        self.surface.fill(GAME_BG_COLOR, area)
+        blits = []
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                chunk_x = int(math.floor(cx * renderer.chunk_px * self.zoom)) - self.origin_x
+                chunk_y = int(math.floor(cy * renderer.chunk_px * self.zoom)) - self.origin_y
+                blits.append((renderer.get_scaled_chunk_surface((cx, cy), self.zoom), (chunk_x, chunk_y)))
+        self.surface.blits(blits, doreturn=False)
+        self.surface.set_clip(None)
+
+    def _recenter(self, view_x, view_y, margin):
+        """Scrolls the buffer so the view sits in its middle, redrawing only the exposed strips."""
+        buffer_w, buffer_h = self.surface.get_size()
+        new_origin_x = view_x - margin
+        new_origin_y = view_y - margin
+        shift_x = self.origin_x - new_origin_x
+        shift_y = self.origin_y - new_origin_y
+        self.origin_x = new_origin_x
+        self.origin_y = new_origin_y
+
+        if abs(shift_x) >= buffer_w or abs(shift_y) >= buffer_h:
+            self._render(pygame.Rect(self.origin_x, self.origin_y, buffer_w, buffer_h))
+            return
+
+        self.surface.scroll(shift_x, shift_y)
+        if shift_x > 0:
+            self._render(pygame.Rect(self.origin_x, self.origin_y, shift_x, buffer_h))
+        elif shift_x < 0:
+            self._render(pygame.Rect(self.origin_x + buffer_w + shift_x, self.origin_y, -shift_x, buffer_h))
+        if shift_y > 0:
+            self._render(pygame.Rect(self.origin_x, self.origin_y, buffer_w, shift_y))
+        elif shift_y < 0:
+            self._render(pygame.Rect(self.origin_x, self.origin_y + buffer_h + shift_y, buffer_w, -shift_y))
+
+    def draw(self, target, camera):
+        """Blits the terrain under the camera onto `target`."""
+        self.redrawn_pixels = 0
+        view_w, view_h = camera.view_w, camera.view_h
+        view_x, view_y = -camera.offset_x, -camera.offset_y # Zoomed pixel at the screen's (0, 0)
+        margin = int(self.margin_tiles * TILE_SIZE * camera.zoom)
+        size = (view_w + margin * 2, view_h + margin * 2)
+
+        if self.surface is None or self.surface.get_size() != size or self.zoom != camera.zoom:
+            # First frame, zoom change or full invalidation: redraw everything
+            if self.surface is None or self.surface.get_size() != size:
+                self.surface = pygame.Surface(size).convert()
+            self.zoom = camera.zoom
+            self.origin_x = view_x - margin
+            self.origin_y = view_y - margin
+            self.dirty_rects = []
+            self._render(pygame.Rect(self.origin_x, self.origin_y, size[0], size[1]))
+        else:
+            if view_x < self.origin_x or view_y < self.origin_y or \
+               view_x + view_w > self.origin_x + size[0] or view_y + view_h > self.origin_y + size[1]:
+                self._recenter(view_x, view_y, margin)
+            for rect in self.dirty_rects:
+                self._render(rect)
+            self.dirty_rects = []
+
+        target.blit(self.surface, (0, 0), pygame.Rect(view_x - self.origin_x, view_y - self.origin_y, view_w, view_h))
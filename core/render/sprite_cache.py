@@ -0,0 +1,106 @@
+import pygame
+from collections import OrderedDict
+
+FADE_LEVELS = 32 # Distinct opacity steps between fully transparent and opaque
+MAX_FADE_SPRITES = 2048 # Faded variants kept before the least recently used is dropped
+MAX_SCALED_SPRITES = 2048 # Zoom-scaled variants kept before the least recently used is dropped
+
+class FadeCache:
+    """
+    Caches distance-faded copies of sprites, keyed by (source surface, opacity
+    level). Opacity is quantized to FADE_LEVELS steps so a sprite only ever has
+    a handful of variants instead of a fresh copy every frame.
+    """
+    def __init__(self, levels=FADE_LEVELS, max_size=MAX_FADE_SPRITES):
+        self.levels = levels
+        self.max_size = max_size
+        self.sprites = OrderedDict() # (surface, level) -> faded Surface (LRU order)
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, opacity):
+        """Maps an opacity (0-255) to its level index (0 to levels - 1)."""
+        opacity = max(0, min(255, opacity))
+        return int(round(opacity * (self.levels - 1) / 255))
+
+    def get(self, surface, opacity):
+        """Returns `surface` multiplied by the quantized opacity."""
+        level = self.quantize(opacity)
+        if level == self.levels - 1:
+            return surface # Fully opaque, nothing to fade
+
+        key = (surface, level)
+        faded = self.sprites.get(key)
+        if faded is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return faded
+
+        self.misses += 1
+        alpha = level * 255 // (self.levels - 1)
+        faded = surface.copy()
+        faded.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        self.sprites[key] = faded
+        if len(self.sprites) > self.max_size:
+            self.sprites.popitem(last=False)
+        return faded
+
+    def clear(self):
+        self.sprites.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.sprites),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+class ScaleCache:
+    """
+    Caches sprites pre-scaled (nearest neighbour, so pixel art stays crisp) for
+    each discrete zoom level, keyed by (source surface, zoom).
+    """
+    def __init__(self, max_size=MAX_SCALED_SPRITES):
+        self.max_size = max_size
+        self.sprites = OrderedDict() # (surface, zoom) -> scaled Surface (LRU order)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, surface, zoom):
+        """Returns `surface` scaled by `zoom` (expected to be already snapped to a level)."""
+        if zoom == 1:
+            return surface
+
+        key = (surface, zoom)
+        scaled = self.sprites.get(key)
+        if scaled is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return scaled
+
+        self.misses += 1
+        width, height = surface.get_size()
+        size = (max(1, int(round(width * zoom))), max(1, int(round(height * zoom))))
+        scaled = pygame.transform.scale(surface, size)
+        self.sprites[key] = scaled
+        if len(self.sprites) > self.max_size:
+            self.sprites.popitem(last=False)
+        return scaled
+
+    def clear(self):
+        self.sprites.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.sprites),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+# Shared by the world renderer and entity draw methods
+FADE_CACHE = FadeCache()
+SCALE_CACHE = ScaleCache()
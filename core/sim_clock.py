@@ -0,0 +1,57 @@
+import time
+
+SIM_STEP_MS = 1000 / 60 # One simulation step; speeds and frame counters were tuned for 60 FPS frames, so they stay per step
+MAX_STEPS_PER_FRAME = 5 # Catch-up budget: after a longer hitch the game slows down instead of spiraling
+
+class SimClock:
+    """
+    The simulation's only time source. Game.run_playing feeds it the real
+    time between rendered frames and runs one fixed step of update_game_state
+    for every SIM_STEP_MS banked in the accumulator (at most
+    MAX_STEPS_PER_FRAME per frame). Simulation code asks this clock instead
+    of pygame.time.get_ticks / time.time, so a slow frame no longer slows
+    the game and a fast-forward (Game.fast_forward) runs it faster than real
+    time. Frame counters (reload_timer, cooldowns...) count steps.
+    Time only passes while steps run: pauses and menus stop it.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Back to step 0, for a new game (step deadlines and timestamps start over)."""
+        self.steps = 0 # Steps run since the game started
+        self.accumulator = 0.0 # Real milliseconds not simulated yet
+        self.last_frame = None # perf_counter() of the previous frame, None after a hold
+
+    def get_ticks(self):
+        """Simulated milliseconds since the game started, like pygame.time.get_ticks."""
+        return int(self.steps * SIM_STEP_MS)
+
+    def time(self):
+        """Simulated seconds since the game started, for code that used time.time."""
+        return self.steps * SIM_STEP_MS / 1000
+
+    def begin_frame(self):
+        """Banks the real time since the previous frame (capped to the catch-up budget)."""
+        now = time.perf_counter()
+        elapsed = SIM_STEP_MS if self.last_frame is None else (now - self.last_frame) * 1000
+        self.last_frame = now
+        self.accumulator = min(self.accumulator + elapsed, MAX_STEPS_PER_FRAME * SIM_STEP_MS)
+
+    def hold(self):
+        """Called on frames that don't simulate (pause, menus), so leaving them doesn't catch up."""
+        self.last_frame = None
+        self.accumulator = 0.0
+
+    def step_due(self):
+        return self.accumulator >= SIM_STEP_MS
+
+    def advance(self):
+        self.steps += 1
+        self.accumulator = max(0.0, self.accumulator - SIM_STEP_MS)
+
+    def alpha(self):
+        """How far the render time is between the last two steps (0-1), for interpolation."""
+        return min(1.0, self.accumulator / SIM_STEP_MS)
+
+SIM_CLOCK = SimClock()
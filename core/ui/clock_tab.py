@@ -1,5 +1,7 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
+from core.sim_clock import SIM_CLOCK
 
 def draw_clock_tab(surface, game, modal, assets):
     y_offset = modal['rect'].y + 80 # Position below header and tabs
@@ -12,7 +14,7 @@ def draw_clock_tab(surface, game, modal, assets):
     except Exception:
         hour_text = "Unknown"
     
-    hour_surf = large_font.render(hour_text, True, WHITE)
+    hour_surf = render_text(large_font, hour_text, True, WHITE)
     hour_rect = hour_surf.get_rect(centerx=modal['rect'].centerx, y=y_offset)
     surface.blit(hour_surf, hour_rect)
     
@@ -21,7 +23,7 @@ def draw_clock_tab(surface, game, modal, assets):
     # 2. Get Zombies Killed
     zombies_killed = game.zombies_killed
     kills_text = f"Kills: {zombies_killed}"
-    kills_surf = font.render(kills_text, True, WHITE)
+    kills_surf = render_text(font, kills_text, True, WHITE)
     kills_rect = kills_surf.get_rect(centerx=modal['rect'].centerx, y=y_offset)
     surface.blit(kills_surf, kills_rect)
 
@@ -29,7 +31,7 @@ def draw_clock_tab(surface, game, modal, assets):
 
     # 3. Get Time Alive
     try:
-        time_alive_ms = pygame.time.get_ticks() - game.game_start_time
+        time_alive_ms = SIM_CLOCK.get_ticks() - game.game_start_time
         total_seconds = time_alive_ms // 1000
         days = total_seconds // 86400
         hours = (total_seconds % 86400) // 3600
@@ -39,6 +41,6 @@ def draw_clock_tab(surface, game, modal, assets):
     except Exception:
         alive_text = "Survived: --"
         
-    alive_surf = font.render(alive_text, True, WHITE)
+    alive_surf = render_text(font, alive_text, True, WHITE)
     alive_rect = alive_surf.get_rect(centerx=modal['rect'].centerx, y=y_offset)
     surface.blit(alive_surf, alive_rect)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 from core.ui.modals import BaseModal
 
 def get_container_slot_rect(container_pos, i):
@@ -39,7 +40,7 @@ def _draw_slots(surface, game, container_item, start_x, start_y, modal_h, header
                 pygame.draw.rect(surface, item.color, slot_rect.inflate(-8, -8))
             
             if item.is_stackable and item.load is not None and item.load > 1:
-                stack_text = font_small.render(str(int(item.load)), True, WHITE)
+                stack_text = render_text(font_small, str(int(item.load)), True, WHITE)
                 text_rect = stack_text.get_rect(bottomright=(slot_rect.right - 5, slot_rect.bottom - 2))
                 surface.blit(stack_text, text_rect)
 
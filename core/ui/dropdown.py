@@ -1,5 +1,6 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 
 def draw_context_menu(surface, menu_state, mouse_pos):
     if not menu_state['active']:
@@ -30,5 +31,5 @@ def draw_context_menu(surface, menu_state, mouse_pos):
         if option_rect.collidepoint(mouse_pos):
             pygame.draw.rect(surface, GRAY_80, option_rect)
             text_color = YELLOW
-        text_surf = font.render(option, True, text_color)
+        text_surf = render_text(font, option, True, text_color)
         surface.blit(text_surf, (option_rect.x + padding, option_rect.y + (item_height - text_surf.get_height()) // 2))
\ No newline at end of file
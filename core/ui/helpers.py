@@ -3,6 +3,7 @@ import xml.etree.ElementTree as ET
 import os
 import xml.dom.minidom
 from data.config import *
+from core.ui.text_cache import render_text
 import data.player_xml_parser
 from core.entities.item.item import Item, ITEM_TEMPLATES
 from core.entities.zombie.zombie import Zombie
@@ -118,13 +119,13 @@ def draw_menu(screen, mouse_pos):
         title_rect = _logo_img.get_rect(center=(VIRTUAL_SCREEN_WIDTH // 2, VIRTUAL_GAME_HEIGHT // 4))
         screen.blit(_logo_img, title_rect)
     else:
-        title_text = title_font.render("Bit Rot", True, RED)
+        title_text = render_text(title_font, "Bit Rot", True, RED)
         title_rect = title_text.get_rect(center=(VIRTUAL_SCREEN_WIDTH // 2, VIRTUAL_GAME_HEIGHT // 4))
         screen.blit(title_text, title_rect)
 
-    start_text = large_font.render("START", True, WHITE)
+    start_text = render_text(large_font, "START", True, WHITE)
     start_rect = start_text.get_rect(center=(VIRTUAL_SCREEN_WIDTH // 2, VIRTUAL_GAME_HEIGHT // 2))
-    quit_text = large_font.render("QUIT", True, WHITE)
+    quit_text = render_text(large_font, "QUIT", True, WHITE)
     quit_rect = quit_text.get_rect(center=(VIRTUAL_SCREEN_WIDTH // 2, VIRTUAL_GAME_HEIGHT // 2 + 60))
     
     if start_rect.collidepoint(mouse_pos):
@@ -153,17 +154,17 @@ def draw_game_over(screen, zombies_killed, mouse_pos):
         title_rect = _logo_img.get_rect(center=(VIRTUAL_SCREEN_WIDTH // 2, VIRTUAL_GAME_HEIGHT // 4))
         screen.blit(_logo_img, title_rect)
     else:
-        title_text = title_font.render("YOU DIED", True, RED)
+        title_text = render_text(title_font, "YOU DIED", True, RED)
         title_rect = title_text.get_rect(center=(VIRTUAL_SCREEN_WIDTH // 2, VIRTUAL_GAME_HEIGHT // 4))
         screen.blit(title_text, title_rect)
 
-    score_text = large_font.render(f"Zombies Killed: {zombies_killed}", True, WHITE)
+    score_text = render_text(large_font, f"Zombies Killed: {zombies_killed}", True, WHITE)
     score_rect = score_text.get_rect(center=(VIRTUAL_SCREEN_WIDTH // 2, VIRTUAL_GAME_HEIGHT // 2 - 60))
     screen.blit(score_text, score_rect)
 
-    restart_text = large_font.render("Restart", True, WHITE)
+    restart_text = render_text(large_font, "Restart", True, WHITE)
     restart_rect = restart_text.get_rect(center=(VIRTUAL_SCREEN_WIDTH // 2, VIRTUAL_GAME_HEIGHT // 2 + 20))
-    quit_text = large_font.render("Quit", True, WHITE)
+    quit_text = render_text(large_font, "Quit", True, WHITE)
     quit_rect = quit_text.get_rect(center=(VIRTUAL_SCREEN_WIDTH // 2, VIRTUAL_GAME_HEIGHT // 2 + 80))
 
     if restart_rect.collidepoint(mouse_pos):
@@ -204,7 +205,7 @@ def _draw_dropdown(surface, state, slot_name, rect, mouse_pos):
     pygame.draw.rect(surface, WHITE, rect, 1)
     
     selected_item = state['chosen_clothes'].get(slot_name, "None") or "None"
-    text = font.render(selected_item, True, WHITE)
+    text = render_text(font, selected_item, True, WHITE)
     surface.blit(text, (rect.x + 5, rect.y + 5))
     
     # Draw arrow
@@ -266,7 +267,7 @@ def _draw_dropdown(surface, state, slot_name, rect, mouse_pos):
                 if option_rect_abs.collidepoint(mouse_pos):
                     pygame.draw.rect(content_surface, (70, 70, 70), option_rect_rel)
                 
-                text = font.render(option_name, True, WHITE)
+                text = render_text(font, option_name, True, WHITE)
                 content_surface.blit(text, (option_rect_rel.x + 5, option_rect_rel.y + 2))
             
             # Add the *absolute* screen rect for click detection
@@ -339,16 +340,16 @@ def _draw_player_build_screen(game, state, mouse_pos):
     pygame.draw.rect(game.virtual_screen, (30, 30, 30), preset_body_rect, border_bottom_left_radius=border_radius, border_bottom_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, GRAY_60, preset_header_rect, border_top_left_radius=border_radius, border_top_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, WHITE, preset_rect, 1, border_radius=border_radius)
-    game.virtual_screen.blit(font.render("Preset", True, WHITE), (preset_header_rect.x + 10, preset_header_rect.y + 7))
+    game.virtual_screen.blit(render_text(font, "Preset", True, WHITE), (preset_header_rect.x + 10, preset_header_rect.y + 7))
 
     # 1. Name Input
-    game.virtual_screen.blit(font.render("Player Name:", True, WHITE), (preset_body_rect.x + padding, preset_body_rect.y + 10))
+    game.virtual_screen.blit(render_text(font, "Player Name:", True, WHITE), (preset_body_rect.x + padding, preset_body_rect.y + 10))
     name_input_rect = pygame.Rect(preset_body_rect.x + padding, preset_body_rect.y + 35, preset_body_rect.width - padding*2, 30)
     pygame.draw.rect(game.virtual_screen, (50, 50, 50), name_input_rect)
     pygame.draw.rect(game.virtual_screen, WHITE, name_input_rect, 1)
     
     name_text = state.get('player_name', "Survivor")
-    text_surf = font.render(name_text, True, WHITE)
+    text_surf = render_text(font, name_text, True, WHITE)
     game.virtual_screen.blit(text_surf, (name_input_rect.x + 5, name_input_rect.y + 5))
     
     if state.get('name_input_active') and int(pygame.time.get_ticks() / 500) % 2 == 0:
@@ -364,17 +365,17 @@ def _draw_player_build_screen(game, state, mouse_pos):
     
     save_btn_rect = pygame.Rect(preset_body_rect.x + padding, preset_body_rect.y + 80, btn_width, 30)
     pygame.draw.rect(game.virtual_screen, GREEN, save_btn_rect)
-    game.virtual_screen.blit(font.render("Save", True, WHITE), (save_btn_rect.x + 20, save_btn_rect.y + 5))
+    game.virtual_screen.blit(render_text(font, "Save", True, WHITE), (save_btn_rect.x + 20, save_btn_rect.y + 5))
     clickable_rects['save_button'] = save_btn_rect
     
     random_btn_rect = pygame.Rect(save_btn_rect.right + btn_padding, preset_body_rect.y + 80, btn_width, 30)
     pygame.draw.rect(game.virtual_screen, (0, 100, 150), random_btn_rect) # Blue-ish color
-    game.virtual_screen.blit(font.render("Random", True, WHITE), (random_btn_rect.x + 10, random_btn_rect.y + 5))
+    game.virtual_screen.blit(render_text(font, "Random", True, WHITE), (random_btn_rect.x + 10, random_btn_rect.y + 5))
     clickable_rects['random_button'] = random_btn_rect
 
     delete_btn_rect = pygame.Rect(random_btn_rect.right + btn_padding, preset_body_rect.y + 80, btn_width, 30)
     pygame.draw.rect(game.virtual_screen, RED, delete_btn_rect)
-    game.virtual_screen.blit(font.render("Delete", True, WHITE), (delete_btn_rect.x + 15, delete_btn_rect.y + 5))
+    game.virtual_screen.blit(render_text(font, "Delete", True, WHITE), (delete_btn_rect.x + 15, delete_btn_rect.y + 5))
     clickable_rects['delete_button'] = delete_btn_rect
     
     # 3. Load Dropdown
@@ -382,7 +383,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
     clickable_rects['load_dropdown_button'] = load_dd_rect
     
     sex_y = load_dd_rect.bottom + 10
-    game.virtual_screen.blit(font.render("Sex:", True, WHITE), (preset_body_rect.x + padding, sex_y))
+    game.virtual_screen.blit(render_text(font, "Sex:", True, WHITE), (preset_body_rect.x + padding, sex_y))
     
     sex_btn_width = (preset_body_rect.width - (padding * 3)) // 2
     male_btn_rect = pygame.Rect(preset_body_rect.x + padding, sex_y + 25, sex_btn_width, 30)
@@ -397,7 +398,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
     else:
         pygame.draw.rect(game.virtual_screen, (50, 50, 50), male_btn_rect, 0, border_radius=3)
         pygame.draw.rect(game.virtual_screen, WHITE, male_btn_rect, 1, border_radius=3)
-    game.virtual_screen.blit(font.render("Male", True, WHITE), (male_btn_rect.centerx - 20, male_btn_rect.y + 5))
+    game.virtual_screen.blit(render_text(font, "Male", True, WHITE), (male_btn_rect.centerx - 20, male_btn_rect.y + 5))
     
     # Draw Female Button
     if current_sex == 'Female':
@@ -406,7 +407,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
     else:
         pygame.draw.rect(game.virtual_screen, (50, 50, 50), female_btn_rect, 0, border_radius=3)
         pygame.draw.rect(game.virtual_screen, WHITE, female_btn_rect, 1, border_radius=3)
-    game.virtual_screen.blit(font.render("Female", True, WHITE), (female_btn_rect.centerx - 28, female_btn_rect.y + 5))
+    game.virtual_screen.blit(render_text(font, "Female", True, WHITE), (female_btn_rect.centerx - 28, female_btn_rect.y + 5))
     
     clickable_rects['sex_buttons'] = {'Male': male_btn_rect, 'Female': female_btn_rect}
  
@@ -420,7 +421,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
     pygame.draw.rect(game.virtual_screen, (30, 30, 30), gear_body_rect, border_bottom_left_radius=border_radius, border_bottom_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, GRAY_60, gear_header_rect, border_top_left_radius=border_radius, border_top_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, WHITE, gear_rect, 1, border_radius=border_radius)
-    game.virtual_screen.blit(font.render("Clothes", True, WHITE), (gear_header_rect.x + 10, gear_header_rect.y + 7))
+    game.virtual_screen.blit(render_text(font, "Clothes", True, WHITE), (gear_header_rect.x + 10, gear_header_rect.y + 7))
 
     gear_content_rect = pygame.Rect(
         gear_rect.x + padding,
@@ -452,7 +453,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
             )
             
             if dropdown_rect.bottom > gear_content_rect.top and dropdown_rect.top < gear_content_rect.bottom:
-                gear_content_surface.blit(font.render(f"{slot_name.capitalize()}:", True, WHITE), (0, y_offset + 5))
+                gear_content_surface.blit(render_text(font, f"{slot_name.capitalize()}:", True, WHITE), (0, y_offset + 5))
                 dropdown_draw_list.append((slot_name, dropdown_rect))
             
             y_offset += 35 # Use fixed line height
@@ -466,15 +467,15 @@ def _draw_player_build_screen(game, state, mouse_pos):
     pygame.draw.rect(game.virtual_screen, (30, 30, 30), avail_body_rect, border_bottom_left_radius=border_radius, border_bottom_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, GRAY_60, avail_header_rect, border_top_left_radius=border_radius, border_top_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, WHITE, available_rect, 1, border_radius=border_radius)
-    game.virtual_screen.blit(font.render("Available Traits", True, WHITE), (avail_header_rect.x + 10, avail_header_rect.y + 7))
+    game.virtual_screen.blit(render_text(font, "Available Traits", True, WHITE), (avail_header_rect.x + 10, avail_header_rect.y + 7))
 
     y_offset = available_rect.y + 40
     for i, trait_name in enumerate(state['available_traits']):
         row_rect = pygame.Rect(available_rect.x + 10, y_offset, available_rect.width - 20, 30)
-        game.virtual_screen.blit(font.render(trait_name.capitalize(), True, WHITE), (row_rect.x, row_rect.y))
+        game.virtual_screen.blit(render_text(font, trait_name.capitalize(), True, WHITE), (row_rect.x, row_rect.y))
         add_btn_rect = pygame.Rect(row_rect.right - 25, row_rect.y, 25, 25)
         pygame.draw.rect(game.virtual_screen, GREEN, add_btn_rect)
-        game.virtual_screen.blit(font.render(">", True, WHITE), (add_btn_rect.x + 7, add_btn_rect.y + 2))
+        game.virtual_screen.blit(render_text(font, ">", True, WHITE), (add_btn_rect.x + 7, add_btn_rect.y + 2))
         clickable_rects["add_trait"].append((trait_name, add_btn_rect))
         y_offset += 35
         if y_offset > available_rect.bottom - 30: break
@@ -490,16 +491,16 @@ def _draw_player_build_screen(game, state, mouse_pos):
     pygame.draw.rect(game.virtual_screen, (30, 30, 30), body_rect, border_bottom_left_radius=border_radius, border_bottom_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, GRAY_60, header_rect, border_top_left_radius=border_radius, border_top_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, WHITE, chosen_rect, 1, border_radius=border_radius)
-    game.virtual_screen.blit(font.render("Chosen Traits", True, WHITE), (header_rect.x + 10, header_rect.y + 7)) # Adjusted y for padding
+    game.virtual_screen.blit(render_text(font, "Chosen Traits", True, WHITE), (header_rect.x + 10, header_rect.y + 7)) # Adjusted y for padding
 
     y_offset = chosen_rect.y + 40
     for i, trait_name in enumerate(state['chosen_traits']):
         row_rect = pygame.Rect(chosen_rect.x + 10, y_offset, chosen_rect.width - 20, 30)
         remove_btn_rect = pygame.Rect(row_rect.x, row_rect.y, 25, 25)
         pygame.draw.rect(game.virtual_screen, RED, remove_btn_rect)
-        game.virtual_screen.blit(font.render("<", True, WHITE), (remove_btn_rect.x + 7, remove_btn_rect.y + 2))
+        game.virtual_screen.blit(render_text(font, "<", True, WHITE), (remove_btn_rect.x + 7, remove_btn_rect.y + 2))
         clickable_rects["remove_trait"].append((trait_name, remove_btn_rect))
-        game.virtual_screen.blit(font.render(trait_name.capitalize(), True, WHITE), (remove_btn_rect.right + 10, row_rect.y))
+        game.virtual_screen.blit(render_text(font, trait_name.capitalize(), True, WHITE), (remove_btn_rect.right + 10, row_rect.y))
         y_offset += 35
         if y_offset > chosen_rect.bottom - 30: break
 
@@ -530,7 +531,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
     pygame.draw.rect(game.virtual_screen, (30, 30, 30), stats_body_rect, border_bottom_left_radius=border_radius, border_bottom_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, GRAY_60, stats_header_rect, border_top_left_radius=border_radius, border_top_right_radius=border_radius)
     pygame.draw.rect(game.virtual_screen, WHITE, stats_rect, 1, border_radius=border_radius)
-    game.virtual_screen.blit(font.render("Current Stats", True, WHITE), (stats_header_rect.x + 10, stats_header_rect.y + 7))
+    game.virtual_screen.blit(render_text(font, "Current Stats", True, WHITE), (stats_header_rect.x + 10, stats_header_rect.y + 7))
 
     stats_content_rect = pygame.Rect(stats_rect.x + padding, stats_rect.y + 40, stats_rect.width - (padding * 2) - 10, stats_rect.height - (padding * 2) - 30)
     state['stats_content_rect'] = stats_content_rect
@@ -581,8 +582,8 @@ def _draw_player_build_screen(game, state, mouse_pos):
             elif trait_mod < 0:
                 mod_color = (255, 100, 100) # Red
             
-            text_surf = font.render(f"{stat_name_str} {base_str}", True, WHITE)
-            mod_surf = font.render(f"| {trait_str}", True, mod_color)
+            text_surf = render_text(font, f"{stat_name_str} {base_str}", True, WHITE)
+            mod_surf = render_text(font, f"| {trait_str}", True, mod_color)
             
             content_surface.blit(text_surf, (text_x, y_offset + 3))
             content_surface.blit(mod_surf, (text_x + text_surf.get_width() + 10, y_offset + 3))
@@ -611,8 +612,8 @@ def _draw_player_build_screen(game, state, mouse_pos):
             elif trait_mod < 0:
                 mod_color = (255, 100, 100) # Red
             
-            text_surf = font.render(f"{attr_name_str} {base_str}", True, WHITE)
-            mod_surf = font.render(f"| {trait_str}", True, mod_color)
+            text_surf = render_text(font, f"{attr_name_str} {base_str}", True, WHITE)
+            mod_surf = render_text(font, f"| {trait_str}", True, mod_color)
             
             content_surface.blit(text_surf, (text_x, y_offset + 3))
             content_surface.blit(mod_surf, (text_x + text_surf.get_width() + 10, y_offset + 3))
@@ -641,7 +642,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
     pygame.draw.rect(game.virtual_screen, (0, 100, 0), start_btn_rect, border_top_left_radius=4, border_top_right_radius=4,border_bottom_left_radius=4, border_bottom_right_radius=4)
     if start_btn_rect.collidepoint(mouse_pos):
         pygame.draw.rect(game.virtual_screen, (0, 150, 0), start_btn_rect.inflate(-4, -4))
-    start_text = large_font.render("START GAME", True, WHITE)
+    start_text = render_text(large_font, "START GAME", True, WHITE)
     text_rect = start_text.get_rect(center=start_btn_rect.center)
     game.virtual_screen.blit(start_text, text_rect)
     clickable_rects["start_button"] = start_btn_rect
@@ -659,7 +660,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
     pygame.draw.rect(game.virtual_screen, (50, 50, 50), load_dd_rect)
     pygame.draw.rect(game.virtual_screen, WHITE, load_dd_rect, 1)
     selected_preset = state.get('selected_preset', "None")
-    game.virtual_screen.blit(font.render(selected_preset, True, WHITE), (load_dd_rect.x + 5, load_dd_rect.y + 5))
+    game.virtual_screen.blit(render_text(font, selected_preset, True, WHITE), (load_dd_rect.x + 5, load_dd_rect.y + 5))
     pygame.draw.polygon(game.virtual_screen, WHITE, [(load_dd_rect.right - 15, load_dd_rect.y + 10), (load_dd_rect.right - 5, load_dd_rect.y + 10), (load_dd_rect.right - 10, load_dd_rect.y + 15)])
     
     # 3. Draw OPEN Gear Dropdown List
@@ -699,7 +700,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
                     if option_rect_abs.bottom > content_rect.top and option_rect_abs.top < content_rect.bottom:
                         if option_rect_abs.collidepoint(mouse_pos):
                             pygame.draw.rect(content_surface, (70, 70, 70), option_rect_rel)
-                        text = font.render(option_name, True, WHITE)
+                        text = render_text(font, option_name, True, WHITE)
                         content_surface.blit(text, (option_rect_rel.x + 5, option_rect_rel.y + 2))
                     
                     clickable_rects['dropdown_options'].append((slot_name, option_name, option_rect_abs))
@@ -727,7 +728,7 @@ def _draw_player_build_screen(game, state, mouse_pos):
             if option_rect.collidepoint(mouse_pos):
                 pygame.draw.rect(game.virtual_screen, (70, 70, 70), option_rect)
             
-            text = font.render(option_name, True, WHITE)
+            text = render_text(font, option_name, True, WHITE)
             game.virtual_screen.blit(text, (option_rect.x + 5, option_rect.y + 2))
             clickable_rects["load_dropdown_options"].append((option_name, option_rect))
             y_offset += option_height
@@ -1,5 +1,6 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 from core.ui.modals import BaseModal
 from core.ui.tabs import Tabs # Import the Tabs class
 
@@ -26,13 +27,13 @@ def _draw_inventory_tab(surface, player, modal, assets, mouse_pos, base_modal):
                 pass
             
             if item.is_stackable and item.load is not None and item.load > 1:
-                stack_text = font_small.render(str(int(item.load)), True, WHITE)
+                stack_text = render_text(font_small, str(int(item.load)), True, WHITE)
                 text_rect = stack_text.get_rect(bottomright=(slot_rect.right - 5, slot_rect.bottom - 2))
                 surface.blit(stack_text, text_rect)
 
     backpack_slot_rect = get_backpack_slot_rect(modal['position'])
     pygame.draw.rect(surface, GRAY_40, backpack_slot_rect, 0, 3)
-    surface.blit(font_small.render("Backpack", True, WHITE), (backpack_slot_rect.x + 1, backpack_slot_rect.y - 15))
+    surface.blit(render_text(font_small, "Backpack", True, WHITE), (backpack_slot_rect.x + 1, backpack_slot_rect.y - 15))
     if (backpack := player.backpack):
         pygame.draw.rect(surface, backpack.color, backpack_slot_rect, 2, 5)
         if backpack.image:
@@ -44,9 +45,9 @@ def _draw_inventory_tab(surface, player, modal, assets, mouse_pos, base_modal):
             text_x_offset = sprite_rect.right + 10
         else:
             text_x_offset = backpack_slot_rect.left + 10
-        item_name_text = font.render(f"{backpack.name}", True, backpack.color)
+        item_name_text = render_text(font, f"{backpack.name}", True, backpack.color)
         surface.blit(item_name_text, (text_x_offset, backpack_slot_rect.top + 5))
-        info_text = font.render(f"Slots: {backpack.capacity or 0}", True, WHITE)
+        info_text = render_text(font, f"Slots: {backpack.capacity or 0}", True, WHITE)
         surface.blit(info_text, (text_x_offset, backpack_slot_rect.top + 25))
     else:
         pygame.draw.rect(surface, GRAY, backpack_slot_rect, 1, 3)
@@ -54,7 +55,7 @@ def _draw_inventory_tab(surface, player, modal, assets, mouse_pos, base_modal):
     invcontainer_slot_rect = get_invcontainer_slot_rect(modal['position'])
     pygame.draw.rect(surface, GRAY_40, invcontainer_slot_rect, 0, 3)
 
-    surface.blit(font_small.render("", True, WHITE), (invcontainer_slot_rect.x + 1, invcontainer_slot_rect.y - 15))
+    surface.blit(render_text(font_small, "", True, WHITE), (invcontainer_slot_rect.x + 1, invcontainer_slot_rect.y - 15))
     if (invcontainer := player.invcontainer):
         pygame.draw.rect(surface, invcontainer.color, invcontainer_slot_rect, 2, 5)
         if invcontainer.image:
@@ -72,7 +73,7 @@ def _draw_inventory_tab(surface, player, modal, assets, mouse_pos, base_modal):
 
     belt_y_start = backpack_slot_rect.bottom + 15
     # This line caused the error. It now has access to base_modal.
-    surface.blit(font.render("", True, WHITE), (base_modal.modal_x + 10, belt_y_start))
+    surface.blit(render_text(font, "", True, WHITE), (base_modal.modal_x + 10, belt_y_start))
     for i in range(5):
         item = player.belt[i]
         slot_rect = get_belt_slot_rect_in_modal(i, modal['position'])
@@ -84,7 +85,7 @@ def _draw_inventory_tab(surface, player, modal, assets, mouse_pos, base_modal):
         else:
             pygame.draw.rect(surface, GRAY, slot_rect, 1, 3)
 
-        num_text = font_small.render(f"[{str(i + 1)}]", True, WHITE)
+        num_text = render_text(font_small, f"[{str(i + 1)}]", True, WHITE)
         surface.blit(num_text, (slot_rect.centerx - num_text.get_width() // 2, slot_rect.top - 15))
         if item:
             if item.image:
@@ -97,7 +98,7 @@ def _draw_inventory_tab(surface, player, modal, assets, mouse_pos, base_modal):
                 pygame.draw.rect(surface, item.color, slot_rect.inflate(-8, -8))
             
             if item.is_stackable and item.load is not None and item.load > 1:
-                stack_text = font_small.render(str(int(item.load)), True, WHITE)
+                stack_text = render_text(font_small, str(int(item.load)), True, WHITE)
                 text_rect = stack_text.get_rect(bottomright=(slot_rect.right - 5, slot_rect.bottom - 2))
                 surface.blit(stack_text, text_rect)
 
@@ -108,7 +109,7 @@ def _draw_inventory_tab(surface, player, modal, assets, mouse_pos, base_modal):
             active_weapon_text += f" | Dur: {player.active_weapon.durability:.0f}%"
         if player.active_weapon.item_type == 'weapon' and player.active_weapon.load is not None:
             active_weapon_text += f" | Ammo: {player.active_weapon.load:.0f}/{player.active_weapon.capacity:.0f}"
-    status_text = font_small.render(active_weapon_text, True, YELLOW)
+    status_text = render_text(font_small, active_weapon_text, True, YELLOW)
     surface.blit(status_text, (base_modal.modal_x + 10, belt_y_start + 80))
 
 # Helper function to get rects for the 'Gear' tab
@@ -159,7 +160,7 @@ def _draw_gear_tab(surface, player, modal, assets, mouse_pos):
         pygame.draw.rect(surface, GRAY, slot_rect, 1, 3)
 
         # Draw label
-        label_text = font_small.render(slot_name.upper(), True, GRAY)
+        label_text = render_text(font_small, slot_name.upper(), True, GRAY)
         label_rect = label_text.get_rect(centerx=slot_rect.centerx, y=slot_rect.bottom + 5)
         surface.blit(label_text, label_rect)
 
@@ -2,16 +2,9 @@
 
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
+from core.ui.minimap import Minimap
 
-# Define colors for the minimap
-MINIMAP_COLORS = {
-    ' ': (30, 30, 30),     # Empty/Background
-    'G': (30, 30, 30),    # Grass
-    'W': (30, 30, 30),    # Water
-    'R': (80, 80, 80),     # Road
-    'F': (30, 30, 30),     # Forest
-    'default': (80, 80, 80) # Default for walls/obstacles
-}
 MINIMAP_PLAYER_COLOR = (0, 255, 255) # Bright cyan for player
 
 def draw_map_tab(surface, game, modal, assets):
@@ -41,7 +34,7 @@ def draw_map_tab(surface, game, modal, assets):
     # --- 4. Get Map Data and Player Position ---
     map_data = getattr(game, 'map_data', [])
     if not map_data or not game.player:
-        text_surf = font.render("Map data not available.", True, GRAY)
+        text_surf = render_text(font, "Map data not available.", True, GRAY)
         text_rect = text_surf.get_rect(center=map_area_rect.center)
         surface.blit(text_surf, text_rect)
         return # Can't draw anything else
@@ -49,9 +42,6 @@ def draw_map_tab(surface, game, modal, assets):
     player_grid_x = game.player.rect.centerx // TILE_SIZE
     player_grid_y = game.player.rect.centery // TILE_SIZE
 
-    map_height = len(map_data)
-    map_width = len(map_data[0]) if map_height > 0 else 0
-
     # --- 5. Draw the Map (Clipped) ---
     # Create a subsurface for clipping
     try:
@@ -65,26 +55,11 @@ def draw_map_tab(surface, game, modal, assets):
     offset_y = (map_area_rect.height / 2) - (player_grid_y * map_zoom)
     
     modal['map_offset'] = (offset_x, offset_y)
-    
-    for y in range(map_height):
-        for x in range(map_width):
-            tile_char = map_data[y][x]
-            
-            # Simple char matching for color
-            base_char = tile_char[0].upper() if tile_char else ' '
-            color = MINIMAP_COLORS.get(base_char, MINIMAP_COLORS['default'])
-
-            # Calculate draw position *within the subsurface*
-            draw_x = offset_x + (x * map_zoom)
-            draw_y = offset_y + (y * map_zoom)
 
-            # Cull tiles outside the viewport
-            if draw_x + map_zoom < 0 or draw_x > map_area_rect.width or \
-               draw_y + map_zoom < 0 or draw_y > map_area_rect.height:
-                continue
-                
-            tile_rect = pygame.Rect(draw_x, draw_y, map_zoom, map_zoom)
-            pygame.draw.rect(map_surface, color, tile_rect)
+    # The layer is pre-rendered at 1px per tile, rebuilt only when the active layer changes
+    if game.minimap is None or game.minimap.map_data is not map_data:
+        game.minimap = Minimap(map_data)
+    game.minimap.draw(map_surface, offset_x, offset_y, map_zoom)
 
     # --- 6. Draw Player Icon (on top) ---
     player_draw_x = offset_x + (player_grid_x * map_zoom)
@@ -103,14 +78,14 @@ def draw_map_tab(surface, game, modal, assets):
     # Draw Zoom In (+)
     pygame.draw.rect(surface, GRAY_60, zoom_in_rect, 0, 3)
     pygame.draw.rect(surface, WHITE, zoom_in_rect, 1, 3)
-    plus_surf = large_font.render("+", True, WHITE)
+    plus_surf = render_text(large_font, "+", True, WHITE)
     plus_rect = plus_surf.get_rect(center=zoom_in_rect.center)
     surface.blit(plus_surf, plus_rect)
 
     # Draw Zoom Out (-)
     pygame.draw.rect(surface, GRAY_60, zoom_out_rect, 0, 3)
     pygame.draw.rect(surface, WHITE, zoom_out_rect, 1, 3)
-    minus_surf = large_font.render("-", True, WHITE)
+    minus_surf = render_text(large_font, "-", True, WHITE)
     minus_rect = minus_surf.get_rect(center=zoom_out_rect.center)
     surface.blit(minus_surf, minus_rect)
     
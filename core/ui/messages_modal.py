@@ -1,5 +1,6 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 from core.ui.modals import BaseModal
 
 _message_icon = None
@@ -45,7 +46,7 @@ def draw_messages_modal(surface, game, modal, assets):
     # Draw messages adjusted by scroll offset
     y_pos = 0 - scroll_offset_y # Start drawing from the scrolled position
     for msg_text in reversed(game.message_log): # Newest messages first still works
-        text_surface = font_small.render(msg_text, True, WHITE)
+        text_surface = render_text(font_small, msg_text, True, WHITE)
         # Calculate draw position *within the content_surface*
         draw_pos_in_subsurface = (0, y_pos) # X is always 0 in the subsurface
 
@@ -0,0 +1,80 @@
+import pygame
+from data.config import *
+
+# Define colors for the minimap
+MINIMAP_COLORS = {
+    ' ': (30, 30, 30),     # Empty/Background
+    'G': (30, 30, 30),    # Grass
+    'W': (30, 30, 30),    # Water
+    'R': (80, 80, 80),     # Road
+    'F': (30, 30, 30),     # Forest
+    'default': (80, 80, 80) # Default for walls/obstacles
+}
+
+# One palette entry per distinct minimap color
+MINIMAP_PALETTE = list(dict.fromkeys(MINIMAP_COLORS.values()))
+
+def _palette_index(tile_char):
+    base_char = tile_char[0].upper() if tile_char else ' '
+    return MINIMAP_PALETTE.index(MINIMAP_COLORS.get(base_char, MINIMAP_COLORS['default']))
+
+class Minimap:
+    """
+    A layer's map_data rendered once at 1 pixel per tile into an 8-bit
+    palettized surface. The map tab crops and scales it for its zoom level,
+    and door toggles patch single pixels instead of rebuilding it.
+    The scaled crop is kept until the crop, zoom or version (bumped by
+    update_tile) changes, so most frames only blit it.
+    """
+    def __init__(self, map_data):
+        self.map_data = map_data
+        self.height = len(map_data)
+        self.width = max((len(row) for row in map_data), default=0)
+        self.indices = {} # tile id -> palette index, each distinct id is classified once
+        self.version = 0 # Bumped on every update_tile
+        self.scaled = None # Last scaled crop
+        self.scaled_key = None # (first_x, first_y, last_x, last_y, tile_size, version) it was made for
+
+        # Rows are translated to palette indices with map(), not per-cell Python code
+        lookup = self._lookup
+        empty = self._lookup(' ')
+        self.pixels = bytearray()
+        for row in map_data:
+            self.pixels += bytes(map(lookup, row))
+            self.pixels += bytes([empty]) * (self.width - len(row)) # Ragged rows
+        self.surface = None
+        if self.width and self.height:
+            self.surface = pygame.image.frombuffer(self.pixels, (self.width, self.height), 'P') # Shares self.pixels
+            self.surface.set_palette(MINIMAP_PALETTE)
+
+    def _lookup(self, tile_char):
+        index = self.indices.get(tile_char)
+        if index is None:
+            index = self.indices[tile_char] = _palette_index(tile_char)
+        return index
+
+    def update_tile(self, grid_x, grid_y):
+        """Re-reads one cell of map_data, e.g. after a door was opened or closed."""
+        if not (0 <= grid_y < self.height and 0 <= grid_x < len(self.map_data[grid_y])):
+            return
+        self.pixels[grid_y * self.width + grid_x] = self._lookup(self.map_data[grid_y][grid_x])
+        self.version += 1
+
+    def draw(self, surface, offset_x, offset_y, tile_size):
+        """Draws the tiles visible on `surface`, tile (0, 0) at (offset_x, offset_y), tile_size pixels per tile."""
+        if self.surface is None:
+            return
+        area_w, area_h = surface.get_size()
+        first_x = max(0, int(-offset_x // tile_size))
+        first_y = max(0, int(-offset_y // tile_size))
+        last_x = min(self.width, int((area_w - offset_x) // tile_size) + 1)
+        last_y = min(self.height, int((area_h - offset_y) // tile_size) + 1)
+        if first_x >= last_x or first_y >= last_y:
+            return
+
+        key = (first_x, first_y, last_x, last_y, tile_size, self.version)
+        if key != self.scaled_key:
+            crop = self.surface.subsurface((first_x, first_y, last_x - first_x, last_y - first_y))
+            self.scaled = pygame.transform.scale(crop, (crop.get_width() * tile_size, crop.get_height() * tile_size))
+            self.scaled_key = key
+        surface.blit(self.scaled, (offset_x + first_x * tile_size, offset_y + first_y * tile_size))
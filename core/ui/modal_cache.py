@@ -0,0 +1,150 @@
+import pygame
+from data.config import *
+from core.sim_clock import SIM_CLOCK
+from core.ui.modals import modal_dimensions
+
+class ModalSurfaceCache:
+    """
+    Keeps each open modal rendered on its own transparent surface, so a modal
+    whose state did not change costs one blit instead of a full redraw.
+    - The draw functions work in screen coordinates, so a redraw goes to one
+      shared screen-sized scratch surface and the modal's own area (see
+      modal_area) is copied into a surface of just that size.
+    - A modal is redrawn only when the key passed to draw() changes, see
+      modal_state_key() for what goes into it.
+    - The draw function's return value (buttons, tooltips) is cached with the
+      surface, since the input code reads it every frame.
+    """
+    def __init__(self, size=(VIRTUAL_SCREEN_WIDTH, VIRTUAL_GAME_HEIGHT)):
+        self.size = size
+        self.scratch = None # Shared screen-sized SRCALPHA surface the draw functions render into
+        self.entries = {} # modal id -> {'surface', 'key', 'area', 'result'}
+        self.nearby_key = None # (ui_version, player center) the nearby containers were found for
+        self.nearby = []
+        self.redraws = 0
+        self.reuses = 0
+
+    def draw(self, target, modal_id, area, key, draw_fn):
+        """
+        Blits the modal's `area` onto `target`, calling draw_fn(surface) first
+        if the cached copy is missing or its key changed. Returns draw_fn's result.
+        """
+        area = area.clip(pygame.Rect((0, 0), self.size))
+        entry = self.entries.get(modal_id)
+        if entry is None or entry['surface'].get_size() != area.size:
+            entry = {'surface': pygame.Surface(area.size, pygame.SRCALPHA), 'key': None, 'area': None, 'result': None}
+            self.entries[modal_id] = entry
+
+        if entry['key'] != key or entry['area'] != area:
+            self.redraws += 1
+            if self.scratch is None:
+                self.scratch = pygame.Surface(self.size, pygame.SRCALPHA)
+            self.scratch.fill((0, 0, 0, 0), area)
+            entry['result'] = draw_fn(self.scratch)
+            surface = entry['surface']
+            surface.fill((0, 0, 0, 0))
+            surface.blit(self.scratch, (0, 0), area, special_flags=pygame.BLEND_RGBA_MAX) # Exact copy, alpha included
+            entry['area'] = area
+            entry['key'] = key
+        else:
+            self.reuses += 1
+
+        if area.width and area.height:
+            target.blit(entry['surface'], area.topleft)
+        return entry['result']
+
+    def nearby_containers(self, game):
+        """game.find_nearby_containers(), only re-run when the player moved or the UI version changed."""
+        key = (game.ui_version, game.player.rect.center)
+        if key != self.nearby_key:
+            self.nearby = game.find_nearby_containers()
+            self.nearby_key = key
+        return self.nearby
+
+    def prune(self, modals):
+        """Drops the surfaces of modals that were closed."""
+        open_ids = {modal['id'] for modal in modals}
+        for modal_id in [modal_id for modal_id in self.entries if modal_id not in open_ids]:
+            del self.entries[modal_id]
+
+    def clear(self):
+        self.entries.clear()
+        self.nearby_key = None
+
+    def stats(self):
+        draws = self.redraws + self.reuses
+        return {
+            'size': len(self.entries),
+            'redraws': self.redraws,
+            'reuses': self.reuses,
+            'reuse_rate': self.reuses / draws if draws else 0.0
+        }
+
+def _item_state(item):
+    """What an item slot shows: identity, stack, wear, on/off and, for containers, their contents."""
+    if item is None:
+        return None
+    contents = getattr(item, 'inventory', None)
+    durability = round(item.durability) if item.durability is not None else None # Shown as whole numbers
+    return (item.id, item.load, durability, item.state,
+            tuple(_item_state(child) for child in contents) if contents is not None else None)
+
+def player_state_key(game):
+    """
+    Everything about the player and the world that modals display, computed
+    once per frame and shared by every modal key.
+    """
+    player = game.player
+    progression = player.progression
+    # Stats as the status tab shows them: whole percents and 100px bar widths
+    stats = tuple((int(value), int(100 * value / max_value)) for value, max_value in (
+        (player.health, player.max_health), (player.stamina, player.max_stamina),
+        (player.water, 100), (player.food, 100), (player.infection, 100),
+        (player.anxiety, 100), (player.tireness, 100)))
+    return (
+        stats,
+        tuple(str(getattr(progression, name)) for name in ('strength', 'fitness', 'melee', 'ranged', 'lucky', 'speed')),
+        tuple(_item_state(item) for item in player.inventory),
+        tuple(_item_state(item) for item in player.belt),
+        tuple(_item_state(player.clothes[slot]) for slot in player.clothes_slots),
+        _item_state(player.backpack), _item_state(player.invcontainer),
+        player.active_weapon.id if player.active_weapon else None,
+        game.zombies_killed
+    )
+
+def modal_state_key(game, modal, player_key, mouse_pos):
+    """
+    The cache key for one modal: its own dict state, the shared player state,
+    game.ui_version (bumped by every click and key press, and by the
+    changes made outside input: new messages, door toggles, zombie loot)
+    and, while the cursor is over the modal, the cursor position for hover
+    effects.
+    """
+    rect = modal.get('rect')
+    over_modal = rect is not None and rect.collidepoint(mouse_pos)
+    key = (
+        game.ui_version, player_key,
+        tuple(modal['position']), tuple(rect) if rect is not None else None,
+        modal.get('minimized', False), modal.get('is_active', False), modal.get('active_tab'),
+        modal.get('scroll_offset_y'), modal.get('map_zoom'), modal.get('is_dragging_scrollbar'),
+        game.is_dragging, mouse_pos if over_modal or game.is_dragging else None
+    )
+
+    modal_type = modal['type']
+    if modal_type == 'container':
+        key += (_item_state(modal['item']),)
+    elif modal_type == 'nearby':
+        # Their contents only change with a game.ui_version bump
+        key += (tuple(id(container) for container in game.modal_cache.nearby_containers(game)),)
+    elif modal_type == 'mobile':
+        # Clock tab shows the hour and survived time, map tab follows the player tile
+        survived_minutes = (SIM_CLOCK.get_ticks() - game.game_start_time) // 60000
+        key += (game.world_time.current_hour, survived_minutes,
+                game.player.rect.centerx // TILE_SIZE, game.player.rect.centery // TILE_SIZE,
+                id(getattr(game, 'map_data', None)))
+    return key
+
+def modal_area(modal):
+    """The screen area a modal draws into: its position and full size (minimized ones only draw the header)."""
+    width, height = modal_dimensions(modal['type'])
+    return pygame.Rect(modal['position'], (width, height))
@@ -1,5 +1,23 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
+
+def modal_dimensions(modal_type):
+    if modal_type == 'inventory':
+        return INVENTORY_MODAL_WIDTH, INVENTORY_MODAL_HEIGHT
+    elif modal_type == 'status':
+        return STATUS_MODAL_WIDTH, STATUS_MODAL_HEIGHT
+    elif modal_type == 'container':
+        return 300, 300
+    elif modal_type == 'nearby':
+        return NEARBY_MODAL_WIDTH, NEARBY_MODAL_HEIGHT
+    elif modal_type == 'messages':
+        return MESSAGES_MODAL_WIDTH, MESSAGES_MODAL_HEIGHT
+    elif modal_type == 'text':
+        return TEXT_MODAL_WIDTH, TEXT_MODAL_HEIGHT
+    elif modal_type == 'mobile':
+        return MOBILE_MODAL_WIDTH, MOBILE_MODAL_HEIGHT
+    return 300, 300
 
 class BaseModal:
     def __init__(self, surface, modal, assets, title):
@@ -17,21 +35,7 @@ class BaseModal:
         self.minimize_button_rect = self.assets['minimize_button'].get_rect(topright=(self.close_button_rect.left - 10, self.modal_y + 10))
 
     def get_modal_dimensions(self):
-        if self.modal['type'] == 'inventory':
-            return INVENTORY_MODAL_WIDTH, INVENTORY_MODAL_HEIGHT
-        elif self.modal['type'] == 'status':
-            return STATUS_MODAL_WIDTH, STATUS_MODAL_HEIGHT
-        elif self.modal['type'] == 'container':
-            return 300, 300
-        elif self.modal['type'] == 'nearby':
-            return NEARBY_MODAL_WIDTH, NEARBY_MODAL_HEIGHT
-        elif self.modal['type'] == 'messages':
-            return MESSAGES_MODAL_WIDTH, MESSAGES_MODAL_HEIGHT
-        elif self.modal['type'] == 'text':
-            return TEXT_MODAL_WIDTH, TEXT_MODAL_HEIGHT
-        elif self.modal['type'] == 'mobile':
-            return MOBILE_MODAL_WIDTH, MOBILE_MODAL_HEIGHT
-        return 300, 300
+        return modal_dimensions(self.modal['type'])
 
     def draw_header(self):
         header_rect = pygame.Rect(self.modal_x, self.modal_y, self.modal_w, self.header_h)
@@ -44,7 +48,7 @@ class BaseModal:
         pygame.draw.rect(self.surface, header_color, header_rect, 0, border_top_left_radius=4, border_top_right_radius=4)
         pygame.draw.rect(self.surface, border_color, header_rect, 1, border_top_left_radius=4, border_top_right_radius=4)
         
-        title_text = font.render(self.title, True, WHITE)
+        title_text = render_text(font, self.title, True, WHITE)
 
         self.surface.blit(title_text, (self.modal_x + 10, self.modal_y + 10))
         self.surface.blit(self.assets['close_button'], self.close_button_rect)
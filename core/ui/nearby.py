@@ -1,5 +1,6 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 from core.ui.modals import BaseModal
 from core.ui.tabs import Tabs
 from core.ui.container import draw_container_content
@@ -17,7 +18,7 @@ def draw_nearby_modal(surface, game, modal, assets, mouse_pos):
     nearby_containers = game.find_nearby_containers()
 
     if not nearby_containers:
-        no_containers_text = font.render("No containers nearby.", True, WHITE)
+        no_containers_text = render_text(font, "No containers nearby.", True, WHITE)
         surface.blit(no_containers_text, (base_modal.modal_x + 10, base_modal.modal_y + base_modal.header_h + 30 + 10)) # Position below header+tabs
         modal['content_rect'] = None # No content rect when empty
         modal['tabs_data'] = [] # Ensure tabs_data is empty
@@ -0,0 +1,98 @@
+import pygame
+from data.config import *
+
+OVERLAY_REFRESH_FRAMES = 15 # The panel is re-rendered 4 times a second at 60 FPS
+OVERLAY_WIDTH = 320
+OVERLAY_POSITION = (GAME_OFFSET_X + (GAME_WIDTH - OVERLAY_WIDTH) // 2, 10) # Top center, clear of the side buttons and modals
+SPARKLINE_HEIGHT = 40
+SPARKLINE_MAX_MS = 50.0 # Frame time at the top of the sparkline
+FRAME_BUDGET_MS = 1000 / 60
+
+# Top-level phases in the order run_playing goes through them
+PHASE_GROUPS = ('time', 'input', 'update', 'draw', 'overlay', 'present', 'idle')
+
+class ProfilerOverlay:
+    """
+    F3 overlay over the game view: rolling per-phase timings from the game's
+    FrameProfiler, entity counts and a frame-time sparkline. The panel is
+    rendered into its own surface every OVERLAY_REFRESH_FRAMES frames and
+    blitted in between. Its numbers change constantly, so it renders with
+    font.render directly instead of filling the shared TEXT_CACHE.
+    """
+    def __init__(self):
+        self.surface = None
+        self.frames_until_refresh = 0
+
+    def reset(self):
+        self.surface = None
+        self.frames_until_refresh = 0
+
+    def draw(self, target, game):
+        self.frames_until_refresh -= 1
+        if self.surface is None or self.frames_until_refresh <= 0:
+            self.surface = self._render(game)
+            self.frames_until_refresh = OVERLAY_REFRESH_FRAMES
+        target.blit(self.surface, OVERLAY_POSITION)
+
+    def _lines(self, game):
+        """(label, value, color, indent) rows: phase groups with their sub-phases, then counters."""
+        profiler = game.profiler
+        averages = profiler.averages()
+        groups = profiler.group_averages()
+        total = averages.get('total', 0.0)
+        idle = averages.get('idle', 0.0)
+        work = total - idle
+        fps = 1000 / total if total else 0.0
+
+        work_color = GREEN if work <= FRAME_BUDGET_MS else (YELLOW if work <= FRAME_BUDGET_MS * 2 else RED)
+        lines = [(f"{fps:.1f} FPS", f"frame {total:.2f} ms, work {work:.2f} ms", work_color, 0)]
+
+        names = profiler.phase_names()
+        for group in PHASE_GROUPS:
+            if group not in groups:
+                continue
+            lines.append((group, f"{groups[group]:.2f} ms", WHITE, 0))
+            for name in names:
+                if name.startswith(group + '.'):
+                    lines.append((name.split('.', 1)[1], f"{averages[name]:.2f} ms", GRAY, 1))
+
+        queue_stats = game.render_queue.last_stats
+        lines.append((f"zombies {len(game.zombies)}, projectiles {len(game.projectiles)}", None, WHITE, 0))
+        if game.zombie_simulation:
+            lines.append(("zombie AI (numpy) chase / wander / still", "{} / {} / {}".format(*game.ai_horde_counts), WHITE, 0))
+        else:
+            lines.append(("zombie AI near / mid / far", "{} / {} / {}".format(*game.ai_lod_counts), WHITE, 0))
+        lines.append((f"items {len(game.items_on_ground)}, containers {len(game.containers)}, modals {len(game.modals)}", None, WHITE, 0))
+        lines.append((f"sprites {queue_stats['submitted']}, culled {queue_stats['culled']}, batches {queue_stats['batches']}", None, WHITE, 0))
+        return lines
+
+    def _render(self, game):
+        lines = self._lines(game)
+        line_h = font_small.get_height()
+        height = 10 + len(lines) * line_h + 10 + SPARKLINE_HEIGHT + 10
+        panel = pygame.Surface((OVERLAY_WIDTH, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+
+        y = 10
+        for label, value, color, indent in lines:
+            panel.blit(font_small.render(label, True, color), (10 + indent * 16, y))
+            if value:
+                value_surf = font_small.render(value, True, color)
+                panel.blit(value_surf, value_surf.get_rect(topright=(OVERLAY_WIDTH - 10, y)))
+            y += line_h
+
+        # Sparkline: one column per recorded frame, newest on the right
+        y += 10
+        graph = pygame.Rect(10, y, OVERLAY_WIDTH - 20, SPARKLINE_HEIGHT)
+        pygame.draw.rect(panel, (40, 40, 40, 200), graph)
+        budget_y = graph.bottom - int(graph.height * min(1.0, FRAME_BUDGET_MS / SPARKLINE_MAX_MS))
+        pygame.draw.line(panel, GREEN, (graph.left, budget_y), (graph.right - 1, budget_y))
+        frames = list(game.profiler.frames)[-graph.width:]
+        x = graph.right - len(frames)
+        for frame in frames:
+            work = frame['total'] - frame.get('idle', 0.0)
+            bar_h = max(1, int(graph.height * min(1.0, work / SPARKLINE_MAX_MS)))
+            color = GREEN if work <= FRAME_BUDGET_MS else (YELLOW if work <= FRAME_BUDGET_MS * 2 else RED)
+            pygame.draw.line(panel, color, (x, graph.bottom - 1), (x, graph.bottom - bar_h))
+            x += 1
+        return panel
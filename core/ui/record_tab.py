@@ -1,5 +1,6 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 
 def draw_record_tab(surface, player, modal, assets, mouse_pos):
     y_offset = modal['rect'].y + 80
@@ -47,7 +48,7 @@ def draw_record_tab(surface, player, modal, assets, mouse_pos):
             surface.blit(icon, (x_offset, y_pos))
             label_x = x_offset + 28
         else:
-            text = font.render(f"{name}:", True, WHITE)
+            text = render_text(font, f"{name}:", True, WHITE)
             surface.blit(text, (x_offset, y_pos))
             label_x = x_offset + 110
 
@@ -66,7 +67,7 @@ def draw_record_tab(surface, player, modal, assets, mouse_pos):
             xp = attr_data['xp']
             xp_to_next = attr_data['xp_to_next_level']
             
-            text = font_small.render(f"[{int(level)}]", True, WHITE)
+            text = render_text(font_small, f"[{int(level)}]", True, WHITE)
             surface.blit(text, (label_x, y_pos + 3))
 
             bar_x = label_x + 40
@@ -85,7 +86,7 @@ def draw_record_tab(surface, player, modal, assets, mouse_pos):
 
         else: # Static attribute
             value = attr_data
-            text = font_small.render(f"[{int(value)}]", True, WHITE)
+            text = render_text(font_small, f"[{int(value)}]", True, WHITE)
             surface.blit(text, (label_x, y_pos + 3))
 
             bonus_x_pos = label_x + 45
@@ -98,14 +99,14 @@ def draw_record_tab(surface, player, modal, assets, mouse_pos):
                 bonus_str = f"{bonus_perc:.1f}%" # Will include minus sign
                 bonus_color = (255, 100, 100) # Red
             
-            bonus_surf = font_small.render(bonus_str, True, bonus_color)
+            bonus_surf = render_text(font_small, bonus_str, True, bonus_color)
             surface.blit(bonus_surf, (bonus_x_pos, y_pos + 3))
             
     if tooltip_to_draw:
         text, pos = tooltip_to_draw
         
         # Render the text
-        tip_surf = font_small.render(text, True, BLACK) # Black text
+        tip_surf = render_text(font_small, text, True, BLACK) # Black text
         
         # Create a padded rect for the background
         # Position it 10px above the middle of the bar
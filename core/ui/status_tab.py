@@ -1,15 +1,16 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 
 def draw_status_tab(surface, player, modal, assets, zombies_killed):
     y_offset = modal['rect'].y + 80
     x_offset = modal['rect'].x + 10
 
-    name_text = font.render(f"{player.name}", True, WHITE)
+    name_text = render_text(font, f"{player.name}", True, WHITE)
     surface.blit(name_text, (x_offset, y_offset))
     y_offset += 20
 
-    profession_text = font_small.render(f"Profession: {player.profession}", True, WHITE)
+    profession_text = render_text(font_small, f"Profession: {player.profession}", True, WHITE)
     surface.blit(profession_text, (x_offset, y_offset))
     y_offset += 20
 
@@ -50,11 +51,11 @@ def draw_status_tab(surface, player, modal, assets, zombies_killed):
             surface.blit(icon, (x_offset, y_pos))
             label_x = x_offset + 28
         else:
-            text = font.render(f"{name}:", True, WHITE)
+            text = render_text(font, f"{name}:", True, WHITE)
             surface.blit(text, (x_offset, y_pos))
             label_x = x_offset + 110
 
-        text = font_small.render(f"[{int(value)}%]", True, WHITE)
+        text = render_text(font_small, f"[{int(value)}%]", True, WHITE)
         surface.blit(text, (label_x, y_pos + 3))
 
         bar_x = label_x + 12
@@ -1,5 +1,6 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 from core.ui.modals import BaseModal
 
 class Tabs:
@@ -84,7 +85,7 @@ class Tabs:
                 self.surface.blit(tab['icon'], icon_rect)
             else:
                 # Fallback to text if icon fails to load or not provided
-                text = font_small.render(tab['label'], True, WHITE)
+                text = render_text(font_small, tab['label'], True, WHITE)
                 text_rect = text.get_rect(center=tab_rect.center)
                 self.surface.blit(text, text_rect)
 
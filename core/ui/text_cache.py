@@ -0,0 +1,55 @@
+import pygame
+from collections import OrderedDict
+
+MAX_CACHED_TEXTS = 1024 # Rendered strings kept before the least recently used is dropped
+
+class TextCache:
+    """
+    Keeps rendered text surfaces keyed by (font, text, antialias, color,
+    background), so labels and numbers that do not change are rasterized once
+    instead of every frame. The returned surfaces are shared: blit them, do
+    not draw on them.
+    """
+    def __init__(self, max_size=MAX_CACHED_TEXTS):
+        self.max_size = max_size
+        self.surfaces = OrderedDict() # key -> rendered Surface (LRU order)
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Same arguments as pygame.font.Font.render."""
+        key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+# Shared by everything in core/ui
+TEXT_CACHE = TextCache()
+
+def render_text(font, text, antialias, color, background=None):
+    """Cached font.render, see TextCache."""
+    return TEXT_CACHE.render(font, text, antialias, color, background)
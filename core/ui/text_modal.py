@@ -1,5 +1,6 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 from core.ui.modals import BaseModal
 
 def wrap_text(text, width, font):
@@ -117,7 +118,7 @@ def draw_text_modal(surface, game, modal, assets):
 
         y_pos = 0 - scroll_offset_y
         for line in wrapped_lines:
-            text_surface = font_small.render(line, True, WHITE)
+            text_surface = render_text(font_small, line, True, WHITE)
             draw_pos_in_subsurface = (0, y_pos)
             content_surface.blit(text_surface, draw_pos_in_subsurface)
             y_pos += line_height
@@ -1,5 +1,6 @@
 import pygame
 from data.config import *
+from core.ui.text_cache import render_text
 
 def draw_tooltip(surface, item, pos):
     if not item:
@@ -41,8 +42,7 @@ def draw_tooltip(surface, item, pos):
             lines.append(f"  {attr_name.capitalize()}: +{value:.1f}%")
 
 
-    font = pygame.font.Font(None, 24)
-    rendered_lines = [font_small.render(line, True, WHITE) for line in lines]
+    rendered_lines = [render_text(font_small, line, True, WHITE) for line in lines]
     
     width = max(line.get_width() for line in rendered_lines) + 20
     height = sum(line.get_height() for line in rendered_lines) + 20
@@ -6,50 +6,28 @@ import math
 from data.config import *
 from core.entities.item.item import Item
 from core.entities.zombie.corpse import Corpse
-from core.entities.zombie.zombie import Zombie
+from core.entities.zombie.zombie import Zombie, ZOMBIE_ATTACK_RANGE
 from core.entities.player.player import Player
 from core.placement import find_free_tile
 from core.map.world_layers import check_for_layer_teleport
 from core.map.spawn_manager import spawn_initial_zombies
+from core.sim_clock import SIM_CLOCK
 
 
-def build_zombie_grid(zombies, grid_size):
-    """Sorts all zombies into a spatial grid (dictionary)."""
-    grid = {}
-    for z in zombies:
-        # Get the grid cell coordinates for the zombie's center
-        grid_x = int(z.rect.centerx // grid_size)
-        grid_y = int(z.rect.centery // grid_size)
-        cell = (grid_x, grid_y)
-        
-        # Add the zombie to the list for that cell
-        if cell not in grid:
-            grid[cell] = [z]
-        else:
-            grid[cell].append(z)
-    return grid
-
-
-def get_nearby_zombies(zombie, grid, grid_size):
-    """Gets all zombies from the 9-cell area around a given zombie."""
-    nearby_zombies = []
-    grid_x = int(zombie.rect.centerx // grid_size)
-    grid_y = int(zombie.rect.centery // grid_size)
-    
-    # Loop through the 3x3 grid centered on the zombie
-    for i in range(-1, 2):
-        for j in range(-1, 2):
-            cell = (grid_x + i, grid_y + j)
-            if cell in grid:
-                nearby_zombies.extend(grid[cell])
-                
-    return nearby_zombies
+def update_game_state(game):
+    # Phase timings for the profiler overlay (no-ops unless enabled)
+    profiler = game.profiler
 
+    # Catches game.zombies being replaced or edited without going through the index
+    game.zombie_index.sync(game.zombies)
 
-def update_game_state(game):
-    game.player.update_position(game.obstacles, game.zombies)
+    game.player.update_position(game.collision_grid, game.zombies)
 
     check_for_layer_teleport(game)
+
+    # Only recomputed when the player enters a new tile or a door changed
+    if game.visibility:
+        game.visibility.update(game.player.rect.centerx, game.player.rect.centery)
     
 
     game.hovered_interactable_tile_rect = None # Reset
@@ -58,67 +36,83 @@ def update_game_state(game):
         tile_def = game.map_manager.get_tile_at(facing_x, facing_y)
         if tile_def and tile_def.get('is_statable'):
             game.hovered_interactable_tile_rect = pygame.Rect(facing_x * TILE_SIZE, facing_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+    profiler.mark('update.player')
 
 
     check_zombie_respawn(game)
     check_dynamic_zombie_spawns(game)
+    profiler.mark('update.spawning')
     if game.player.update_stats(game):
         game.game_state = 'GAME_OVER'
-
-    # --- Projectile update logic
-    projectiles_to_remove = []
-    zombies_to_remove = []
-    for p in game.projectiles:
-
-        world_max_x = game.world_min_x + game.map_width_pixels
-        world_max_y = game.world_min_y + game.map_height_pixels
-
-        if p.update(game.world_min_x, game.world_min_y, world_max_x, world_max_y) or any(p.rect.colliderect(ob) for ob in game.obstacles):
-        # if p.update(game.map_width_pixels, game.map_height_pixels) or any(p.rect.colliderect(ob) for ob in game.obstacles):
-        #if p.update() or any(p.rect.colliderect(ob) for ob in game.obstacles):
-            projectiles_to_remove.append(p)
-            continue
-
-        hit_zombie = next((z for z in game.zombies if z not in zombies_to_remove and p.rect.colliderect(z.rect)), None)
-
-        if hit_zombie:
-            if player_hit_zombie(game.player, hit_zombie, game):
-                zombies_to_remove.append(hit_zombie)
-                handle_zombie_death(game, hit_zombie, game.items_on_ground, game.obstacles, game.player.active_weapon)
-                game.zombies_killed += 1
-            projectiles_to_remove.append(p)
-
-    game.projectiles = [p for p in game.projectiles if p not in projectiles_to_remove]
-    game.zombies = [z for z in game.zombies if z not in zombies_to_remove]
-
-    # TILE_SIZE * 3 = 48 * 3 = 144. Let's use 128.
-    GRID_SIZE = 128 
-    
-    # 1. Build the spatial grid *once* per frame
-    zombie_grid = build_zombie_grid(game.zombies, GRID_SIZE)
-
-    zombies_alive = game.zombies[:] # 
-    for zombie in zombies_alive:
-
-        # 2. Get *only* the zombies in the 9-cell area around this zombie
-        nearby_zombies = get_nearby_zombies(zombie, zombie_grid, GRID_SIZE)
-        
-        # 3. Call the AI function, passing the *small list*
-        # This is the N*9 check (O(N)), which is much, much faster.
-        zombie.update_ai(game.player.rect, game.obstacles, nearby_zombies, game) # 
-
-        # 4. Handle attack logic (This is fine, no changes)
-        distance_to_player = math.hypot(game.player.rect.centerx - zombie.rect.centerx, # 
-                                        game.player.rect.centery - zombie.rect.centery) # 
-        if distance_to_player < zombie.attack_range: # 
-            current_time = pygame.time.get_ticks() # 
-            if current_time - zombie.last_attack_time > 500: # 500ms cooldown # 
-                zombie.attack(game.player, game) # 
-                zombie.last_attack_time = current_time
-
-
-
-    now_ms = pygame.time.get_ticks()
+    profiler.mark('update.player')
+
+    # --- Projectiles, swept along their whole step (see ProjectilePool)
+    killed = []
+    def hit_zombie(zombie):
+        if player_hit_zombie(game.player, zombie, game):
+            killed.append(zombie)
+            game.zombie_index.remove(zombie) # Later shots this step fly past it
+            handle_zombie_death(game, zombie, game.items_on_ground, game.obstacles, game.player.active_weapon)
+            game.zombies_killed += 1
+    game.projectiles.update(game, hit_zombie)
+    if killed:
+        killed = set(killed)
+        game.zombies = [z for z in game.zombies if z not in killed]
+    profiler.mark('update.projectiles')
+
+    zombie_index = game.zombie_index
+
+    # Chasing zombies path along this; only rebuilt when the player changes tile or a door toggles
+    game.flow_field.update(game.collision_grid, game.player.rect.centerx, game.player.rect.centery)
+
+    if game.zombie_simulation:
+        # Batch backend: the whole horde in NumPy passes, attacks included
+        game.zombie_simulation.update(game)
+    else:
+        # AI level of detail: near zombies think every frame, mid-range ones on
+        # every Nth frame (moving N frames' worth), far ones only wander cheaply
+        player_x, player_y = game.player.rect.center
+        near_sq = ZOMBIE_LOD_NEAR_RADIUS * ZOMBIE_LOD_NEAR_RADIUS
+        far_sq = ZOMBIE_LOD_FAR_RADIUS * ZOMBIE_LOD_FAR_RADIUS
+        game.ai_frame += 1
+        ai_frame = game.ai_frame
+        near_count = mid_count = far_count = 0
+
+        zombies_alive = game.zombies[:] # 
+        for zombie in zombies_alive:
+            dist_sq = (zombie.rect.centerx - player_x) ** 2 + (zombie.rect.centery - player_y) ** 2
+            if dist_sq < near_sq:
+                near_count += 1
+                # Only the zombies in the 3x3 index cells around this one can block it
+                zombie.update_ai(game.player.rect, game.collision_grid, zombie_index.neighbours(zombie), game)
+            elif dist_sq < far_sq:
+                mid_count += 1
+                if (zombie.ai_slot + ai_frame) % ZOMBIE_LOD_MID_BUCKETS:
+                    continue
+                zombie.update_ai(game.player.rect, game.collision_grid, zombie_index.neighbours(zombie), game,
+                                 step_scale=ZOMBIE_LOD_MID_BUCKETS)
+            else:
+                far_count += 1
+                if (zombie.ai_slot + ai_frame) % ZOMBIE_LOD_FAR_BUCKETS:
+                    continue
+                zombie.update_far(game.collision_grid, ZOMBIE_LOD_FAR_BUCKETS)
+            zombie_index.move(zombie)
+        game.ai_lod_counts = (near_count, mid_count, far_count)
+
+        # Attacks: only the zombies within reach of the player
+        current_time = SIM_CLOCK.get_ticks()
+        for zombie in zombie_index.query_radius(game.player.rect.centerx, game.player.rect.centery, ZOMBIE_ATTACK_RANGE):
+            distance_to_player = math.hypot(game.player.rect.centerx - zombie.rect.centerx,
+                                            game.player.rect.centery - zombie.rect.centery)
+            if distance_to_player < zombie.attack_range:
+                if current_time - zombie.last_attack_time > 500: # 500ms cooldown
+                    zombie.attack(game.player, game)
+                    zombie.last_attack_time = current_time
+
+    profiler.mark('update.zombie_ai')
+
+
+    now_ms = SIM_CLOCK.get_ticks()
     for ground_item in list(game.items_on_ground):
         if isinstance(ground_item, Corpse): # Check specifically for Corpse objects
             if ground_item.is_expired(now_ms):
@@ -127,6 +121,7 @@ def update_game_state(game):
                     # Optional: Spill items before removing corpse
                     # ground_item.spill_contents_to_ground(game.items_on_ground)
                     game.items_on_ground.remove(ground_item)
+                    game.ui_version += 1 # May have been in the nearby modal
                 except ValueError:
                     pass # Already removed, ignore
 
@@ -145,6 +140,8 @@ def update_game_state(game):
                     game.modals.remove(modal)
                     print(f"Closed {container_item.name} because you moved away.")
 
+    profiler.mark('update.other')
+
 def player_hit_zombie(player, zombie, game):
     progression = player.progression
     active_weapon = player.active_weapon
@@ -198,6 +195,7 @@ def handle_zombie_death(game, zombie, items_on_ground_list, obstacles, weapon):
     # append corpse to world items (it behaves like an item on ground)
     if find_free_tile(corpse.rect, obstacles, items_on_ground_list, initial_pos=zombie.rect.topleft):
         items_on_ground_list.append(corpse)
+        game.ui_version += 1 # May show up in the nearby modal
 
     if zombie.sound_dead:
         game.sound_manager.play_sound(zombie.sound_dead, subdir='zombie', game=game, source_pos=zombie.rect.center)
@@ -207,7 +205,7 @@ def handle_zombie_death(game, zombie, items_on_ground_list, obstacles, weapon):
     # Record killed zombie in map state
     current_map_filename = game.map_manager.current_map_filename
     if current_map_filename not in game.map_states:
-        game.map_states[current_map_filename] = {'items': [], 'zombies': [], 'killed_zombies': [], 'picked_up_items': [], 'last_respawn_time': pygame.time.get_ticks()} # Ensure lists exist
+        game.map_states[current_map_filename] = {'items': [], 'zombies': [], 'killed_zombies': [], 'picked_up_items': [], 'last_respawn_time': SIM_CLOCK.get_ticks()} # Ensure lists exist
     game.map_states[current_map_filename].setdefault('killed_zombies', []).append(zombie.id) # Use setdefault
 
 def check_dynamic_zombie_spawns(game):
@@ -281,6 +279,8 @@ def check_dynamic_zombie_spawns(game):
             
             if new_zombies:
                 game.zombies.extend(new_zombies)
+                for zombie in new_zombies:
+                    game.zombie_index.add(zombie)
                 entities_to_avoid.extend(new_zombies) 
                 game.layer_zombies[game.current_layer_index] = game.zombies[:]
                 
@@ -293,7 +293,7 @@ def check_zombie_respawn(game):
     - If timer is 0, it will only do the initial spawn (once per map).
     - If timer > 0, it will do the initial spawn AND respawn on the timer.
     """
-    current_time = pygame.time.get_ticks()
+    current_time = SIM_CLOCK.get_ticks()
     current_map = game.map_manager.current_map_filename
     
     zombie_spawns = game.current_zombie_spawns
@@ -82,6 +82,17 @@ START_ZOOM = float(system_config.find('zoom_start').get('value'))
 FAR_ZOOM = float(system_config.find('zoom_far').get('value'))
 NEAR_ZOOM = float(system_config.find('zoom_near').get('value'))
 
+# Lighting quality: the light mask is built at 1/N of the view size and upscaled once
+lighting_resolution_node = system_config.find('lighting_resolution')
+LIGHTING_RESOLUTION = int(lighting_resolution_node.get('value')) if lighting_resolution_node is not None else 1
+if LIGHTING_RESOLUTION not in (1, 2, 4):
+    print(f"Warning: lighting_resolution must be 1, 2 or 4 (got {LIGHTING_RESOLUTION}). Using 1.")
+    LIGHTING_RESOLUTION = 1
+
+# Lighting backend: 'blit' (one additive blit per light) or 'numpy' (see core/render/numpy_lighting.py)
+lighting_backend_node = system_config.find('lighting_backend')
+LIGHTING_BACKEND = lighting_backend_node.get('value').lower() if lighting_backend_node is not None else 'blit'
+
 # Player settings
 player_config = root.find('player')
 
@@ -95,6 +106,10 @@ AUTO_DRINK = player_config.find('water_autodrink').get('value')
 AUTO_DRINK_THRESHOLD = int(player_config.find('water_threshold').get('value'))
 BASE_PLAYER_VIEW_RADIUS = int(player_config.find('view_radius').get('value')) * TILE_SIZE
 PLAYER_FOW_RADIUS = int(player_config.find('fow_radius').get('value'))
+visibility_radius_node = player_config.find('visibility_radius')
+VISIBILITY_RADIUS_TILES = int(visibility_radius_node.get('value')) if visibility_radius_node is not None else 16
+occluded_shade_node = player_config.find('occluded_shade')
+OCCLUDED_SHADE = int(occluded_shade_node.get('value')) if occluded_shade_node is not None else 90
 START_HOUR = int(player_config.find('start_hour').get('value'))
 DAY_NIGHT_CYCLE_MS = int(player_config.find('day_night_cycle').get('value'))
 TRANSITION_DURATION_MS = int(player_config.find('day_night_cycle_transition').get('value'))
@@ -114,6 +129,18 @@ ZOMBIES_PER_SPAWN = int(zombie_config.find('spawn').get('value'))
 ZOMBIE_RESPAWN_TIMER_MS = int(zombie_config.find('respawn_timer').get('value'))
 ZOMBIE_DETECTION_RADIUS = 100
 ZOMBIE_INFECTION_CHANCE = float(zombie_config.find('infection_chance').get('value'))
+# AI level of detail, see update_game_state; older configs lack these nodes
+lod_near_node = zombie_config.find('lod_near')
+ZOMBIE_LOD_NEAR_RADIUS = (int(lod_near_node.get('value')) if lod_near_node is not None else 12) * TILE_SIZE
+lod_far_node = zombie_config.find('lod_far')
+ZOMBIE_LOD_FAR_RADIUS = (int(lod_far_node.get('value')) if lod_far_node is not None else 32) * TILE_SIZE
+lod_mid_buckets_node = zombie_config.find('lod_mid_buckets')
+ZOMBIE_LOD_MID_BUCKETS = max(1, int(lod_mid_buckets_node.get('value'))) if lod_mid_buckets_node is not None else 4
+lod_far_buckets_node = zombie_config.find('lod_far_buckets')
+ZOMBIE_LOD_FAR_BUCKETS = max(1, int(lod_far_buckets_node.get('value'))) if lod_far_buckets_node is not None else 16
+# Zombie AI backend: 'python' (update_ai per zombie) or 'numpy' (see core/entities/zombie/numpy_horde.py)
+ai_backend_node = zombie_config.find('ai_backend')
+ZOMBIE_AI_BACKEND = ai_backend_node.get('value').lower() if ai_backend_node is not None else 'python'
 
 # Durability settings
 durability_config = root.find('durability')